@@ -0,0 +1,39 @@
+# Методы оптимизации функций одной и нескольких переменных.
+# Имена и подпакеты one_variable, several_variables загружаются при первом
+# обращении, поэтому "import optimization" не тянет NumPy.
+from importlib import import_module
+
+_EXPORTS = {
+    "Number": ".custom_types",
+    "NumericalMethod": ".custom_types",
+    "OptimizationResult": ".custom_types",
+    "CONVERGED": ".custom_types",
+    "NOT_CONVERGED": ".custom_types",
+    "BUDGET_EXHAUSTED": ".custom_types",
+    "Budget": ".cached_function",
+    "BudgetExhausted": ".cached_function",
+    "CachedFunction": ".cached_function",
+    "Stepper": ".stepper",
+    "minimize_scalar": ".dispatch",
+    "minimize": ".dispatch",
+    "CostModel": ".dispatch",
+}
+
+_SUBPACKAGES = ("one_variable", "several_variables")
+
+__all__ = [*_EXPORTS, *_SUBPACKAGES]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+    elif name in _SUBPACKAGES:
+        value = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,218 @@
+from collections import OrderedDict
+from .custom_types import BUDGET_EXHAUSTED, Number, NumericalMethod, OptimizationResult
+from time import perf_counter
+
+
+class BudgetExhausted(Exception):
+    """
+    Исчерпан лимит вычислений или времени (см. Budget).
+    """
+
+
+class Budget:
+    """
+    Общий лимит вычислений и времени работы метода.
+
+    Бюджет передаётся всем обёрткам CachedFunction, которые использует метод
+    (функции и её производным), и учитывает фактические вычисления всех обёрток
+    вместе. Когда следующее вычисление превысило бы max_evals или истекло время
+    deadline, обёртка выбрасывает BudgetExhausted, не вызывая функцию. Обёртка
+    с observe = True сообщает бюджету вычисленные значения, и он запоминает лучшую
+    точку, чтобы метод мог вернуть её при остановке.
+
+    Атрибуты:\n
+        max_evals (int | None): Максимальное количество вычислений.\n
+        deadline (float | None): Момент (по perf_counter), после которого вычисления запрещены.\n
+        evaluations (int): Количество учтённых вычислений.\n
+        best_x, best_y: Лучшая из вычисленных точек и значение в ней (None, если их нет).\n
+
+    Примеры:
+    >>> budget = Budget(max_evals=2)
+    >>> f = CachedFunction(lambda x: (x - 3) ** 2, budget=budget, observe=True)
+    >>> f(1), f(2)
+    (4, 1)
+    >>> f(3)
+    Traceback (most recent call last):
+    ...
+    optimization.cached_function.BudgetExhausted: Исчерпан лимит вычислений функции.
+    >>> print(budget.best_x, budget.best_y)
+    2 1
+    """
+
+    __slots__ = ("max_evals", "deadline", "evaluations", "best_x", "best_y")
+
+    def __init__(self, max_evals: int | None = None, deadline: float | None = None) -> None:
+        if max_evals is not None and max_evals <= 0:
+            raise ValueError("Параметр max_evals должен быть положительным.")
+        if deadline is not None and deadline <= 0:
+            raise ValueError("Параметр deadline должен быть положительным.")
+        self.max_evals = max_evals
+        self.deadline = None if deadline is None else perf_counter() + deadline
+        self.evaluations = 0
+        self.best_x = None
+        self.best_y = None
+
+    @classmethod
+    def create(cls, max_evals: int | None, deadline: float | None) -> "Budget | None":
+        """
+        Создаёт бюджет по параметрам метода или возвращает None, если лимиты не заданы.
+
+        Параметры:\n
+            max_evals (int | None): Максимальное количество вычислений.\n
+            deadline (float | None): Ограничение времени работы в секундах от текущего момента.\n
+        """
+        if max_evals is None and deadline is None:
+            return None
+        return cls(max_evals, deadline)
+
+    def check_time(self) -> None:
+        if self.deadline is not None and perf_counter() > self.deadline:
+            raise BudgetExhausted("Истекло время работы метода.")
+
+    def charge(self, n: int = 1) -> None:
+        """
+        Учитывает n вычислений или выбрасывает BudgetExhausted, если они не укладываются в лимиты.
+        """
+        if self.max_evals is not None and self.evaluations + n > self.max_evals:
+            raise BudgetExhausted("Исчерпан лимит вычислений функции.")
+        self.check_time()
+        self.evaluations += n
+
+    def observe(self, x, y) -> None:
+        """
+        Запоминает точку, если значение в ней меньше лучшего найденного.
+        Для массивов точек берётся наименьшее значение, для результата
+        derivatives (f, f', f'') — значение f.
+        """
+        if isinstance(y, tuple):
+            y = y[0]
+        if getattr(y, "ndim", 0) > 0:
+            # Массив значений возможен только при работе с NumPy, поэтому он
+            # импортируется здесь, а не при загрузке модуля
+            import numpy as np
+
+            i = int(np.argmin(y))
+            x, y = np.broadcast_to(x, np.shape(y))[i], y[i]
+        if self.best_y is None or y < self.best_y:
+            self.best_x, self.best_y = x, y
+
+    def result(self, x=None, y=None, **fields) -> OptimizationResult:
+        """
+        Результат метода, остановленного из-за исчерпания бюджета: лучшая из
+        вычисленных точек (или x, y, если точки не запоминались) с converged=False
+        и status=BUDGET_EXHAUSTED. Остальные поля передаются в OptimizationResult.
+        """
+        if self.best_y is not None:
+            x, y = self.best_x, self.best_y
+        return OptimizationResult(x, y, converged=False, status=BUDGET_EXHAUSTED, **fields)
+
+
+class CachedFunction:
+    """
+    Обёртка над целевой функцией с ограниченным LRU-кэшем и счётчиками вызовов.
+
+    Значения кэшируются по точному значению аргумента, поэтому повторный вызов
+    в той же точке не приводит к повторному вычислению функции. Аргументы, которые
+    нельзя использовать как ключ (например, массивы NumPy), передаются в функцию
+    напрямую и учитываются в счётчике вычислений по числу элементов.
+
+    Атрибуты:\n
+        fn (NumericalMethod): Исходная функция.\n
+        maxsize (int | None): Максимальный размер кэша (None — без ограничения, 0 — без кэша).\n
+        calls (int): Общее количество обращений к обёртке.\n
+        hits (int): Количество обращений, обслуженных из кэша.\n
+        evaluations (int): Количество фактических вычислений исходной функции.\n
+        budget (Budget | None): Общий лимит вычислений и времени.\n
+        observe (bool): Сообщать ли бюджету вычисленные значения (для целевой функции).\n
+
+    Примеры:
+    >>> f = CachedFunction(lambda x: (x - 3) ** 2)
+    >>> f(1), f(1), f(2)
+    (4, 4, 1)
+    >>> print(f.calls, f.hits, f.evaluations)
+    3 1 2
+    """
+
+    __slots__ = ("fn", "maxsize", "calls", "hits", "evaluations", "budget", "observe", "_cache")
+
+    def __init__(
+        self,
+        fn: NumericalMethod,
+        maxsize: int | None = 1024,
+        budget: Budget | None = None,
+        observe: bool = False,
+    ) -> None:
+        self.fn = fn
+        self.maxsize = maxsize
+        self.budget = budget
+        self.observe = observe and budget is not None
+        self.calls = 0
+        self.hits = 0
+        self.evaluations = 0
+        self._cache = OrderedDict()
+
+    def __call__(self, x: Number) -> Number:
+        self.calls += 1
+        cache = self._cache
+        try:
+            y = cache[x]
+        except KeyError:
+            pass
+        except TypeError:
+            size = getattr(x, "size", 1)
+            if self.budget is not None:
+                self.budget.charge(size)
+            self.evaluations += size
+            y = self.fn(x)
+            if self.observe:
+                self.budget.observe(x, y)
+            return y
+        else:
+            if self.budget is not None:
+                self.budget.check_time()
+            self.hits += 1
+            cache.move_to_end(x)
+            return y
+
+        if self.budget is not None:
+            self.budget.charge()
+        y = self.fn(x)
+        self.evaluations += 1
+        if self.observe:
+            self.budget.observe(x, y)
+        if self.maxsize != 0:
+            cache[x] = y
+            if self.maxsize is not None and len(cache) > self.maxsize:
+                cache.popitem(last=False)
+        return y
+
+    def reset(self) -> None:
+        """
+        Очищает кэш и обнуляет счётчики.
+        """
+        self._cache.clear()
+        self.calls = self.hits = self.evaluations = 0
+
+
+def budgeted(fn: NumericalMethod, budget: Budget | None, observe: bool = False) -> NumericalMethod:
+    """
+    Оборачивает fn в CachedFunction с бюджетом budget, если он задан, иначе возвращает
+    fn без изменений: без лимитов методы сами считают вызовы, и обёртка не замедляет
+    вычисление дешёвых функций.
+    """
+    if budget is None:
+        return fn
+    return CachedFunction(fn, budget=budget, observe=observe)
+
+
+def evaluations(fn: NumericalMethod, calls: int) -> int:
+    """
+    Возвращает количество вычислений функции: счётчик обёртки (CachedFunction или
+    функции из derivative_functions) или calls — количество вызовов, подсчитанное
+    методом, если fn не обёрнута (см. budgeted).
+
+    Примеры:
+    >>> evaluations(CachedFunction(abs), 5), evaluations(abs, 5)
+    (0, 5)
+    """
+    return getattr(fn, "evaluations", calls)
@@ -0,0 +1,516 @@
+import argparse
+import ast
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import lru_cache
+from importlib import import_module
+from itertools import islice
+from math import e, inf, isfinite, pi
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+# Имена, доступные в выражениях. Функции берутся из hyper_dual, поэтому они
+# работают с числами, массивами NumPy и гипердуальными числами, и методы с
+# производными могут вычислять их автоматически.
+FUNCTION_NAMES = (
+    "exp", "log", "sqrt", "sin", "cos", "tan", "arctan", "atan", "sinh", "cosh", "tanh",
+)
+CONSTANTS = {"pi": pi, "e": e, "inf": inf}
+
+_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant, ast.Name, ast.Load, ast.Call,
+    ast.Subscript, ast.List, ast.Tuple, ast.Slice,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.USub, ast.UAdd,
+)
+# Элементы, допустимые в индексах x[i] и срезах x[i:j]
+_INDEX_NODES = (ast.Constant, ast.UnaryOp, ast.USub, ast.UAdd, ast.Slice, ast.Tuple, ast.Load)
+
+# Ограничение времени решения одной задачи в секундах по умолчанию
+DEFAULT_DEADLINE = 60.0
+
+# Количество выражений, для которых модель стоимости метода "auto" хранит измерения
+MODEL_SIZE = 1024
+
+# Способ вызова каждого метода, доступного по имени: порядок аргументов
+# (см. _run). Методы загружаются лениво из one_variable и several_variables.
+METHODS = {
+    "dichotomy": "interval",
+    "fibonacci": "interval",
+    "golden_ratio": "interval",
+    "split_interval": "interval",
+    "bit_search": "interval",
+    "brent": "interval",
+    "parabolic_approximation": "interval",
+    "chord": "interval_1st",
+    "midpoint": "interval_1st",
+    "secant": "interval_1st",
+    "tangent": "interval_1st",
+    "itp": "interval_1st",
+    "illinois": "interval_1st",
+    "bracketed_secant": "interval_1st",
+    "safeguarded_newton": "interval_2nd",
+    "newton": "point_2nd",
+    "newton_raphson": "point_2nd",
+    "marquardt": "point_2nd",
+    "broken_line": "lipschitz",
+    "uniform_brute_force": "lipschitz",
+    "adaptive_broken_line": "global",
+    "hooke_jeeves": "several",
+    "lbfgs": "several",
+    "conjugate_gradient_method": "several",
+    "newton_method": "several",
+}
+
+# Ошибки, сообщение которых записывается в результат задачи как есть. Остальные
+# исключения задачи записываются вместе с именем их типа; ни одно из них не
+# останавливает обработку потока
+JOB_ERRORS = (ValueError, TypeError, ZeroDivisionError, OverflowError)
+
+RESULT_FIELDS = (
+    "x", "y", "n", "n_fn", "n_d_fn", "n_f_2nd", "a", "b", "converged", "status", "time", "info",
+)
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(expression: str) -> Callable:
+    """
+    Компилирует выражение от переменной x в функцию.
+
+    В выражении допустимы числа, арифметические операции, индексы x[i] (для
+    функций нескольких переменных), списки (для градиента и матрицы Гессе),
+    константы pi, e, inf и функции exp, log, sqrt, sin, cos, tan, arctan, atan,
+    sinh, cosh, tanh и abs. Другие имена, атрибуты и вызовы запрещены, поэтому
+    выражения из входного потока не могут выполнить произвольный код. Целые числа,
+    кроме индексов, вычисляются как float: возведение целых чисел в степень
+    (например, 9 ** 9 ** 9 ** 9) может не завершиться, а для float переполнение
+    сразу даёт OverflowError. Скомпилированные функции кэшируются по тексту выражения.
+
+    Параметры:\n
+        expression (str): Выражение, например "(x - 3) ** 2 - 2".\n
+
+    Возвращает:\n
+        Callable: Функция fn(x).
+
+    Исключения:\n
+        ValueError: Если выражение содержит синтаксическую ошибку или недопустимые элементы.
+
+    Примеры:
+    >>> fn = compile_expression("(x[0] - 1) ** 2 + exp(x[1])")
+    >>> print(fn([3, 0]))
+    5.0
+    >>> compile_expression("__import__('os')")
+    Traceback (most recent call last):
+    ...
+    ValueError: Недопустимое выражение: __import__('os')
+    >>> compile_expression("x + 9 ** 9 ** 9 ** 9")(1)
+    Traceback (most recent call last):
+    ...
+    OverflowError: (34, 'Numerical result out of range')
+    """
+    hyper_dual = import_module(".one_variable.hyper_dual", __package__)
+    names = {name: getattr(hyper_dual, name) for name in FUNCTION_NAMES}
+    names["abs"] = abs
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError:
+        raise ValueError(f"Недопустимое выражение: {expression}") from None
+    indices = set()
+    for node in ast.walk(tree):
+        allowed = isinstance(node, _NODES)
+        if isinstance(node, ast.Subscript):
+            index = list(ast.walk(node.slice))
+            allowed = all(isinstance(item, _INDEX_NODES) for item in index)
+            indices.update(item for item in index if isinstance(item, ast.Constant))
+        elif isinstance(node, ast.Name):
+            allowed = node.id == "x" or node.id in names or node.id in CONSTANTS
+        elif isinstance(node, ast.Call):
+            allowed = isinstance(node.func, ast.Name) and node.func.id in names and not node.keywords
+        elif isinstance(node, ast.Constant):
+            allowed = isinstance(node.value, (int, float)) and not isinstance(node.value, bool)
+        if not allowed:
+            raise ValueError(f"Недопустимое выражение: {expression}")
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, int) and node not in indices:
+            try:
+                node.value = float(node.value)
+            except OverflowError:
+                raise ValueError(f"Недопустимое выражение: {expression}") from None
+    body = ast.Lambda(
+        args=ast.arguments(
+            posonlyargs=[], args=[ast.arg("x")], kwonlyargs=[], kw_defaults=[], defaults=[]
+        ),
+        body=tree.body,
+    )
+    code = compile(ast.fix_missing_locations(ast.Expression(body)), "<expression>", "eval")
+    return eval(code, {"__builtins__": {}, **names, **CONSTANTS})
+
+
+@lru_cache(maxsize=1)
+def _cost_model():
+    # Модель стоимости для method = "auto", своя в каждом процессе. Ключом служит
+    # текст выражения, поэтому модель ограничена MODEL_SIZE ключами, а общая
+    # модель dispatch.default_model не растёт от потока задач
+    dispatch = import_module(".dispatch", __package__)
+    return dispatch.CostModel(maxsize=MODEL_SIZE)
+
+
+def _array_function(expression: str | None) -> Callable | None:
+    # Градиент и матрица Гессе задаются списками и возвращаются массивами NumPy
+    if expression is None:
+        return None
+    import numpy as np
+
+    fn = compile_expression(expression)
+    return lambda x: np.asarray(fn(x), dtype=float)
+
+
+def _to_json(value: Any) -> Any:
+    # Массивы и числа NumPy, а также прочие объекты из info
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+def _finite_json(result: Dict[str, Any]) -> Dict[str, Any]:
+    # JSON не допускает NaN и бесконечностей: они заменяются на None, а имена
+    # полей, в которых они встретились, записываются в поле non_finite
+    non_finite = []
+
+    def replace(value: Any, field: str) -> Any:
+        if isinstance(value, dict):
+            return {key: replace(item, field) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [replace(item, field) for item in value]
+        if hasattr(value, "tolist"):
+            return replace(value.tolist(), field)
+        if isinstance(value, float) and not isfinite(value):
+            if field not in non_finite:
+                non_finite.append(field)
+            return None
+        return value
+
+    result = {field: replace(value, field) for field, value in result.items()}
+    if non_finite:
+        result["non_finite"] = non_finite
+    return result
+
+
+def run_job(spec: Dict[str, Any], deadline: float | None = DEFAULT_DEADLINE) -> Dict[str, Any]:
+    """
+    Решает одну задачу оптимизации, заданную словарём, и возвращает результат в
+    виде словаря для записи в JSON.
+
+    Время решения ограничено deadline секундами: методы одной переменной получают
+    его в параметре deadline, а для методов нескольких переменных время проверяется
+    при каждом вычислении функции, градиента и матрицы Гессе.
+
+    Поля задачи:\n
+        id: Идентификатор, который копируется в результат.\n
+        method (str): Имя метода из METHODS или "auto" (по умолчанию) — выбор метода
+                      функциями minimize_scalar и minimize с ключом, равным выражению,
+                      и моделью стоимости на MODEL_SIZE выражений.\n
+        expression (str): Минимизируемая функция от x (см. compile_expression).\n
+        derivative, second_derivative (str): Производные для функций одной переменной.
+                                             Если они не заданы, методы с производными
+                                             вычисляют их с помощью гипердуальных чисел.\n
+        gradient, hessian (str): Градиент и матрица Гессе для функций нескольких переменных.\n
+        interval ([a, b]): Интервал поиска для функций одной переменной.\n
+        x0 (Number | List[Number]): Начальное приближение: число для методов newton,
+                                    newton_raphson и marquardt, список для функций
+                                    нескольких переменных.\n
+        eps (Number): Точность, по умолчанию 1e-6.\n
+        L (Number): Константа Липшица для метода ломаных и равномерного перебора.\n
+        max_evals: Лимит вычислений для методов одной переменной.\n
+        deadline: Ограничение времени в секундах (не больше общего ограничения deadline).\n
+        options (dict): Дополнительные именованные параметры метода.\n
+
+    Параметры:\n
+        spec (Dict[str, Any]): Задача.\n
+        deadline (float | None): Ограничение времени решения в секундах. None — без ограничения.\n
+
+    Возвращает:\n
+        Dict[str, Any]: id, method и поля OptimizationResult или id и error, если
+                        задача некорректна или метод завершился ошибкой.
+
+    Примеры:
+    >>> result = run_job({"id": 1, "method": "golden_ratio", "expression": "(x - 3) ** 2",
+    ...                   "interval": [0, 5], "eps": 1e-6})
+    >>> print(result["id"], result["method"], round(result["x"], 5), result["converged"])
+    1 golden_ratio 3.0 True
+    >>> run_job({"id": 2, "method": "golden_ratio", "expression": "x +", "interval": [0, 5]})
+    {'id': 2, 'error': 'Недопустимое выражение: x +'}
+    >>> run_job({"id": 3, "method": "hooke_jeeves", "expression": "x[2]", "x0": [0, 0]})
+    {'id': 3, 'error': 'IndexError: index 2 is out of bounds for axis 0 with size 2'}
+    """
+    try:
+        return {"id": spec.get("id"), **_run(spec, deadline)}
+    except KeyError as error:
+        return {"id": spec.get("id"), "error": f"Не задано поле {error.args[0]}."}
+    except JOB_ERRORS as error:
+        return {"id": spec.get("id"), "error": str(error)}
+    except Exception as error:
+        return {"id": spec.get("id"), "error": f"{type(error).__name__}: {error}"}
+
+
+def _run(spec: Dict[str, Any], deadline: float | None) -> Dict[str, Any]:
+    method = spec.get("method", "auto")
+    expression = spec["expression"]
+    fn = compile_expression(expression)
+    eps = spec.get("eps", 1e-6)
+    options = dict(spec.get("options", {}))
+    limits = {name: spec[name] for name in ("max_evals", "deadline") if name in spec}
+    if deadline is not None:
+        limits["deadline"] = min(limits.get("deadline", deadline), deadline)
+    d_fn, f_2nd = (
+        compile_expression(spec[name]) if name in spec else None
+        for name in ("derivative", "second_derivative")
+    )
+
+    if method == "auto":
+        dispatch = import_module(".dispatch", __package__)
+        if "interval" in spec:
+            a, b = spec["interval"]
+            res = dispatch.minimize_scalar(
+                fn, a, b, eps, d_fn=d_fn, f_2nd=f_2nd, L=spec.get("L"),
+                key=expression, model=_cost_model(), **limits, **options,
+            )
+        else:
+            check = _time_limit(limits.get("deadline"))
+            res = dispatch.minimize(
+                check(fn), spec["x0"], check(_array_function(spec.get("gradient"))),
+                check(_array_function(spec.get("hessian"))), eps, key=expression,
+                model=_cost_model(), **options,
+            )
+        method = res.info["method"]
+    elif method not in METHODS:
+        raise ValueError(f"Неизвестный метод: {method}.")
+    else:
+        kind = METHODS[method]
+        package = ".several_variables" if kind == "several" else ".one_variable"
+        minimize_fn = getattr(import_module(package, __package__), method)
+        if kind == "several":
+            res = _run_several(
+                method, minimize_fn, fn, spec, eps, options, _time_limit(limits.get("deadline"))
+            )
+        elif kind == "point_2nd":
+            res = minimize_fn(fn, d_fn, f_2nd, spec["x0"], eps, **limits, **options)
+        else:
+            a, b = spec["interval"]
+            if kind == "interval":
+                res = minimize_fn(fn, a, b, eps, **limits, **options)
+            elif kind == "interval_1st":
+                res = minimize_fn(fn, d_fn, a, b, eps, **limits, **options)
+            elif kind == "interval_2nd":
+                res = minimize_fn(fn, d_fn, f_2nd, a, b, eps, **limits, **options)
+            elif kind == "lipschitz":
+                res = minimize_fn(fn, (a, b), spec["L"], eps, **limits, **options)
+            else:
+                res = minimize_fn(fn, (a, b), eps, L=spec.get("L"), **limits, **options)
+
+    result = {"method": method}
+    for field in RESULT_FIELDS:
+        result[field] = getattr(res, field)
+    return result
+
+
+def _time_limit(deadline: float | None) -> Callable[[Callable | None], Callable | None]:
+    # Методы нескольких переменных не поддерживают deadline, поэтому их функции
+    # оборачиваются в CachedFunction с общим бюджетом времени: когда время
+    # истекает, очередное вычисление выбрасывает BudgetExhausted
+    if deadline is None:
+        return lambda fn: fn
+    cached_function = import_module(".cached_function", __package__)
+    budget = cached_function.Budget(deadline=deadline)
+    return lambda fn: None if fn is None else cached_function.CachedFunction(fn, budget=budget)
+
+
+def _run_several(method, minimize_fn, fn, spec, eps, options, check):
+    # Методы нескольких переменных не поддерживают max_evals
+    import numpy as np
+
+    x0 = np.asarray(spec["x0"], dtype=float)
+    fn = check(fn)
+    grad_f = check(_array_function(spec.get("gradient")))
+    if method == "hooke_jeeves":
+        return minimize_fn(x0, options.pop("h0", 1.0), eps, fn=fn, **options)
+    if grad_f is None:
+        raise ValueError(f"Для метода {method} необходимо задать gradient.")
+    if method == "newton_method":
+        hessian = check(_array_function(spec.get("hessian")))
+        if hessian is None:
+            raise ValueError("Для метода newton_method необходимо задать hessian.")
+        return minimize_fn(fn, grad_f, hessian, x0, eps, eps, options.pop("M", 1000), **options)
+    return minimize_fn(fn, grad_f, x0, epsilon=eps, **options)
+
+
+def run_chunk(lines: List[str], deadline: float | None = DEFAULT_DEADLINE) -> List[str]:
+    """
+    Решает задачи из строк JSON Lines и возвращает строки с результатами.
+    Строка, которая не является объектом JSON, даёт результат с полем error.
+    Время решения каждой задачи ограничено deadline секундами (см. run_job).
+    NaN и бесконечности записываются как null, а имена полей, в которых они
+    встретились, — в поле non_finite, поэтому результат всегда является
+    корректным JSON.
+
+    Примеры:
+    >>> line = '{"id": 1, "method": "golden_ratio", "expression": "x - inf", "interval": [0, 1]}'
+    >>> result = json.loads(run_chunk([line])[0])
+    >>> print(result["y"], result["non_finite"])
+    None ['y']
+    """
+    output = []
+    for line in lines:
+        try:
+            spec = json.loads(line)
+            if not isinstance(spec, dict):
+                raise ValueError("Задача должна быть объектом JSON.")
+        except ValueError as error:
+            result = {"id": None, "error": f"Некорректная задача: {error}"}
+        else:
+            result = run_job(spec, deadline)
+        output.append(
+            json.dumps(_finite_json(result), ensure_ascii=False, allow_nan=False, default=_to_json)
+        )
+    return output
+
+
+def _chunks(lines: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    # Пустые строки пропускаются; строки читаются по мере обработки
+    lines = (line for line in lines if line.strip())
+    while chunk := list(islice(lines, chunk_size)):
+        yield chunk
+
+
+def run_stream(
+    lines: Iterable[str],
+    executor: Executor | None = None,
+    chunk_size: int = 64,
+    max_in_flight: int = 8,
+    ordered: bool = True,
+    deadline: float | None = DEFAULT_DEADLINE,
+) -> Iterator[str]:
+    """
+    Решает поток задач в формате JSON Lines и по мере готовности выдаёт строки
+    с результатами.
+
+    Строки группируются в пакеты по chunk_size, и каждый пакет решается одной
+    задачей executor (run_chunk), чтобы накладные расходы на передачу задач
+    процессам не превышали время решения маленьких задач. Одновременно в работе
+    находится не больше max_in_flight пакетов: следующий пакет читается из lines
+    только после того, как готов один из отправленных, поэтому в памяти хранится
+    не больше chunk_size * max_in_flight задач независимо от длины потока.
+
+    Параметры:\n
+        lines (Iterable[str]): Строки с задачами (см. run_job).\n
+        executor (Executor | None): Пул, в котором решаются пакеты. None — решать в
+                                    текущем потоке.\n
+        chunk_size (int): Количество задач в пакете.\n
+        max_in_flight (int): Максимальное количество одновременно решаемых пакетов.\n
+        ordered (bool): Выдавать результаты в порядке задач. Иначе результаты
+                        выдаются по мере готовности пакетов, и медленный пакет не
+                        задерживает остальные.\n
+        deadline (float | None): Ограничение времени решения одной задачи в секундах.
+                                 None — без ограничения.\n
+
+    Возвращает:\n
+        Iterator[str]: Строки JSON с результатами (без перевода строки).
+
+    Исключения:\n
+        ValueError: Если chunk_size или max_in_flight не положительны.
+
+    Примеры:
+    >>> lines = ['{"id": 1, "expression": "(x - 1) ** 2", "interval": [0, 3]}', "[]"]
+    >>> for line in run_stream(lines):
+    ...     result = json.loads(line)
+    ...     print(result["id"], result.get("method"), result.get("error"))
+    1 brent None
+    None None Некорректная задача: Задача должна быть объектом JSON.
+    """
+    if chunk_size <= 0:
+        raise ValueError("Параметр chunk_size должен быть положительным.")
+    if max_in_flight <= 0:
+        raise ValueError("Параметр max_in_flight должен быть положительным.")
+    chunks = _chunks(lines, chunk_size)
+    if executor is None:
+        for chunk in chunks:
+            yield from run_chunk(chunk, deadline)
+        return
+
+    pending = deque()
+    for chunk in chunks:
+        if len(pending) >= max_in_flight:
+            if ordered:
+                yield from pending.popleft().result()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield from future.result()
+        pending.append(executor.submit(run_chunk, chunk, deadline))
+    while pending:
+        yield from pending.popleft().result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Решение потока задач оптимизации в формате JSON Lines."
+    )
+    parser.add_argument(
+        "input", nargs="?", default="-", help="Файл с задачами (по умолчанию stdin)."
+    )
+    parser.add_argument("-o", "--output", default="-", help="Файл результатов (по умолчанию stdout).")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="Количество рабочих процессов или потоков; 0 — решать в текущем потоке.",
+    )
+    parser.add_argument("--executor", choices=("process", "thread"), default="process")
+    parser.add_argument("--chunk-size", type=int, default=64, help="Количество задач в пакете.")
+    parser.add_argument(
+        "--max-in-flight", type=int, default=None,
+        help="Максимальное количество пакетов в работе (по умолчанию 2 * workers).",
+    )
+    parser.add_argument(
+        "--unordered", action="store_true", help="Выводить результаты по мере готовности."
+    )
+    parser.add_argument(
+        "--deadline", type=float, default=DEFAULT_DEADLINE,
+        help=f"Ограничение времени решения одной задачи в секундах (по умолчанию {DEFAULT_DEADLINE:g}); "
+        "0 — без ограничения.",
+    )
+    args = parser.parse_args(argv)
+    if args.workers < 0:
+        parser.error("--workers не может быть отрицательным")
+    if args.chunk_size <= 0:
+        parser.error("--chunk-size должен быть положительным")
+    if args.max_in_flight is not None and args.max_in_flight <= 0:
+        parser.error("--max-in-flight должен быть положительным")
+    if args.deadline < 0:
+        parser.error("--deadline не может быть отрицательным")
+    max_in_flight = args.max_in_flight or 2 * max(args.workers, 1)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    executor = None
+    if args.workers:
+        pool = ProcessPoolExecutor if args.executor == "process" else ThreadPoolExecutor
+        executor = pool(args.workers)
+    try:
+        for line in run_stream(
+            source, executor, args.chunk_size, max_in_flight, not args.unordered,
+            args.deadline or None,
+        ):
+            target.write(line + "\n")
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+from typing import Any, Callable, Dict
+
+Number = int | float
+NumericalMethod = Callable[[Number], Number]
+
+# Причины остановки метода (OptimizationResult.status)
+CONVERGED = "converged"
+NOT_CONVERGED = "not_converged"
+BUDGET_EXHAUSTED = "budget_exhausted"
+
+
+class OptimizationResult:
+    """
+    Результат работы метода оптимизации.
+
+    Атрибуты:\n
+        x: Значение аргумента, при котором достигается минимум.\n
+        y: Значение функции в точке минимума.\n
+        n (int): Количество итераций.\n
+        n_fn (int): Количество вычислений целевой функции.\n
+        n_d_fn (int): Количество вычислений первой производной (градиента).\n
+        n_f_2nd (int): Количество вычислений второй производной (гессиана).\n
+        a: Левая граница итогового интервала неопределённости (None, если его нет).\n
+        b: Правая граница итогового интервала неопределённости (None, если его нет).\n
+        converged (bool): Достигнута ли заданная точность.\n
+        status (str): Причина остановки: CONVERGED, NOT_CONVERGED (например, исчерпан
+                      лимит итераций) или BUDGET_EXHAUSTED (исчерпан лимит вычислений
+                      или времени). По умолчанию определяется по converged.\n
+        time (float): Время работы метода в секундах.\n
+        info (Dict[str, Any]): Дополнительные сведения, специфичные для метода.\n
+
+    Для совместимости со словарями поля доступны и по ключу: result['x'].
+
+    Примеры:
+    >>> result = OptimizationResult(3.0, 0.0, n=10, n_fn=12)
+    >>> print(result['x'], result.n_fn)
+    3.0 12
+    """
+
+    __slots__ = (
+        "x", "y", "n", "n_fn", "n_d_fn", "n_f_2nd", "a", "b", "converged", "status", "time",
+        "info",
+    )
+
+    def __init__(
+        self,
+        x: Any,
+        y: Any,
+        n: int = 0,
+        n_fn: int = 0,
+        n_d_fn: int = 0,
+        n_f_2nd: int = 0,
+        a: Any = None,
+        b: Any = None,
+        converged: bool = True,
+        status: str | None = None,
+        time: float = 0.0,
+        info: Dict[str, Any] | None = None,
+    ) -> None:
+        self.x = x
+        self.y = y
+        self.n = n
+        self.n_fn = n_fn
+        self.n_d_fn = n_d_fn
+        self.n_f_2nd = n_f_2nd
+        self.a = a
+        self.b = b
+        self.converged = converged
+        if status is None:
+            status = CONVERGED if converged else NOT_CONVERGED
+        self.status = status
+        self.time = time
+        self.info = info if info is not None else {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__slots__:
+            return getattr(self, key)
+        return self.info[key]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Возвращает результат в виде словаря (поля info добавляются на верхний уровень).
+        """
+        res = {key: getattr(self, key) for key in self.__slots__ if key != "info"}
+        res.update(self.info)
+        return res
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.as_dict().items())
+        return f"OptimizationResult({fields})"
+
+
+OptimizationFnReturnValue = OptimizationResult
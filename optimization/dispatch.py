@@ -0,0 +1,459 @@
+from collections import OrderedDict
+from .custom_types import CONVERGED, NOT_CONVERGED, Number, NumericalMethod, OptimizationResult
+from importlib import import_module
+from importlib.util import find_spec
+from math import ceil, inf, isfinite, log, log2
+from time import perf_counter
+from typing import Any, Callable, Dict, Hashable
+
+GOLDEN = (1 + 5**0.5) / 2
+
+# Порядок производной, вычисляемой функцией каждой роли. Пока стоимость роли не
+# измерена, она оценивается как стоимость fn, умноженная на n^порядок
+# (градиент — n значений, матрица Гессе — n^2).
+ROLES = {"fn": 0, "d_fn": 1, "f_2nd": 2}
+
+# Количество итераций ITP сверх деления пополам (параметр n_0 метода itp)
+ITP_EXTRA_STEPS = 8
+
+
+class TimedFunction:
+    """
+    Обёртка, измеряющая время вызовов функции.
+
+    Атрибуты:\n
+        fn (Callable): Исходная функция.\n
+        calls (int): Количество вызовов.\n
+        seconds (float): Суммарное время вызовов в секундах.\n
+    """
+
+    __slots__ = ("fn", "calls", "seconds")
+
+    def __init__(self, fn: Callable) -> None:
+        self.fn = fn
+        self.calls = 0
+        self.seconds = 0.0
+
+    def __call__(self, x):
+        start = perf_counter()
+        y = self.fn(x)
+        self.seconds += perf_counter() - start
+        self.calls += 1
+        return y
+
+
+class CostModel:
+    """
+    Модель стоимости методов для выбора в minimize_scalar и minimize.
+
+    Для каждого ключа целевой функции модель хранит измеренное время одного
+    вычисления функции и её производных и время работы каждого из опробованных
+    методов. По ним предсказывается стоимость ещё не опробованных методов
+    (количество вычислений по оценке метода, умноженное на стоимость вычисления),
+    а из опробованных выбирается самый быстрый. Пока для ключа есть не опробованные
+    методы, выбирается самый дешёвый из них по предсказанию, поэтому повторные
+    вызовы с одним ключом сначала пробуют все подходящие методы, а затем
+    используют самый быстрый из тех, чей результат не хуже лучшего найденного
+    значения функции более чем на tolerance (быстрый, но неверный результат
+    глобального поиска не должен закреплять метод за ключом). Если задан maxsize, модель хранит измерения не
+    больше чем для maxsize ключей и забывает ключи, которые дольше всех не
+    использовались.
+
+    Атрибуты:\n
+        maxsize (int | None): Максимальное количество ключей (None — без ограничения).\n
+        costs (Dict[Hashable, Dict[str, float]]): Время одного вычисления fn, d_fn и f_2nd по ключам.\n
+        timings (Dict[Hashable, Dict[str, Tuple[int, float]]]): Количество запусков и суммарное
+                                                             время работы методов по ключам.\n
+        values (Dict[Hashable, Dict[str, float]]): Наименьшее найденное каждым методом значение
+                                                   функции по ключам.\n
+
+    Примеры:
+    >>> model = CostModel()
+    >>> model.choose("f", {"golden_ratio": 30.0, "brent": 30.0})
+    'golden_ratio'
+    >>> model.record("f", "golden_ratio", 2e-4)
+    >>> model.choose("f", {"golden_ratio": 30.0, "brent": 30.0})
+    'brent'
+    >>> model.record("f", "brent", 1e-4)
+    >>> model.choose("f", {"golden_ratio": 30.0, "brent": 30.0})
+    'brent'
+    >>> model.record("g", "broken_line", 2e-3, y=-1.0)
+    >>> model.record("g", "adaptive_broken_line", 1e-4, y=0.0)
+    >>> model.choose("g", {"broken_line": 30.0, "adaptive_broken_line": 30.0}, tolerance=1e-3)
+    'broken_line'
+    >>> model = CostModel(maxsize=1)
+    >>> model.record("f", "brent", 1e-4)
+    >>> model.record("g", "brent", 1e-4)
+    >>> list(model.timings)
+    ['g']
+    """
+
+    __slots__ = ("costs", "timings", "values", "maxsize", "_keys")
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        if maxsize is not None and maxsize <= 0:
+            raise ValueError("Параметр maxsize должен быть положительным.")
+        self.costs = {}
+        self.timings = {}
+        self.values = {}
+        self.maxsize = maxsize
+        self._keys = OrderedDict()
+
+    def _use(self, key: Hashable) -> None:
+        # Отмечает ключ как использованный последним и забывает измерения самых
+        # давно использованных ключей сверх maxsize
+        if self.maxsize is None:
+            return
+        keys = self._keys
+        keys[key] = None
+        keys.move_to_end(key)
+        while len(keys) > self.maxsize:
+            old, _ = keys.popitem(last=False)
+            self.costs.pop(old, None)
+            self.timings.pop(old, None)
+            self.values.pop(old, None)
+
+    def cost(self, key: Hashable, role: str, n: int = 1) -> float:
+        """
+        Возвращает время одного вычисления функции роли role ("fn", "d_fn" или "f_2nd")
+        для ключа key. Не измеренная стоимость fn принимается равной 1, производных —
+        стоимости fn, умноженной на n^порядок производной.
+        """
+        costs = self.costs.get(key, {})
+        if role in costs:
+            return costs[role]
+        return costs.get("fn", 1.0) * n ** ROLES[role]
+
+    def predict(self, key: Hashable, counts: Dict[str, Number], n: int = 1) -> float:
+        """
+        Предсказывает стоимость метода по количеству вычислений каждой роли.
+        """
+        return sum(count * self.cost(key, role, n) for role, count in counts.items())
+
+    def observe(self, key: Hashable, role: str, timed: TimedFunction) -> None:
+        """
+        Запоминает среднее время вызова функции роли role, измеренное обёрткой timed.
+        """
+        if timed.calls:
+            self._use(key)
+            self.costs.setdefault(key, {})[role] = timed.seconds / timed.calls
+
+    def record(self, key: Hashable, method: str, seconds: float, y: Number | None = None) -> None:
+        """
+        Учитывает запуск метода method для ключа key, занявший seconds секунд и
+        нашедший значение функции y (None — значение неизвестно).
+        """
+        self._use(key)
+        runs, total = self.timings.setdefault(key, {}).get(method, (0, 0.0))
+        self.timings[key][method] = (runs + 1, total + seconds)
+        if y is not None:
+            values = self.values.setdefault(key, {})
+            values[method] = min(values.get(method, inf), float(y))
+
+    def mean_time(self, key: Hashable, method: str) -> float | None:
+        """
+        Возвращает среднее время работы метода для ключа или None, если он не запускался.
+        """
+        runs, total = self.timings.get(key, {}).get(method, (0, 0.0))
+        return total / runs if runs else None
+
+    def choose(
+        self, key: Hashable | None, predicted: Dict[str, float], tolerance: Number = 0.0
+    ) -> str:
+        """
+        Выбирает метод из predicted (имя метода -> предсказанная стоимость).
+
+        Без ключа выбирается метод с наименьшей предсказанной стоимостью. Для ключа
+        сначала по очереди выбираются не опробованные методы (от дешёвых к дорогим),
+        затем — метод с наименьшим средним временем работы среди тех, чьё значение
+        функции не больше лучшего значения плюс tolerance. При равенстве выигрывает
+        метод, стоящий в predicted раньше.
+        """
+        if key is not None:
+            if key in self._keys:
+                self._use(key)
+            untried = [method for method in predicted if self.mean_time(key, method) is None]
+            if not untried:
+                values = self.values.get(key, {})
+                best = min((values[method] for method in predicted if method in values), default=inf)
+                accurate = [
+                    method for method in predicted if values.get(method, best) <= best + tolerance
+                ]
+                return min(accurate, key=lambda method: self.mean_time(key, method))
+            predicted = {method: predicted[method] for method in untried}
+        return min(predicted, key=predicted.get)
+
+    def clear(self) -> None:
+        """
+        Забывает все измерения.
+        """
+        self.costs.clear()
+        self.timings.clear()
+        self.values.clear()
+        self._keys.clear()
+
+
+# Модель, которую minimize_scalar и minimize используют по умолчанию
+default_model = CostModel()
+
+
+def _dispatch(
+    methods: Dict[str, Dict[str, Number]],
+    functions: Dict[str, Callable | None],
+    run: Callable[[str, Dict[str, Callable]], OptimizationResult],
+    key: Hashable | None,
+    model: CostModel | None,
+    tolerance: Number,
+    n: int = 1,
+) -> OptimizationResult:
+    # Общая часть minimize_scalar и minimize: выбор метода, измерение стоимости
+    # ещё не измеренных функций и запись времени работы и найденного значения
+    model = default_model if model is None else model
+    predicted = {method: model.predict(key, counts, n) for method, counts in methods.items()}
+    method = model.choose(key, predicted, tolerance)
+
+    timed = {}
+    if key is not None:
+        known = model.costs.get(key, {})
+        timed = {
+            role: TimedFunction(fn)
+            for role, fn in functions.items()
+            if callable(fn) and role not in known
+        }
+    res = run(method, {**functions, **timed})
+
+    if key is not None:
+        for role, fn in timed.items():
+            model.observe(key, role, fn)
+        # Остановка по бюджету ничего не говорит о методе, а несошедшийся метод
+        # не должен выбираться как самый быстрый
+        if res.status == CONVERGED:
+            model.record(key, method, res.time, res.y if isfinite(res.y) else None)
+        elif res.status == NOT_CONVERGED:
+            model.record(key, method, inf)
+    res.info["method"] = method
+    res.info["candidates"] = predicted
+    return res
+
+
+def minimize_scalar(
+    fn: NumericalMethod,
+    a: Number,
+    b: Number,
+    eps: Number,
+    d_fn: NumericalMethod | None = None,
+    f_2nd: NumericalMethod | None = None,
+    L: Number | None = None,
+    unimodal: bool = True,
+    key: Hashable | None = None,
+    model: CostModel | None = None,
+    max_evals: int | None = None,
+    deadline: float | None = None,
+) -> OptimizationResult:
+    """
+    Находит минимум функции одной переменной на интервале [a, b], выбирая метод
+    по переданным данным и модели стоимости (см. CostModel).
+
+    Для унимодальной функции кандидатами являются brent и golden_ratio, при заданной
+    производной — itp, при заданных первой и второй производных — safeguarded_newton.
+    Для многоэкстремальной функции (unimodal=False) используются метод ломаных
+    broken_line (если задана константа Липшица L) и adaptive_broken_line.
+    Стоимость кандидата предсказывается по гарантированному количеству вычислений:
+    для golden_ratio и brent — log((b - a) / eps) / log(phi), для itp —
+    log2((b - a) / eps) + 8 вычислений производной, для safeguarded_newton —
+    2 * log2((b - a) / eps) вычислений первой и второй производных, для методов
+    ломаных — L * (b - a) / (2 * eps), а без L для adaptive_broken_line —
+    log2((b - a) / eps), как для поиска одного минимума.
+
+    Если задан ключ key, при первом вызове с ним измеряется время вычисления fn и
+    производных, а время работы выбранного метода и найденное значение функции
+    записываются в модель. Следующие вызовы с тем же ключом пробуют остальных
+    кандидатов, а когда все они опробованы, используют самого быстрого из тех,
+    чьё значение функции не больше лучшего найденного плюс eps. Без ключа метод
+    выбирается только по предсказанию.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        a (Number): Левая граница интервала, в котором ищется минимум.\n
+        b (Number): Правая граница интервала, в котором ищется минимум.\n
+        eps (Number): Точность поиска.\n
+        d_fn (NumericalMethod | None): Первая производная функции.\n
+        f_2nd (NumericalMethod | None): Вторая производная функции (учитывается только вместе с d_fn).\n
+        L (Number | None): Константа Липшица функции на [a, b].\n
+        unimodal (bool): Унимодальна ли функция на [a, b].\n
+        key (Hashable | None): Ключ целевой функции, под которым модель запоминает измерения.\n
+        model (CostModel | None): Модель стоимости. По умолчанию — общая модель default_model.\n
+        max_evals (int | None): Максимальное количество вычислений функции и производных.\n
+        deadline (float | None): Ограничение времени работы в секундах.\n
+
+    Возвращает:\n
+        OptimizationResult: Результат выбранного метода.
+                            Поле info['method'] — имя выбранного метода.
+                            Поле info['candidates'] — предсказанная стоимость каждого кандидата.
+                            Остальные поля описаны в OptimizationResult и в выбранном методе.
+
+    Исключения:\n
+        ValueError: Если eps <= 0 или a >= b.
+
+    Примеры:
+    >>> def f(x):
+    ...     return (x - 3) ** 2 - 2
+    >>> model = CostModel()
+    >>> result = minimize_scalar(f, 0, 5, 10**-6, model=model)
+    >>> print(round(result.x, 5), result.info["method"])
+    3.0 brent
+    >>> d_f = lambda x: 2 * (x - 3)
+    >>> [minimize_scalar(f, 0, 5, 10**-6, d_fn=d_f, key="f", model=model).info["method"]
+    ...  for _ in range(3)]
+    ['itp', 'brent', 'golden_ratio']
+    >>> fastest = min(model.timings["f"], key=lambda method: model.mean_time("f", method))
+    >>> minimize_scalar(f, 0, 5, 10**-6, d_fn=d_f, key="f", model=model).info["method"] == fastest
+    True
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+    if a >= b:
+        raise ValueError("Левая граница интервала должна быть меньше правой.")
+
+    ratio = max((b - a) / eps, 1)
+    golden_steps = ceil(log(ratio) / log(GOLDEN)) + 1
+    bisection_steps = ceil(log2(ratio))
+    if unimodal:
+        methods = {"brent": {"fn": golden_steps}, "golden_ratio": {"fn": golden_steps}}
+        if d_fn is not None:
+            methods["itp"] = {"fn": 1, "d_fn": bisection_steps + ITP_EXTRA_STEPS}
+            if f_2nd is not None:
+                methods["safeguarded_newton"] = {
+                    "fn": 1, "d_fn": 2 * bisection_steps, "f_2nd": 2 * bisection_steps,
+                }
+    else:
+        global_steps = ceil(L * (b - a) / (2 * eps)) if L is not None else bisection_steps
+        methods = {"adaptive_broken_line": {"fn": global_steps}}
+        if L is not None:
+            methods = {"broken_line": {"fn": global_steps}, **methods}
+
+    limits = {"max_evals": max_evals, "deadline": deadline}
+
+    def run(method: str, functions: Dict[str, Callable]) -> OptimizationResult:
+        minimize_fn = getattr(import_module(".one_variable", __package__), method)
+        f, f_1st, f_2nd = functions["fn"], functions["d_fn"], functions["f_2nd"]
+        if method == "itp":
+            return minimize_fn(f, f_1st, a, b, eps, n_0=ITP_EXTRA_STEPS, **limits)
+        if method == "safeguarded_newton":
+            return minimize_fn(f, f_1st, f_2nd, a, b, eps, **limits)
+        if method == "broken_line":
+            return minimize_fn(f, (a, b), L, eps, **limits)
+        if method == "adaptive_broken_line":
+            # Без L: с ней adaptive_broken_line для сравнения запускает ещё и broken_line
+            return minimize_fn(f, (a, b), eps, **limits)
+        return minimize_fn(f, a, b, eps, **limits)
+
+    return _dispatch(methods, {"fn": fn, "d_fn": d_fn, "f_2nd": f_2nd}, run, key, model, eps)
+
+
+def minimize(
+    f: Callable,
+    x0,
+    grad_f: Callable | None = None,
+    hessian: Any = None,
+    eps: Number = 1e-5,
+    h0: Number = 1.0,
+    max_iter: int = 1000,
+    key: Hashable | None = None,
+    model: CostModel | None = None,
+) -> OptimizationResult:
+    """
+    Находит минимум функции нескольких переменных, выбирая метод по переданным
+    данным, размерности и модели стоимости (см. CostModel и minimize_scalar).
+
+    Кандидатами являются hooke_jeeves, при заданном градиенте — lbfgs и
+    conjugate_gradient_method (если установлен SciPy), при заданных градиенте и
+    матрице Гессе — newton_method. Количество итераций заранее неизвестно, поэтому
+    стоимость кандидата предсказывается по вычислениям за одну итерацию: 4n + 1
+    значений f для hooke_jeeves, 2 значения f и градиент для lbfgs, 10 значений f
+    и градиент для conjugate_gradient_method (одномерный поиск), значение f,
+    градиент и матрица Гессе для newton_method. Пока время вычисления градиента и
+    матрицы Гессе не измерено, оно принимается в n и n^2 раз большим, чем у f.
+    Дальше ключ key работает так же, как в minimize_scalar.
+
+    Параметры:\n
+        f (Callable): Функция, для которой необходимо найти минимум.\n
+        x0: Начальное приближение.\n
+        grad_f (Callable | None): Градиент функции.\n
+        hessian: Матрица Гессе или функция, возвращающая её (см. newton_method).\n
+        eps (Number): Точность поиска.\n
+        h0 (Number): Начальный шаг метода Хука-Дживса.\n
+        max_iter (int): Максимальное количество итераций градиентных методов.\n
+        key (Hashable | None): Ключ целевой функции, под которым модель запоминает измерения.\n
+        model (CostModel | None): Модель стоимости. По умолчанию — общая модель default_model.\n
+
+    Возвращает:\n
+        OptimizationResult: Результат выбранного метода.
+                            Поле info['method'] — имя выбранного метода.
+                            Поле info['candidates'] — предсказанная стоимость итерации каждого кандидата.
+                            Остальные поля описаны в OptimizationResult и в выбранном методе.
+
+    Исключения:\n
+        ValueError: Если eps <= 0 или x0 — число, а не список координат.
+
+    Примеры:
+    >>> import numpy as np
+    >>> def f(x):
+    ...     return (x[0] - 2 * x[1]) ** 2 + (x[1] - 9) ** 2
+    >>> def grad_f(x):
+    ...     return np.array([2 * (x[0] - 2 * x[1]), -4 * (x[0] - 2 * x[1]) + 2 * (x[1] - 9)])
+    >>> result = minimize(f, [0.0, 0.0], grad_f, model=CostModel())
+    >>> print(np.round(result.x, 4), result.info["method"])
+    [18.  9.] lbfgs
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+
+    try:
+        n = len(x0)
+    except TypeError:
+        raise ValueError(
+            "Начальное приближение x0 должно быть списком координат; для функций одной "
+            "переменной используйте minimize_scalar."
+        ) from None
+    methods = {"hooke_jeeves": {"fn": 4 * n + 1}}
+    if grad_f is not None:
+        methods["lbfgs"] = {"fn": 2, "d_fn": 1}
+        if find_spec("scipy") is not None:
+            methods["conjugate_gradient_method"] = {"fn": 10, "d_fn": 1}
+        if hessian is not None:
+            methods["newton_method"] = {"fn": 1, "d_fn": 1, "f_2nd": 1 if callable(hessian) else 0}
+
+    def run(method: str, functions: Dict[str, Callable]) -> OptimizationResult:
+        minimize_fn = getattr(import_module(".several_variables", __package__), method)
+        fn, grad, hess = functions["fn"], functions["d_fn"], functions["f_2nd"]
+        if method == "hooke_jeeves":
+            return minimize_fn(x0, h0, eps, fn=fn)
+        if method == "lbfgs":
+            return minimize_fn(fn, grad, x0, epsilon=eps, max_iter=max_iter)
+        if method == "conjugate_gradient_method":
+            return minimize_fn(fn, grad, x0, epsilon=eps, max_iter=max_iter)
+        return minimize_fn(fn, grad, hess, x0, eps, eps, max_iter)
+
+    return _dispatch(methods, {"fn": f, "d_fn": grad_f, "f_2nd": hessian}, run, key, model, eps, n)
+
+
+if __name__ == "__main__":
+    from math import exp
+
+    # Повторная минимизация одной и той же функции: первые вызовы пробуют всех
+    # кандидатов, дальше используется самый быстрый
+    def f(x):
+        return x**2 - x + exp(-x)
+
+    def d_f(x):
+        return 2 * x - 1 - exp(-x)
+
+    def f_2nd(x):
+        return 2 + exp(-x)
+
+    for _ in range(6):
+        res = minimize_scalar(f, -0.5, 1.5, 1e-8, d_fn=d_f, f_2nd=f_2nd, key="demo_exp")
+        print(f"{res.info['method']}: x: {res.x:.8f}, время: {res.time * 1e6:.1f} мкс")
+    for method in res.info["candidates"]:
+        print(f"  {method}: среднее время {default_model.mean_time('demo_exp', method) * 1e6:.1f} мкс")
@@ -0,0 +1,86 @@
+# Методы минимизации функций одной переменной.
+# Имена загружаются лениво: модуль с методом импортируется при первом обращении,
+# поэтому методы не требуют NumPy при импорте. Гипердуальные числа вычисляют
+# функции от чисел через math и подключают NumPy только для массивов.
+from importlib import import_module
+
+_EXPORTS = {
+    # Методы нулевого порядка
+    "bit_search": ".zero_order_methods.bit_search",
+    "BitSearchStepper": ".zero_order_methods.bit_search",
+    "brent": ".zero_order_methods.brent",
+    "BrentStepper": ".zero_order_methods.brent",
+    "broken_line": ".zero_order_methods.broken_line",
+    "adaptive_broken_line": ".zero_order_methods.broken_line",
+    "BrokenLineStepper": ".zero_order_methods.broken_line",
+    "AdaptiveBrokenLineStepper": ".zero_order_methods.broken_line",
+    "brute_forse": ".zero_order_methods.brute_force",
+    "dichotomy": ".zero_order_methods.dichotomy",
+    "DichotomyStepper": ".zero_order_methods.dichotomy",
+    "fibonacci": ".zero_order_methods.fibonacci",
+    "FibonacciStepper": ".zero_order_methods.fibonacci",
+    "golden_ratio": ".zero_order_methods.golden_ratio",
+    "GoldenRatioStepper": ".zero_order_methods.golden_ratio",
+    "grid_search": ".zero_order_methods.grid_search",
+    "refine_grid_search": ".zero_order_methods.grid_search",
+    "GridSearchStepper": ".zero_order_methods.grid_search",
+    "lipschitz_constant": ".zero_order_methods.lipschitz_constant",
+    "parabolic_approximation": ".zero_order_methods.parabolic_approximation",
+    "ParabolicApproximationStepper": ".zero_order_methods.parabolic_approximation",
+    "split_interval": ".zero_order_methods.split_interval",
+    "SplitIntervalStepper": ".zero_order_methods.split_interval",
+    "uniform_brute_force": ".zero_order_methods.uniform_brute_force",
+    "batched_dichotomy": ".zero_order_methods.batched",
+    "batched_golden_ratio": ".zero_order_methods.batched",
+    "batched_fibonacci": ".zero_order_methods.batched",
+    "AsyncFunction": ".zero_order_methods.asynchronous",
+    "async_dichotomy": ".zero_order_methods.asynchronous",
+    "async_split_interval": ".zero_order_methods.asynchronous",
+    "async_golden_ratio": ".zero_order_methods.asynchronous",
+    "async_uniform_brute_force": ".zero_order_methods.asynchronous",
+    "parallel_interval_search": ".zero_order_methods.parallel_search",
+    "compiled_search": ".zero_order_methods.compiled",
+    "kernel_search": ".zero_order_methods.compiled",
+    # Методы первого порядка
+    "chord": ".first_order_methods.chord",
+    "ChordStepper": ".first_order_methods.chord",
+    "midpoint": ".first_order_methods.midpoint",
+    "MidpointStepper": ".first_order_methods.midpoint",
+    "secant": ".first_order_methods.secant",
+    "SecantStepper": ".first_order_methods.secant",
+    "tangent": ".first_order_methods.tangent",
+    "TangentStepper": ".first_order_methods.tangent",
+    "itp": ".first_order_methods.bracketing",
+    "ITPStepper": ".first_order_methods.bracketing",
+    "illinois": ".first_order_methods.bracketing",
+    "IllinoisStepper": ".first_order_methods.bracketing",
+    "bracketed_secant": ".first_order_methods.bracketing",
+    "BracketedSecantStepper": ".first_order_methods.bracketing",
+    # Методы второго порядка
+    "marquardt": ".second_order_methods.marquardt",
+    "MarquardtStepper": ".second_order_methods.marquardt",
+    "newton": ".second_order_methods.newton",
+    "NewtonStepper": ".second_order_methods.newton",
+    "newton_raphson": ".second_order_methods.newton_raphson",
+    "NewtonRaphsonStepper": ".second_order_methods.newton_raphson",
+    "safeguarded_newton": ".second_order_methods.safeguarded_newton",
+    "SafeguardedNewtonStepper": ".second_order_methods.safeguarded_newton",
+    # Гипердуальные числа
+    "HyperDual": ".hyper_dual",
+    "derivatives": ".hyper_dual",
+    "derivative_functions": ".hyper_dual",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,285 @@
+import argparse
+import csv
+import json
+import sys
+from math import cos, exp, sin
+from time import perf_counter
+
+from .zero_order_methods.bit_search import bit_search
+from .zero_order_methods.brent import brent
+from .zero_order_methods.broken_line import broken_line
+from .first_order_methods.chord import chord
+from .zero_order_methods.dichotomy import dichotomy
+from .zero_order_methods.fibonacci import fibonacci
+from .zero_order_methods.golden_ratio import golden_ratio
+from .second_order_methods.marquardt import marquardt
+from .first_order_methods.midpoint import midpoint
+from .second_order_methods.newton import newton
+from .second_order_methods.newton_raphson import newton_raphson
+from .zero_order_methods.parabolic_approximation import parabolic_approximation
+from .first_order_methods.secant import secant
+from .zero_order_methods.split_interval import split_interval
+from .first_order_methods.tangent import tangent
+
+# Тестовые функции: интервал, производные, оценка константы Липшица и известные
+# точки глобального минимума. kind — "unimodal" или "multimodal", convex — можно ли
+# запускать методы второго порядка из середины интервала. L = None исключает
+# метод ломаных (у quartic плоский минимум, и при малых eps он требует миллионы вызовов).
+FUNCTIONS = {
+    "demo_rational": {
+        "fn": lambda x: x**2 - 2 * x + 16 / (x - 1) - 13,
+        "d_fn": lambda x: 2 * x - 2 - 16 / (x - 1) ** 2,
+        "f_2nd": lambda x: 2 + 32 / (x - 1) ** 3,
+        "interval": (2, 5),
+        "L": 14,
+        "x_min": (3.0,),
+        "y_min": -2.0,
+        "kind": "unimodal",
+        "convex": True,
+    },
+    "demo_exp": {
+        "fn": lambda x: x**2 - x + exp(-x),
+        "d_fn": lambda x: 2 * x - 1 - exp(-x),
+        "f_2nd": lambda x: 2 + exp(-x),
+        "interval": (-0.5, 1.5),
+        "L": 3.7,
+        "x_min": (0.7388350311316078,),
+        "y_min": 0.28471223435885157,
+        "kind": "unimodal",
+        "convex": True,
+    },
+    "demo_cos": {
+        "fn": lambda x: cos(x) / x**2,
+        "d_fn": lambda x: -sin(x) / x**2 - 2 * cos(x) / x**3,
+        "f_2nd": lambda x: -cos(x) / x**2 + 4 * sin(x) / x**3 + 6 * cos(x) / x**4,
+        "interval": (9, 11),
+        "L": 0.016,
+        "x_min": (9.210964399893285,),
+        "y_min": -0.011518238410254797,
+        "kind": "unimodal",
+        "convex": False,
+    },
+    "square": {
+        "fn": lambda x: (x - 2) ** 2,
+        "d_fn": lambda x: 2 * (x - 2),
+        "f_2nd": lambda x: 2,
+        "interval": (0, 5),
+        "L": 6,
+        "x_min": (2.0,),
+        "y_min": 0.0,
+        "kind": "unimodal",
+        "convex": True,
+    },
+    "quartic": {
+        "fn": lambda x: (x - 1) ** 4,
+        "d_fn": lambda x: 4 * (x - 1) ** 3,
+        "f_2nd": lambda x: 12 * (x - 1) ** 2,
+        "interval": (-1, 4),
+        "L": None,
+        "x_min": (1.0,),
+        "y_min": 0.0,
+        "kind": "unimodal",
+        "convex": True,
+    },
+    "exp_linear": {
+        "fn": lambda x: exp(x) - 2 * x,
+        "d_fn": lambda x: exp(x) - 2,
+        "f_2nd": lambda x: exp(x),
+        "interval": (0, 2),
+        "L": 5.4,
+        "x_min": (0.6931471805599453,),
+        "y_min": 0.6137056388801094,
+        "kind": "unimodal",
+        "convex": True,
+    },
+    "sin_sum": {
+        "fn": lambda x: sin(x) + sin(10 * x / 3),
+        "d_fn": lambda x: cos(x) + 10 / 3 * cos(10 * x / 3),
+        "f_2nd": lambda x: -sin(x) - 100 / 9 * sin(10 * x / 3),
+        "interval": (2.7, 7.5),
+        "L": 4.4,
+        "x_min": (5.145735290768028,),
+        "y_min": -1.8995993491521133,
+        "kind": "multimodal",
+        "convex": False,
+    },
+    "shubert": {
+        "fn": lambda x: -sum(k * sin((k + 1) * x + k) for k in range(1, 6)),
+        "d_fn": lambda x: -sum(k * (k + 1) * cos((k + 1) * x + k) for k in range(1, 6)),
+        "f_2nd": lambda x: sum(k * (k + 1) ** 2 * sin((k + 1) * x + k) for k in range(1, 6)),
+        "interval": (-10, 10),
+        "L": 70,
+        "x_min": (-6.7745761445287185, -0.49139083561332625, 5.791794513224658),
+        "y_min": -12.031249442167136,
+        "kind": "multimodal",
+        "convex": False,
+    },
+}
+
+# Методы: функция запуска на задаче и требование к задаче ("any" — любая,
+# "unimodal" и "convex" — для методов, которые на остальных могут не сойтись,
+# "lipschitz" — задана константа Липшица).
+METHODS = {
+    "dichotomy": (lambda p, eps: dichotomy(p["fn"], *p["interval"], eps), "any"),
+    "golden_ratio": (lambda p, eps: golden_ratio(p["fn"], *p["interval"], eps), "any"),
+    "fibonacci": (lambda p, eps: fibonacci(p["fn"], *p["interval"], eps), "any"),
+    "split_interval": (lambda p, eps: split_interval(p["fn"], *p["interval"], eps), "any"),
+    "bit_search": (lambda p, eps: bit_search(p["fn"], *p["interval"], eps), "any"),
+    "brent": (lambda p, eps: brent(p["fn"], *p["interval"], eps), "any"),
+    "parabolic_approximation": (
+        lambda p, eps: parabolic_approximation(p["fn"], *p["interval"], eps),
+        "any",
+    ),
+    "broken_line": (
+        lambda p, eps: broken_line(p["fn"], p["interval"], p["L"], eps), "lipschitz"
+    ),
+    "chord": (lambda p, eps: chord(p["fn"], p["d_fn"], *p["interval"], eps), "any"),
+    "midpoint": (lambda p, eps: midpoint(p["fn"], p["d_fn"], *p["interval"], eps), "any"),
+    "tangent": (
+        lambda p, eps: tangent(p["fn"], p["d_fn"], *p["interval"], eps), "unimodal"
+    ),
+    "secant": (lambda p, eps: secant(p["fn"], p["d_fn"], *p["interval"], eps), "convex"),
+    "newton": (
+        lambda p, eps: newton(p["fn"], p["d_fn"], p["f_2nd"], sum(p["interval"]) / 2, eps),
+        "convex",
+    ),
+    "newton_raphson": (
+        lambda p, eps: newton_raphson(
+            p["fn"], p["d_fn"], p["f_2nd"], sum(p["interval"]) / 2, eps
+        ),
+        "convex",
+    ),
+    "marquardt": (
+        lambda p, eps: marquardt(
+            p["fn"], p["d_fn"], p["f_2nd"], sum(p["interval"]) / 2, eps, 1e4
+        ),
+        "convex",
+    ),
+}
+
+FIELDS = (
+    "method", "function", "kind", "eps", "x", "y", "error_x", "error_y",
+    "n", "n_fn", "n_d_fn", "n_f_2nd", "evaluations", "time", "converged", "error",
+)
+
+
+def _applicable(requires, problem):
+    if requires == "unimodal":
+        return problem["kind"] == "unimodal"
+    if requires == "convex":
+        return problem["convex"]
+    if requires == "lipschitz":
+        return problem["L"] is not None
+    return True
+
+
+def run_benchmark(methods, functions, eps_values, repeat=1):
+    """
+    Запускает методы на тестовых функциях и возвращает строки с результатами.
+
+    Параметры:\n
+        methods (Iterable[str]): Названия методов из METHODS.\n
+        functions (Iterable[str]): Названия функций из FUNCTIONS.\n
+        eps_values (Iterable[Number]): Значения точности.\n
+        repeat (int): Количество повторов; время берётся минимальным.\n
+
+    Возвращает:\n
+        Iterator[dict]: Строки с полями FIELDS.
+    """
+    for name in methods:
+        run, requires = METHODS[name]
+        for fn_name in functions:
+            problem = FUNCTIONS[fn_name]
+            if not _applicable(requires, problem):
+                continue
+            for eps in eps_values:
+                row = dict.fromkeys(FIELDS, "")
+                row.update(method=name, function=fn_name, kind=problem["kind"], eps=eps)
+                try:
+                    best_time = float("inf")
+                    for _ in range(repeat):
+                        start = perf_counter()
+                        res = run(problem, eps)
+                        best_time = min(best_time, perf_counter() - start)
+                except (ValueError, ZeroDivisionError, OverflowError) as e:
+                    row["error"] = str(e)
+                    yield row
+                    continue
+                row.update(
+                    x=float(res.x),
+                    y=float(res.y),
+                    error_x=min(abs(res.x - x_min) for x_min in problem["x_min"]),
+                    error_y=float(res.y) - problem["y_min"],
+                    n=res.n,
+                    n_fn=res.n_fn,
+                    n_d_fn=res.n_d_fn,
+                    n_f_2nd=res.n_f_2nd,
+                    evaluations=res.n_fn + res.n_d_fn + res.n_f_2nd,
+                    time=best_time,
+                    converged=res.converged,
+                )
+                yield row
+
+
+def find_regressions(rows, baseline_path, tolerance):
+    """
+    Сравнивает результаты с сохранённым ранее CSV-файлом.
+
+    Регрессией считается рост числа вычислений или рост времени более чем
+    в (1 + tolerance) раз для той же тройки (метод, функция, eps).
+
+    Возвращает:\n
+        List[str]: Описания найденных регрессий.
+    """
+    with open(baseline_path, newline="") as file:
+        baseline = {
+            (row["method"], row["function"], float(row["eps"])): row
+            for row in csv.DictReader(file)
+        }
+    regressions = []
+    for row in rows:
+        old = baseline.get((row["method"], row["function"], float(row["eps"])))
+        if old is None or not old["evaluations"] or row["evaluations"] == "":
+            continue
+        key = f"{row['method']}/{row['function']}/eps={row['eps']}"
+        if row["evaluations"] > int(old["evaluations"]):
+            regressions.append(f"{key}: evaluations {old['evaluations']} -> {row['evaluations']}")
+        if row["time"] > float(old["time"]) * (1 + tolerance):
+            regressions.append(f"{key}: time {float(old['time']):.3g} -> {row['time']:.3g}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Сравнение методов одномерной оптимизации на наборе тестовых функций."
+    )
+    parser.add_argument("--methods", nargs="+", default=list(METHODS), choices=list(METHODS))
+    parser.add_argument(
+        "--functions", nargs="+", default=list(FUNCTIONS), choices=list(FUNCTIONS)
+    )
+    parser.add_argument("--eps", nargs="+", type=float, default=[1e-3, 1e-6])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--format", choices=("csv", "json"), default="csv")
+    parser.add_argument("--baseline", help="CSV с предыдущими результатами для сравнения.")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    args = parser.parse_args(argv)
+
+    rows = list(run_benchmark(args.methods, args.functions, args.eps, args.repeat))
+    if args.format == "csv":
+        writer = csv.DictWriter(sys.stdout, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        for row in rows:
+            print(json.dumps(row))
+
+    if args.baseline:
+        regressions = find_regressions(rows, args.baseline, args.tolerance)
+        for line in regressions:
+            print(line, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
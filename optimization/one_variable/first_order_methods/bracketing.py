@@ -0,0 +1,652 @@
+from ...custom_types import Number, NumericalMethod, OptimizationFnReturnValue, OptimizationResult
+from ...cached_function import Budget, BudgetExhausted, budgeted, evaluations
+from ..hyper_dual import derivative_functions
+from ..second_order_methods.safeguarded_newton import bisection_steps
+from ...stepper import State, Stepper
+from time import perf_counter
+from math import copysign, exp
+
+VARIANTS = ("illinois", "anderson_bjorck")
+
+
+def endpoint_minimum(a: Number, b: Number, d_a: Number, d_b: Number) -> Number | None:
+    """
+    Возвращает конец интервала, в котором достигается минимум, если производная
+    на концах не меняет знак (как в методах хорд и средней точки), иначе None.
+    """
+    if d_a * d_b > 0:
+        return a if d_a > 0 else b
+    if d_a * d_b == 0:
+        return a if d_a == 0 else b
+    return None
+
+
+def _prepare(
+    fn: NumericalMethod, d_fn: NumericalMethod | None, budget: Budget | None
+) -> tuple[NumericalMethod, NumericalMethod]:
+    # Обёртки с общим бюджетом, если он задан, как в chord и midpoint
+    if d_fn is None:
+        fn, d_fn, _ = derivative_functions(fn, budget=budget)
+        return fn, d_fn
+    return budgeted(fn, budget, observe=True), budgeted(d_fn, budget)
+
+
+def project(x: Number, a: Number, b: Number, eps: Number, k: int, n_max: int) -> Number:
+    """
+    Шаг Project метода ITP: проецирует точку x на окрестность середины интервала
+    радиуса r = eps / 2 * 2^(n_max - k) - (b - a) / 2. Если на k-й итерации (с нуля)
+    выбирается точка из этой окрестности, интервал сокращается до eps не более чем
+    за n_max итераций, как бы ни выбиралась x. Точка вне интервала заменяется
+    серединой.
+
+    Примеры:
+    >>> project(0.1, 0, 4, 0.01, 0, 10)
+    0.1
+    >>> project(0.1, 0, 4, 0.01, 9, 10)
+    2.0
+    """
+    x_half = (a + b) / 2
+    r = max(eps / 2 * 2 ** (n_max - k) - (b - a) / 2, 0)
+    if not a < x < b:
+        return x_half
+    if abs(x - x_half) <= r:
+        return x
+    return x_half + copysign(r, x - x_half)
+
+
+def _check_arguments(a: Number, b: Number, eps: Number, n_0: int) -> None:
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+    if a >= b:
+        raise ValueError("Левая граница интервала должна быть меньше правой.")
+    if n_0 < 0:
+        raise ValueError("Параметр n_0 должен быть неотрицательным.")
+
+
+def _check_kappa(a: Number, b: Number, kappa_1: Number | None, kappa_2: Number) -> Number:
+    # Параметры шага Truncate метода ITP; возвращает kappa_1 с учётом значения по умолчанию
+    if kappa_1 is None:
+        kappa_1 = 0.2 / (b - a)
+    if kappa_1 <= 0:
+        raise ValueError("Параметр kappa_1 должен быть положительным.")
+    if not 1 <= kappa_2 < 1 + (1 + 5**0.5) / 2:
+        raise ValueError("Параметр kappa_2 должен лежать в интервале [1, 1 + (1 + sqrt(5)) / 2).")
+    return kappa_1
+
+
+def _truncate(x_f: Number, a: Number, b: Number, kappa_1: Number, kappa_2: Number) -> Number:
+    # Шаг Truncate метода ITP: сдвиг точки x_f к середине интервала
+    x_half = (a + b) / 2
+    delta = kappa_1 * (b - a) ** kappa_2
+    return x_f + copysign(delta, x_half - x_f) if delta <= abs(x_half - x_f) else x_half
+
+
+def _replace(a: Number, b: Number, d_a: Number, d_b: Number, x: Number, d_y: Number):
+    # Замена конца интервала, на котором производная имеет тот же знак, что в x
+    if d_y > 0:
+        return a, x, d_a, d_y
+    return x, b, d_y, d_b
+
+
+def itp(
+    fn: NumericalMethod,
+    d_fn: NumericalMethod | None,
+    a: Number,
+    b: Number,
+    eps: Number,
+    kappa_1: Number | None = None,
+    kappa_2: Number = 2,
+    n_0: int = 8,
+    max_evals: int | None = None,
+    deadline: float | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимум функции методом ITP (Interpolate-Truncate-Project) —
+    ускоренным вариантом метода средней точки.
+
+    На каждой итерации берётся точка хорды x_f (Interpolate), сдвигается к середине
+    интервала на kappa_1 * (b - a)^kappa_2 (Truncate) и проецируется на окрестность
+    середины (Project, см. project). Количество итераций не превышает
+    max_steps = bisection_steps(a, b, eps) + n_0, то есть худший случай отличается
+    от деления пополам не более чем на n_0 итераций, а на гладких производных
+    сходимость сверхлинейная.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        d_fn (NumericalMethod | None): Производная функции, для которой необходимо найти минимум.
+                                       None — вычислять её вместе с fn с помощью гипердуальных чисел
+                                       (fn должна использовать функции hyper_dual или NumPy).\n
+        a (Number): Левая граница интервала, в котором ищется минимум.\n
+        b (Number): Правая граница интервала, в котором ищется минимум.\n
+        eps (Number): Точность поиска: поиск завершается, когда |d_fn(x)| <= eps
+                      или длина интервала не больше eps.\n
+        kappa_1 (Number | None): Коэффициент сдвига. По умолчанию 0.2 / (b - a).\n
+        kappa_2 (Number): Показатель сдвига, 1 <= kappa_2 < 1 + (1 + sqrt(5)) / 2.\n
+        n_0 (int): Количество итераций сверх метода деления пополам.\n
+        max_evals (int | None): Максимальное количество вычислений функции и производной.\n
+        deadline (float | None): Ограничение времени работы в секундах.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                                Поле x — значение аргумента, при котором достигается минимум.
+                                Поле y — значение функции в точке минимума.
+                                Поле info['interpolation_steps'] — количество итераций, в которых
+                                проекция не изменила точку.
+                                Поле info['max_steps'] — граница количества итераций.
+                                Остальные поля описаны в OptimizationResult.
+
+    Если исчерпан лимит max_evals или deadline, возвращается текущее приближение и
+    интервал с converged=False и status=BUDGET_EXHAUSTED.
+
+    Исключения:\n
+        ValueError: Если eps <= 0, a >= b, n_0 < 0, kappa_1 <= 0 или kappa_2
+                    вне допустимого диапазона.
+
+    Примеры:
+    >>> def f(x):
+    ...     return exp(3 * x) - 6 * x
+    >>> result = itp(f, lambda x: 3 * exp(3 * x) - 6, -2, 2, 10**-6)
+    >>> print(round(result.x, 6), result.n, result.info["max_steps"])
+    0.231049 11 30
+    """
+    _check_arguments(a, b, eps, n_0)
+    kappa_1 = _check_kappa(a, b, kappa_1, kappa_2)
+    start = perf_counter()
+    budget = Budget.create(max_evals, deadline)
+    fn, d_fn = _prepare(fn, d_fn, budget)
+    max_steps = bisection_steps(a, b, eps) + n_0
+    k = interpolations = 0
+    x = (a + b) / 2
+
+    def info() -> dict:
+        return {"interpolation_steps": interpolations, "max_steps": max_steps}
+
+    try:
+        d_a, d_b = d_fn(a), d_fn(b)
+        x = endpoint_minimum(a, b, d_a, d_b)
+        if x is not None:
+            return OptimizationResult(
+                x, fn(x), n_fn=evaluations(fn, 1), n_d_fn=evaluations(d_fn, 2), a=a, b=b,
+                time=perf_counter() - start, info=info(),
+            )
+
+        x = (a + b) / 2
+        while b - a > eps and k < max_steps:
+            x_f = (d_b * a - d_a * b) / (d_b - d_a)
+            x_t = _truncate(x_f, a, b, kappa_1, kappa_2)
+            x = project(x_t, a, b, eps, k, max_steps)
+            k += 1
+            interpolations += int(x == x_t)
+            d_y = d_fn(x)
+            a, b, d_a, d_b = _replace(a, b, d_a, d_b, x, d_y)
+            if abs(d_y) <= eps:
+                break
+        return OptimizationResult(
+            x, fn(x), n=k, n_fn=evaluations(fn, 1), n_d_fn=evaluations(d_fn, k + 2),
+            a=a, b=b, time=perf_counter() - start, info=info(),
+        )
+    except BudgetExhausted:
+        return budget.result(
+            x, n=k, n_fn=fn.evaluations, n_d_fn=d_fn.evaluations, a=a, b=b,
+            time=perf_counter() - start, info=info(),
+        )
+
+
+def illinois(
+    fn: NumericalMethod,
+    d_fn: NumericalMethod | None,
+    a: Number,
+    b: Number,
+    eps: Number,
+    variant: str = "illinois",
+    n_0: int = 8,
+    max_evals: int | None = None,
+    deadline: float | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимум функции методом хорд с модификацией Иллинойс или
+    Андерсона-Бьорка.
+
+    В методе хорд (chord) на выпуклой, но несимметричной производной один конец
+    интервала может не сдвигаться, и сходимость становится медленной. Здесь, если
+    один и тот же конец сохраняется две итерации подряд, хранимое значение
+    производной в нём умножается на 1/2 (variant='illinois') или на 1 - d(x) / d(c),
+    где c — заменяемый конец (variant='anderson_bjorck'), и сходимость становится
+    сверхлинейной. Точка хорды проецируется на окрестность середины интервала
+    (см. project), поэтому количество итераций не превышает
+    max_steps = bisection_steps(a, b, eps) + n_0.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        d_fn (NumericalMethod | None): Производная функции, для которой необходимо найти минимум.
+                                       None — вычислять её вместе с fn с помощью гипердуальных чисел
+                                       (fn должна использовать функции hyper_dual или NumPy).\n
+        a (Number): Левая граница интервала, в котором ищется минимум.\n
+        b (Number): Правая граница интервала, в котором ищется минимум.\n
+        eps (Number): Точность поиска: поиск завершается, когда |d_fn(x)| <= eps
+                      или длина интервала не больше eps.\n
+        variant (str): 'illinois' или 'anderson_bjorck'.\n
+        n_0 (int): Количество итераций сверх метода деления пополам.\n
+        max_evals (int | None): Максимальное количество вычислений функции и производной.\n
+        deadline (float | None): Ограничение времени работы в секундах.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                                Поле x — значение аргумента, при котором достигается минимум.
+                                Поле y — значение функции в точке минимума.
+                                Поле info['interpolation_steps'] — количество итераций, в которых
+                                проекция не изменила точку хорды.
+                                Поле info['max_steps'] — граница количества итераций.
+                                Остальные поля описаны в OptimizationResult.
+
+    Если исчерпан лимит max_evals или deadline, возвращается текущее приближение и
+    интервал с converged=False и status=BUDGET_EXHAUSTED.
+
+    Исключения:\n
+        ValueError: Если eps <= 0, a >= b, n_0 < 0 или variant неизвестен.
+
+    Примеры:
+    >>> def f(x):
+    ...     return exp(3 * x) - 6 * x
+    >>> result = illinois(f, lambda x: 3 * exp(3 * x) - 6, -2, 2, 10**-6)
+    >>> print(round(result.x, 6), result.n, result.info["max_steps"])
+    0.231049 16 30
+    >>> def g(x):
+    ...     return (x - 1) ** 4 + x
+    >>> d_g = lambda x: 4 * (x - 1) ** 3 + 1
+    >>> [illinois(g, d_g, -2, 3, 10**-6, variant=v).n for v in ("illinois", "anderson_bjorck")]
+    [14, 11]
+    """
+    _check_arguments(a, b, eps, n_0)
+    if variant not in VARIANTS:
+        raise ValueError("Параметр variant должен быть 'illinois' или 'anderson_bjorck'.")
+    start = perf_counter()
+    budget = Budget.create(max_evals, deadline)
+    fn, d_fn = _prepare(fn, d_fn, budget)
+    max_steps = bisection_steps(a, b, eps) + n_0
+    k = interpolations = 0
+    x = (a + b) / 2
+
+    def info() -> dict:
+        return {"interpolation_steps": interpolations, "max_steps": max_steps}
+
+    try:
+        d_a, d_b = d_fn(a), d_fn(b)
+        x = endpoint_minimum(a, b, d_a, d_b)
+        if x is not None:
+            return OptimizationResult(
+                x, fn(x), n_fn=evaluations(fn, 1), n_d_fn=evaluations(d_fn, 2), a=a, b=b,
+                time=perf_counter() - start, info=info(),
+            )
+
+        # side — какой конец заменён на предыдущей итерации (-1 — левый, 1 — правый)
+        side = 0
+        x = (a + b) / 2
+        while b - a > eps and k < max_steps:
+            x_f = (d_b * a - d_a * b) / (d_b - d_a)
+            x = project(x_f, a, b, eps, k, max_steps)
+            k += 1
+            interpolations += int(x == x_f)
+            d_y = d_fn(x)
+            if d_y > 0:
+                if side > 0:
+                    m = 0.5 if variant == "illinois" else 1 - d_y / d_b
+                    d_a *= m if m > 0 else 0.5
+                b, d_b, side = x, d_y, 1
+            else:
+                if side < 0:
+                    m = 0.5 if variant == "illinois" else 1 - d_y / d_a
+                    d_b *= m if m > 0 else 0.5
+                a, d_a, side = x, d_y, -1
+            if abs(d_y) <= eps:
+                break
+        return OptimizationResult(
+            x, fn(x), n=k, n_fn=evaluations(fn, 1), n_d_fn=evaluations(d_fn, k + 2),
+            a=a, b=b, time=perf_counter() - start, info=info(),
+        )
+    except BudgetExhausted:
+        return budget.result(
+            x, n=k, n_fn=fn.evaluations, n_d_fn=d_fn.evaluations, a=a, b=b,
+            time=perf_counter() - start, info=info(),
+        )
+
+
+def bracketed_secant(
+    fn: NumericalMethod,
+    d_fn: NumericalMethod | None,
+    a: Number,
+    b: Number,
+    eps: Number,
+    n_0: int = 8,
+    max_evals: int | None = None,
+    deadline: float | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимум функции методом секущих с сохранением интервала.
+
+    Как и в методе секущих (secant), следующая точка строится по двум последним
+    вычисленным точкам, но дополнительно хранится интервал со сменой знака
+    производной. Точка секущей вне интервала заменяется его серединой, а точка
+    внутри проецируется на окрестность середины (см. project), поэтому метод
+    не уходит от минимума и количество итераций не превышает
+    max_steps = bisection_steps(a, b, eps) + n_0.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        d_fn (NumericalMethod | None): Производная функции, для которой необходимо найти минимум.
+                                       None — вычислять её вместе с fn с помощью гипердуальных чисел
+                                       (fn должна использовать функции hyper_dual или NumPy).\n
+        a (Number): Левая граница интервала, в котором ищется минимум.\n
+        b (Number): Правая граница интервала, в котором ищется минимум.\n
+        eps (Number): Точность поиска: поиск завершается, когда |d_fn(x)| <= eps
+                      или длина интервала не больше eps.\n
+        n_0 (int): Количество итераций сверх метода деления пополам.\n
+        max_evals (int | None): Максимальное количество вычислений функции и производной.\n
+        deadline (float | None): Ограничение времени работы в секундах.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                                Поле x — значение аргумента, при котором достигается минимум.
+                                Поле y — значение функции в точке минимума.
+                                Поле info['interpolation_steps'] — количество итераций, в которых
+                                использована точка секущей.
+                                Поле info['max_steps'] — граница количества итераций.
+                                Остальные поля описаны в OptimizationResult.
+
+    Если исчерпан лимит max_evals или deadline, возвращается текущее приближение и
+    интервал с converged=False и status=BUDGET_EXHAUSTED.
+
+    Исключения:\n
+        ValueError: Если eps <= 0, a >= b или n_0 < 0.
+
+    Примеры:
+    >>> def f(x):
+    ...     return exp(3 * x) - 6 * x
+    >>> result = bracketed_secant(f, lambda x: 3 * exp(3 * x) - 6, -2, 2, 10**-6)
+    >>> print(round(result.x, 6), result.n, result.info["max_steps"])
+    0.231049 12 30
+    """
+    _check_arguments(a, b, eps, n_0)
+    start = perf_counter()
+    budget = Budget.create(max_evals, deadline)
+    fn, d_fn = _prepare(fn, d_fn, budget)
+    max_steps = bisection_steps(a, b, eps) + n_0
+    k = interpolations = 0
+    x = (a + b) / 2
+
+    def info() -> dict:
+        return {"interpolation_steps": interpolations, "max_steps": max_steps}
+
+    try:
+        d_a, d_b = d_fn(a), d_fn(b)
+        x = endpoint_minimum(a, b, d_a, d_b)
+        if x is not None:
+            return OptimizationResult(
+                x, fn(x), n_fn=evaluations(fn, 1), n_d_fn=evaluations(d_fn, 2), a=a, b=b,
+                time=perf_counter() - start, info=info(),
+            )
+
+        x_0, d_0, x_1, d_1 = a, d_a, b, d_b
+        x = (a + b) / 2
+        while b - a > eps and k < max_steps:
+            x_s = x_1 - d_1 * (x_1 - x_0) / (d_1 - d_0) if d_1 != d_0 else (a + b) / 2
+            x = project(x_s, a, b, eps, k, max_steps)
+            k += 1
+            interpolations += int(x == x_s)
+            d_y = d_fn(x)
+            x_0, d_0, x_1, d_1 = x_1, d_1, x, d_y
+            a, b, d_a, d_b = _replace(a, b, d_a, d_b, x, d_y)
+            if abs(d_y) <= eps:
+                break
+        return OptimizationResult(
+            x, fn(x), n=k, n_fn=evaluations(fn, 1), n_d_fn=evaluations(d_fn, k + 2),
+            a=a, b=b, time=perf_counter() - start, info=info(),
+        )
+    except BudgetExhausted:
+        return budget.result(
+            x, n=k, n_fn=fn.evaluations, n_d_fn=d_fn.evaluations, a=a, b=b,
+            time=perf_counter() - start, info=info(),
+        )
+
+
+class BracketingStepper(Stepper):
+    """
+    Общая часть пошаговых вариантов itp, illinois и bracketed_secant (см. Stepper).
+
+    Состояние: текущий интервал a, b со значениями производной d_a, d_b, точность
+    eps, граница количества итераций max_steps, количество итераций без изменения
+    точки проекцией interpolations, текущее приближение x и производная в нём d_y.
+    Подклассы определяют _interpolate — точку, которая затем проецируется
+    (см. project), и при необходимости _replace — замену конца интервала.
+
+    Если d_fn равна None, производная вычисляется вместе с fn с помощью
+    гипердуальных чисел.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        fn: NumericalMethod,
+        d_fn: NumericalMethod | None,
+        a: Number,
+        b: Number,
+        eps: Number,
+        n_0: int,
+        **fields,
+    ) -> None:
+        _check_arguments(a, b, eps, n_0)
+        super().__init__(
+            fn, d_fn, a=a, b=b, eps=eps, max_steps=bisection_steps(a, b, eps) + n_0,
+            interpolations=0, **fields,
+        )
+
+    def _bind(
+        self, fn: NumericalMethod, d_fn: NumericalMethod | None, f_2nd: NumericalMethod | None
+    ) -> None:
+        if d_fn is None:
+            fn, d_fn, _ = derivative_functions(fn)
+        super()._bind(fn, d_fn, f_2nd)
+
+    def _initialize(self, state: State) -> None:
+        a, b = state["a"], state["b"]
+        d_a, d_b = self.derivative(a), self.derivative(b)
+        x = endpoint_minimum(a, b, d_a, d_b)
+        if x is not None:
+            state["x"] = x
+            self._finish(state)
+            return
+
+        state.update(d_a=d_a, d_b=d_b, x=(a + b) / 2)
+        if b - a <= state["eps"] or state["max_steps"] == 0:
+            self._finish(state)
+
+    def _interpolate(self, state: State) -> Number:
+        raise NotImplementedError
+
+    def _step(self, state: State) -> None:
+        x_t = self._interpolate(state)
+        x = project(x_t, state["a"], state["b"], state["eps"], state["k"], state["max_steps"])
+        state["k"] += 1
+        state["interpolations"] += int(x == x_t)
+        state["x"], state["d_y"] = x, self.derivative(x)
+        self._replace(state)
+        if (
+            abs(state["d_y"]) <= state["eps"]
+            or state["b"] - state["a"] <= state["eps"]
+            or state["k"] >= state["max_steps"]
+        ):
+            self._finish(state)
+
+    def _replace(self, state: State) -> None:
+        state["a"], state["b"], state["d_a"], state["d_b"] = _replace(
+            state["a"], state["b"], state["d_a"], state["d_b"], state["x"], state["d_y"]
+        )
+
+    def _finish(self, state: State) -> None:
+        state["y"] = self.evaluate(state["x"])
+        state["done"] = state["converged"] = True
+
+    def result(self) -> OptimizationResult:
+        res = super().result()
+        res.info["interpolation_steps"] = self.state["interpolations"]
+        res.info["max_steps"] = self.state["max_steps"]
+        return res
+
+
+class ITPStepper(BracketingStepper):
+    """
+    Пошаговый вариант метода ITP (см. itp и BracketingStepper).
+
+    Дополнительные поля состояния: параметры сдвига kappa_1, kappa_2.
+
+    Примеры:
+    >>> stepper = ITPStepper(lambda x: (x - 3) ** 2, lambda x: 2 * (x - 3), 0, 4, 10**-6)
+    >>> result = stepper.run()
+    >>> print(round(result.x, 6), round(result.y, 6))
+    3.0 0.0
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        fn: NumericalMethod,
+        d_fn: NumericalMethod | None,
+        a: Number,
+        b: Number,
+        eps: Number,
+        kappa_1: Number | None = None,
+        kappa_2: Number = 2,
+        n_0: int = 8,
+    ) -> None:
+        _check_arguments(a, b, eps, n_0)
+        kappa_1 = _check_kappa(a, b, kappa_1, kappa_2)
+        super().__init__(fn, d_fn, a, b, eps, n_0, kappa_1=kappa_1, kappa_2=kappa_2)
+
+    def _interpolate(self, state: State) -> Number:
+        a, b, d_a, d_b = state["a"], state["b"], state["d_a"], state["d_b"]
+        x_f = (d_b * a - d_a * b) / (d_b - d_a)
+        return _truncate(x_f, a, b, state["kappa_1"], state["kappa_2"])
+
+
+class IllinoisStepper(BracketingStepper):
+    """
+    Пошаговый вариант метода хорд с модификацией Иллинойс или Андерсона-Бьорка
+    (см. illinois и BracketingStepper).
+
+    Дополнительные поля состояния: вариант variant и конец, заменённый
+    на предыдущей итерации, side (-1 — левый, 1 — правый, 0 — ещё ни один).
+    Значения d_a, d_b хранятся с учётом уменьшения.
+
+    Примеры:
+    >>> stepper = IllinoisStepper(lambda x: (x - 3) ** 2, lambda x: 2 * (x - 3), 0, 4, 10**-6)
+    >>> result = stepper.run()
+    >>> print(round(result.x, 6), round(result.y, 6))
+    3.0 0.0
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        fn: NumericalMethod,
+        d_fn: NumericalMethod | None,
+        a: Number,
+        b: Number,
+        eps: Number,
+        variant: str = "illinois",
+        n_0: int = 8,
+    ) -> None:
+        if variant not in VARIANTS:
+            raise ValueError("Параметр variant должен быть 'illinois' или 'anderson_bjorck'.")
+        super().__init__(fn, d_fn, a, b, eps, n_0, variant=variant, side=0)
+
+    def _interpolate(self, state: State) -> Number:
+        a, b, d_a, d_b = state["a"], state["b"], state["d_a"], state["d_b"]
+        return (d_b * a - d_a * b) / (d_b - d_a)
+
+    def _replace(self, state: State) -> None:
+        x, d_y, illinois_variant = state["x"], state["d_y"], state["variant"] == "illinois"
+        if d_y > 0:
+            if state["side"] > 0:
+                m = 0.5 if illinois_variant else 1 - d_y / state["d_b"]
+                state["d_a"] *= m if m > 0 else 0.5
+            state["b"], state["d_b"], state["side"] = x, d_y, 1
+        else:
+            if state["side"] < 0:
+                m = 0.5 if illinois_variant else 1 - d_y / state["d_a"]
+                state["d_b"] *= m if m > 0 else 0.5
+            state["a"], state["d_a"], state["side"] = x, d_y, -1
+
+
+class BracketedSecantStepper(BracketingStepper):
+    """
+    Пошаговый вариант метода секущих с сохранением интервала
+    (см. bracketed_secant и BracketingStepper).
+
+    Дополнительные поля состояния: две последние вычисленные точки x_0, x_1
+    со значениями производной d_0, d_1.
+
+    Примеры:
+    >>> stepper = BracketedSecantStepper(lambda x: (x - 3) ** 2, lambda x: 2 * (x - 3), 0, 4, 10**-6)
+    >>> result = stepper.run()
+    >>> print(round(result.x, 6), round(result.y, 6))
+    3.0 0.0
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        fn: NumericalMethod,
+        d_fn: NumericalMethod | None,
+        a: Number,
+        b: Number,
+        eps: Number,
+        n_0: int = 8,
+    ) -> None:
+        super().__init__(fn, d_fn, a, b, eps, n_0)
+
+    def _initialize(self, state: State) -> None:
+        super()._initialize(state)
+        if "d_a" in state:
+            state.update(x_0=state["a"], d_0=state["d_a"], x_1=state["b"], d_1=state["d_b"])
+
+    def _interpolate(self, state: State) -> Number:
+        x_0, d_0, x_1, d_1 = state["x_0"], state["d_0"], state["x_1"], state["d_1"]
+        if d_1 == d_0:
+            return (state["a"] + state["b"]) / 2
+        return x_1 - d_1 * (x_1 - x_0) / (d_1 - d_0)
+
+    def _replace(self, state: State) -> None:
+        state["x_0"], state["d_0"] = state["x_1"], state["d_1"]
+        state["x_1"], state["d_1"] = state["x"], state["d_y"]
+        super()._replace(state)
+
+
+if __name__ == "__main__":
+    from .chord import chord
+    from .midpoint import midpoint
+    from .secant import secant
+
+    # Выпуклая, но сильно несимметричная производная: в методе хорд левый конец
+    # почти не сдвигается, а метод секущих уходит от минимума
+    fn = lambda x: exp(3 * x) - 6 * x
+    d_fn = lambda x: 3 * exp(3 * x) - 6
+    a, b = -2, 2
+    for eps in (10**-3, 10**-8):
+        print(f"eps = {eps}")
+        for method, accelerated in ((chord, illinois), (midpoint, itp), (secant, bracketed_secant)):
+            try:
+                res = method(fn, d_fn, a, b, eps, max_evals=10**4)
+                print(f"  {method.__name__}: x: {res.x:.8f}, d_fn: {res.n_d_fn}, статус: {res.status}")
+            except OverflowError:
+                print(f"  {method.__name__}: переполнение — метод ушёл от минимума")
+            res = accelerated(fn, d_fn, a, b, eps)
+            print(
+                f"  {accelerated.__name__}: x: {res.x:.8f}, d_fn: {res.n_d_fn}, "
+                f"граница итераций: {res.info['max_steps']}"
+            )
+        res = illinois(fn, d_fn, a, b, eps, variant="anderson_bjorck")
+        print(f"  anderson_bjorck: x: {res.x:.8f}, d_fn: {res.n_d_fn}")
@@ -0,0 +1,176 @@
+from ...custom_types import Number, NumericalMethod, OptimizationFnReturnValue, OptimizationResult
+from ...cached_function import Budget, BudgetExhausted, budgeted, evaluations
+from ..hyper_dual import derivative_functions
+from ...stepper import State, Stepper
+from time import perf_counter
+from math import exp
+
+
+def tangent(
+    fn: NumericalMethod,
+    d_fn: NumericalMethod | None,
+    a: Number,
+    b: Number,
+    eps: Number,
+    max_evals: int | None = None,
+    deadline: float | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимум функции с помощью метода касательных.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        d_fn (NumericalMethod | None): Производная функции, для которой необходимо найти минимум.
+                                       None — вычислять её вместе с fn с помощью гипердуальных чисел
+                                       (fn должна использовать функции hyper_dual или NumPy).\n
+        a (Number): Левая граница интервала, в котором ищется минимум.\n
+        b (Number): Правая граница интервала, в котором ищется минимум.\n
+        eps (Number): Точность поиска (порог для завершения).\n
+        max_evals (int | None): Максимальное количество вычислений функции и производной.\n
+        deadline (float | None): Ограничение времени работы в секундах.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                                Поле x — значение аргумента, при котором достигается минимум.
+                                Поле y — значение функции в точке минимума.
+                                Остальные поля описаны в OptimizationResult.
+
+    Если исчерпан лимит max_evals или deadline, возвращается текущее приближение и
+    интервал с converged=False и status=BUDGET_EXHAUSTED.
+
+    Исключения:\n
+     ValueError: Если eps <= 0 (некорректное значение точности).
+
+    Примеры:
+    >>> def f(x):
+    ...     return (x - 3) ** 2
+    >>> def d_f(x):
+    ...     return 2 * (x - 3)
+    >>> result = tangent(f, d_f, 0, 4, 0.01)
+    >>> print(round(result.x, 2), round(result.y, 4))
+    3.0 0.0
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+    start = perf_counter()
+    budget = Budget.create(max_evals, deadline)
+    if d_fn is None:
+        fn, d_fn, _ = derivative_functions(fn, budget=budget)
+    else:
+        fn, d_fn = budgeted(fn, budget, observe=True), budgeted(d_fn, budget)
+    k = 0
+    x = (a + b) / 2
+    try:
+        d_a, d_b = d_fn(a), d_fn(b)
+        if d_a * d_b >= 0:
+            if d_a * d_b > 0:
+                x = a if d_a > 0 else b
+            else:
+                x = a if d_a == 0 else b
+            return OptimizationResult(
+                x, fn(x), n_fn=evaluations(fn, 1), n_d_fn=evaluations(d_fn, 2), a=a, b=b,
+                time=perf_counter() - start,
+            )
+
+        y_a, y_b = fn(a), fn(b)
+        x = (b * d_b - a * d_a + y_a - y_b) / (d_b - d_a)
+        d_y = d_fn(x)
+        while abs(d_y) > eps:
+            k += 1
+            if d_y > 0:
+                b, d_b, y_b = x, d_y, fn(x)
+            else:
+                a, d_a, y_a = x, d_y, fn(x)
+            x = (b * d_b - a * d_a + y_a - y_b) / (d_b - d_a)
+            d_y = d_fn(x)
+        else:
+            return OptimizationResult(
+                x, fn(x), n=k, n_fn=evaluations(fn, k + 3),
+                n_d_fn=evaluations(d_fn, k + 3), a=a, b=b, time=perf_counter() - start,
+            )
+    except BudgetExhausted:
+        return budget.result(
+            x, n=k, n_fn=fn.evaluations, n_d_fn=d_fn.evaluations, a=a, b=b,
+            time=perf_counter() - start,
+        )
+
+
+
+class TangentStepper(Stepper):
+    """
+    Пошаговый вариант метода касательных (см. tangent и Stepper).
+
+    Состояние: текущий интервал a, b со значениями производной d_a, d_b
+    и функции y_a, y_b, точность eps, текущее приближение x и производная в нём d_y.
+
+    Если d_fn равна None, производная вычисляется вместе с fn с помощью
+    гипердуальных чисел.
+
+    Примеры:
+    >>> stepper = TangentStepper(lambda x: (x - 3) ** 2, lambda x: 2 * (x - 3), 0, 4, 0.01)
+    >>> result = stepper.run()
+    >>> print(round(result.x, 2), round(result.y, 4))
+    3.0 0.0
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self, fn: NumericalMethod, d_fn: NumericalMethod | None, a: Number, b: Number, eps: Number
+    ) -> None:
+        if eps <= 0:
+            raise ValueError("Параметр eps должен быть положительным.")
+        super().__init__(fn, d_fn, a=a, b=b, eps=eps)
+
+    def _bind(
+        self, fn: NumericalMethod, d_fn: NumericalMethod | None, f_2nd: NumericalMethod | None
+    ) -> None:
+        if d_fn is None:
+            fn, d_fn, _ = derivative_functions(fn)
+        super()._bind(fn, d_fn, f_2nd)
+
+    def _initialize(self, state: State) -> None:
+        a, b = state["a"], state["b"]
+        d_a, d_b = self.derivative(a), self.derivative(b)
+        if d_a * d_b >= 0:
+            if d_a * d_b > 0:
+                x = a if d_a > 0 else b
+            else:
+                x = a if d_a == 0 else b
+            state["x"], state["y"] = x, self.evaluate(x)
+            state["done"] = state["converged"] = True
+            return
+
+        y_a, y_b = self.evaluate(a), self.evaluate(b)
+        state.update(d_a=d_a, d_b=d_b, y_a=y_a, y_b=y_b)
+        state["x"] = (b * d_b - a * d_a + y_a - y_b) / (d_b - d_a)
+        state["d_y"] = self.derivative(state["x"])
+        self._check(state)
+
+    def _step(self, state: State) -> None:
+        state["k"] += 1
+        x, d_y = state["x"], state["d_y"]
+        if d_y > 0:
+            state["b"], state["d_b"], state["y_b"] = x, d_y, self.evaluate(x)
+        else:
+            state["a"], state["d_a"], state["y_a"] = x, d_y, self.evaluate(x)
+        a, b, d_a, d_b = state["a"], state["b"], state["d_a"], state["d_b"]
+        state["x"] = (b * d_b - a * d_a + state["y_a"] - state["y_b"]) / (d_b - d_a)
+        state["d_y"] = self.derivative(state["x"])
+        self._check(state)
+
+    def _check(self, state: State) -> None:
+        if abs(state["d_y"]) <= state["eps"]:
+            state["y"] = self.evaluate(state["x"])
+            state["done"] = state["converged"] = True
+
+
+
+if __name__ == "__main__":
+    fn = lambda x: x**2 - x + exp(-x)
+    d_first_fn = lambda x: 2 * x - 1 - exp(-x)
+    a, b = -0.5, 1.5
+    eps = 10**-3
+    res = tangent(fn, d_first_fn, a, b, eps)
+    print(f"x: {res['x']}, y: {res['y']}")
+    print(f"fn: {res.n_fn}, d_fn: {res.n_d_fn}")
@@ -0,0 +1,296 @@
+from ..cached_function import Budget, CachedFunction
+from ..custom_types import Number, NumericalMethod
+from typing import Tuple
+import math
+
+# Функции math для вычислений от чисел (см. _call)
+_MATH = {
+    "exp": math.exp, "log": math.log, "sqrt": math.sqrt, "sin": math.sin, "cos": math.cos,
+    "tan": math.tan, "arctan": math.atan, "sinh": math.sinh, "cosh": math.cosh,
+    "tanh": math.tanh,
+}
+
+
+def _call(name: str, value):
+    # Числа вычисляются функциями math, поэтому гипердуальные числа и методы с
+    # производными не импортируют NumPy. Массивы, а также числа вне области
+    # определения или с переполнением (для них NumPy возвращает nan и inf, а
+    # math выбрасывает исключение) вычисляются функциями NumPy, который
+    # импортируется при первом таком вызове
+    if isinstance(value, (int, float)):
+        try:
+            return _MATH[name](value)
+        except (ValueError, OverflowError):
+            pass
+    import numpy as np
+
+    return getattr(np, name)(value)
+
+
+class HyperDual:
+    """
+    Гипердуальное число для прямого автоматического дифференцирования второго порядка.
+
+    Число x + x1 * e1 + x1 * e2 + x2 * e1 e2 (e1^2 = e2^2 = 0) для функции одной
+    переменной хранится тройкой (value, d1, d2): после вычисления f(HyperDual(x, 1, 0))
+    в полях результата оказываются f(x), f'(x) и f''(x). Компоненты могут быть
+    числами или массивами NumPy одной формы, тогда производные считаются поэлементно.
+
+    Поддерживаются арифметические операции, возведение в степень, сравнение
+    (по значению) и функции модуля: exp, log, sqrt, sin, cos, tan, arctan, sinh,
+    cosh, tanh. Те же функции доступны как методы, поэтому np.exp, np.sin и другие
+    поэлементные функции NumPy тоже работают. Функции модуля math приводят аргумент
+    к float и для гипердуальных чисел не подходят — вместо них используются функции
+    этого модуля или NumPy.
+
+    Атрибуты:\n
+        value (Number | np.ndarray): Значение.\n
+        d1 (Number | np.ndarray): Первая производная.\n
+        d2 (Number | np.ndarray): Вторая производная.\n
+
+    Примеры:
+    >>> x = HyperDual(2.0, 1.0, 0.0)
+    >>> y = x**3 - 2 * x
+    >>> print(y.value, y.d1, y.d2)
+    4.0 10.0 12.0
+    """
+
+    __slots__ = ("value", "d1", "d2")
+    __array_priority__ = 1000
+
+    def __init__(self, value: Number, d1: Number = 0.0, d2: Number = 0.0) -> None:
+        self.value = value
+        self.d1 = d1
+        self.d2 = d2
+
+    def _chain(self, g: Number, g1: Number, g2: Number) -> "HyperDual":
+        # (g o u)' = g'(u) u',  (g o u)'' = g''(u) u'^2 + g'(u) u''
+        return HyperDual(g, g1 * self.d1, g2 * self.d1 * self.d1 + g1 * self.d2)
+
+    def __repr__(self) -> str:
+        return f"HyperDual({self.value!r}, {self.d1!r}, {self.d2!r})"
+
+    def __add__(self, other):
+        if isinstance(other, HyperDual):
+            return HyperDual(self.value + other.value, self.d1 + other.d1, self.d2 + other.d2)
+        return HyperDual(self.value + other, self.d1, self.d2)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return HyperDual(-self.value, -self.d1, -self.d2)
+
+    def __pos__(self):
+        return self
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        if isinstance(other, HyperDual):
+            return HyperDual(
+                self.value * other.value,
+                self.d1 * other.value + self.value * other.d1,
+                self.d2 * other.value + 2 * self.d1 * other.d1 + self.value * other.d2,
+            )
+        return HyperDual(self.value * other, self.d1 * other, self.d2 * other)
+
+    __rmul__ = __mul__
+
+    def reciprocal(self) -> "HyperDual":
+        r = 1 / self.value
+        return self._chain(r, -r * r, 2 * r * r * r)
+
+    def __truediv__(self, other):
+        if isinstance(other, HyperDual):
+            return self * other.reciprocal()
+        return HyperDual(self.value / other, self.d1 / other, self.d2 / other)
+
+    def __rtruediv__(self, other):
+        return self.reciprocal() * other
+
+    def __pow__(self, other):
+        if isinstance(other, HyperDual):
+            return (self.log() * other).exp()
+        if other == 0:
+            return HyperDual(self.value**0, 0.0, 0.0)
+        if other == 1:
+            return self
+        if other == 2:
+            return self * self
+        p = self.value ** (other - 2)
+        return self._chain(p * self.value * self.value, other * p * self.value, other * (other - 1) * p)
+
+    def __rpow__(self, other):
+        return (self * _call("log", other)).exp()
+
+    def __abs__(self):
+        if isinstance(self.value, (int, float)):
+            s = (self.value > 0) - (self.value < 0)
+        else:
+            import numpy as np
+
+            s = np.sign(self.value)
+        return HyperDual(abs(self.value), s * self.d1, s * self.d2)
+
+    def __eq__(self, other):
+        return self.value == (other.value if isinstance(other, HyperDual) else other)
+
+    def __ne__(self, other):
+        return self.value != (other.value if isinstance(other, HyperDual) else other)
+
+    def __lt__(self, other):
+        return self.value < (other.value if isinstance(other, HyperDual) else other)
+
+    def __le__(self, other):
+        return self.value <= (other.value if isinstance(other, HyperDual) else other)
+
+    def __gt__(self, other):
+        return self.value > (other.value if isinstance(other, HyperDual) else other)
+
+    def __ge__(self, other):
+        return self.value >= (other.value if isinstance(other, HyperDual) else other)
+
+    __hash__ = None
+
+    def exp(self):
+        e = _call("exp", self.value)
+        return self._chain(e, e, e)
+
+    def log(self):
+        r = 1 / self.value
+        return self._chain(_call("log", self.value), r, -r * r)
+
+    def sqrt(self):
+        s = _call("sqrt", self.value)
+        return self._chain(s, 0.5 / s, -0.25 / (s * self.value))
+
+    def sin(self):
+        s, c = _call("sin", self.value), _call("cos", self.value)
+        return self._chain(s, c, -s)
+
+    def cos(self):
+        s, c = _call("sin", self.value), _call("cos", self.value)
+        return self._chain(c, -s, -c)
+
+    def tan(self):
+        t = _call("tan", self.value)
+        sec2 = 1 + t * t
+        return self._chain(t, sec2, 2 * t * sec2)
+
+    def arctan(self):
+        r = 1 / (1 + self.value * self.value)
+        return self._chain(_call("arctan", self.value), r, -2 * self.value * r * r)
+
+    def sinh(self):
+        s, c = _call("sinh", self.value), _call("cosh", self.value)
+        return self._chain(s, c, s)
+
+    def cosh(self):
+        s, c = _call("sinh", self.value), _call("cosh", self.value)
+        return self._chain(c, s, c)
+
+    def tanh(self):
+        t = _call("tanh", self.value)
+        sech2 = 1 - t * t
+        return self._chain(t, sech2, -2 * t * sech2)
+
+
+def _elementwise(name: str):
+    def fn(x):
+        if isinstance(x, HyperDual):
+            return getattr(x, name)()
+        return _call(name, x)
+
+    fn.__name__ = name
+    fn.__doc__ = f"{name}(x) для чисел, массивов NumPy и гипердуальных чисел."
+    return fn
+
+
+exp = _elementwise("exp")
+log = _elementwise("log")
+sqrt = _elementwise("sqrt")
+sin = _elementwise("sin")
+cos = _elementwise("cos")
+tan = _elementwise("tan")
+arctan = atan = _elementwise("arctan")
+sinh = _elementwise("sinh")
+cosh = _elementwise("cosh")
+tanh = _elementwise("tanh")
+
+
+def derivatives(fn: NumericalMethod, x: Number) -> Tuple[Number, Number, Number]:
+    """
+    Вычисляет значение функции и её первые две производные за одно вычисление fn.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, записанная через арифметику и функции
+                              этого модуля или NumPy.\n
+        x (Number | np.ndarray): Точка или массив точек.\n
+
+    Возвращает:\n
+        Tuple[Number, Number, Number]: f(x), f'(x), f''(x).
+
+    Примеры:
+    >>> derivatives(lambda x: x**2 - 2 * x + 16 / (x - 1) - 13, 3.0)
+    (-2.0, 0.0, 6.0)
+    """
+    y = fn(HyperDual(x, 1.0, 0.0))
+    if isinstance(y, HyperDual):
+        return y.value, y.d1, y.d2
+    # Функция не зависит от x
+    return y, 0 * y, 0 * y
+
+
+class DerivativeComponent:
+    """
+    Одна из функций f, f', f'', возвращаемых derivative_functions.
+
+    Все три компоненты используют общий кэш гипердуальных вычислений, поэтому
+    f(x), f'(x) и f''(x) в одной точке требуют одного вызова исходной функции.
+    Поле evaluations первой компоненты равно количеству таких вызовов,
+    у производных оно равно нулю, чтобы вызовы не учитывались повторно.
+    """
+
+    __slots__ = ("jet", "index")
+
+    def __init__(self, jet: CachedFunction, index: int) -> None:
+        self.jet = jet
+        self.index = index
+
+    def __call__(self, x: Number) -> Number:
+        return self.jet(x)[self.index]
+
+    @property
+    def evaluations(self) -> int:
+        return self.jet.evaluations if self.index == 0 else 0
+
+
+def derivative_functions(
+    fn: NumericalMethod, maxsize: int | None = 1024, budget: Budget | None = None
+) -> Tuple[DerivativeComponent, DerivativeComponent, DerivativeComponent]:
+    """
+    Строит функции f, f', f'' по одной функции fn с помощью гипердуальных чисел.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, записанная через арифметику и функции
+                              этого модуля или NumPy.\n
+        maxsize (int | None): Размер общего кэша (см. CachedFunction).\n
+        budget (Budget | None): Лимит вычислений и времени (см. Budget); каждый
+                                проход fn учитывается как одно вычисление.\n
+
+    Возвращает:\n
+        Tuple[DerivativeComponent, ...]: Функции f, f', f''.
+
+    Примеры:
+    >>> f, f_1st, f_2nd = derivative_functions(lambda x: x**3)
+    >>> f(2.0), f_1st(2.0), f_2nd(2.0)
+    (8.0, 12.0, 12.0)
+    >>> print(f.evaluations)
+    1
+    """
+    jet = CachedFunction(lambda x: derivatives(fn, x), maxsize, budget, observe=True)
+    return DerivativeComponent(jet, 0), DerivativeComponent(jet, 1), DerivativeComponent(jet, 2)
@@ -0,0 +1,228 @@
+from ...custom_types import Number, NumericalMethod, OptimizationFnReturnValue, OptimizationResult
+from ...cached_function import Budget, BudgetExhausted, budgeted, evaluations
+from ..hyper_dual import derivative_functions
+from ...stepper import State, Stepper
+from time import perf_counter
+from math import isfinite, nan
+
+
+def marquardt(
+    f: NumericalMethod,
+    f_1st: NumericalMethod | None,
+    f_2nd: NumericalMethod | None,
+    x_0: Number,
+    eps: Number,
+    mu: Number,
+    max_iterations: int = 1000,
+    max_evals: int | None = None,
+    deadline: float | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимум функции с помощью метода Марквардта.
+
+    Параметры:\n
+        f (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        f_1st (NumericalMethod | None): Первая производная функции, для которой необходимо найти минимум.\n
+        f_2nd (NumericalMethod | None): Вторая производная функции, для которой необходимо найти минимум.
+                                        Если f_1st или f_2nd равна None, обе производные вычисляются
+                                        вместе с f за один проход с помощью гипердуальных чисел
+                                        (f должна использовать функции hyper_dual или NumPy).\n
+        x_0 (Number): Начальное приближение.\n
+        eps (Number): Точность поиска (порог для завершения).\n
+        mu (Number): Параметр Марквардта.\n
+        max_iterations (int): Максимальное количество итераций.\n
+        max_evals (int | None): Максимальное количество вычислений функции и её производных.\n
+        deadline (float | None): Ограничение времени работы в секундах.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                                Поле x — значение аргумента, при котором достигается минимум.
+                                Поле y — значение функции в точке минимума.
+                                Остальные поля описаны в OptimizationResult.
+
+    Если метод не сошелся за max_iterations итераций, шаг метода не определён или
+    уводит в бесконечность (например, при f_2nd(x) + mu = 0) или вычисление в
+    очередной точке вызвало ArithmeticError (переполнение, деление на ноль),
+    возвращается последнее приближение с converged=False.
+
+    Если исчерпан лимит max_evals или deadline, возвращается текущее приближение с
+    converged=False и status=BUDGET_EXHAUSTED.
+
+    Исключения:\n
+        ValueError: Если eps <= 0 (некорректное значение точности).
+
+    Примеры:
+    >>> def f(x):
+    ...     return x**2 - 2 * x + 16 / (x - 1) - 13
+    >>> def f_1st(x):
+    ...     return 2 * x - 2 - 16 / (x - 1)**2
+    >>> def f_2nd(x):
+    ...     return 2 + 32 / (x - 1)**3
+    >>> result = marquardt(f, f_1st, f_2nd, 2, 10**-3, 1)
+    >>> print(round(result.x, 2), round(result.y, 4))
+    3.0 -2.0
+    >>> result = marquardt(lambda x: -x**2, lambda x: -2 * x, lambda x: -2.0, 1.0, 10**-3, 2.0)
+    >>> print(result.x, result.converged, result.status)
+    1.0 False not_converged
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+
+    start = perf_counter()
+    budget = Budget.create(max_evals, deadline)
+    if f_1st is None or f_2nd is None:
+        f, f_1st, f_2nd = derivative_functions(f, budget=budget)
+    else:
+        f = budgeted(f, budget, observe=True)
+        f_1st, f_2nd = budgeted(f_1st, budget), budgeted(f_2nd, budget)
+    k = n_fn = n_d_fn = n_f_2nd = 0
+    x = x_0
+    diverged = False
+    try:
+        y = y_0 = f(x)
+        d_y = f_1st(x)
+        n_fn, n_d_fn = 1, 1
+        while True:
+            d2_y = f_2nd(x) + mu
+            n_f_2nd += 1
+            # Шаг не определён или уводит в бесконечность: метод расходится
+            x_new = x - d_y / d2_y if d2_y != 0 else nan
+            if not isfinite(x_new):
+                diverged = True
+                break
+            x = x_new
+            y = f(x)
+            d_y = f_1st(x)
+            n_fn += 1
+            n_d_fn += 1
+            if abs(d_y) <= eps or k >= max_iterations:
+                break
+            k += 1
+            if y < y_0:
+                mu /= 2
+            else:
+                mu *= 2
+            y_0 = y
+        return OptimizationResult(
+            x, y, n=k, n_fn=evaluations(f, n_fn), n_d_fn=evaluations(f_1st, n_d_fn),
+            n_f_2nd=evaluations(f_2nd, n_f_2nd), converged=not diverged and abs(d_y) <= eps,
+            time=perf_counter() - start,
+        )
+    except BudgetExhausted:
+        return budget.result(
+            x, n=k, n_fn=f.evaluations, n_d_fn=f_1st.evaluations,
+            n_f_2nd=f_2nd.evaluations, time=perf_counter() - start,
+        )
+    except ArithmeticError:
+        # Переполнение или деление на ноль при вычислении в очередной точке
+        return OptimizationResult(
+            x, nan, n=k, n_fn=evaluations(f, n_fn), n_d_fn=evaluations(f_1st, n_d_fn),
+            n_f_2nd=evaluations(f_2nd, n_f_2nd), converged=False, time=perf_counter() - start,
+        )
+   
+
+class MarquardtStepper(Stepper):
+    """
+    Пошаговый вариант метода Марквардта (см. marquardt и Stepper).
+
+    Состояние: точность eps, лимит итераций max_iterations, параметр mu,
+    предыдущее приближение x_0 со значением y_0, текущее приближение x со
+    значением y и производная в нём d_y.
+
+    Если f_1st или f_2nd равна None, производные вычисляются вместе с f с помощью
+    гипердуальных чисел.
+
+    Как и marquardt, завершается с converged=False, если исчерпан лимит итераций
+    или шаг не определён (например, при f_2nd(x) + mu = 0).
+
+    Примеры:
+    >>> def f(x):
+    ...     return x**2 - 2 * x + 16 / (x - 1) - 13
+    >>> stepper = MarquardtStepper(f, None, None, 4, 10**-6, 1.0)
+    >>> result = stepper.run()
+    >>> print(round(result.x, 4), round(result.y, 4))
+    3.0 -2.0
+    >>> stepper = MarquardtStepper(lambda x: -x**2, lambda x: -2 * x, lambda x: -2.0, 1.0, 10**-3, 2.0)
+    >>> print(stepper.run().status)
+    not_converged
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        f: NumericalMethod,
+        f_1st: NumericalMethod | None,
+        f_2nd: NumericalMethod | None,
+        x_0: Number,
+        eps: Number,
+        mu: Number,
+        max_iterations: int = 1000,
+    ) -> None:
+        if eps <= 0:
+            raise ValueError("Параметр eps должен быть положительным.")
+        super().__init__(
+            f, f_1st, f_2nd, x=x_0, eps=eps, mu=mu, max_iterations=max_iterations
+        )
+
+    def _bind(
+        self, f: NumericalMethod, f_1st: NumericalMethod | None, f_2nd: NumericalMethod | None
+    ) -> None:
+        if f_1st is None or f_2nd is None:
+            f, f_1st, f_2nd = derivative_functions(f)
+        super()._bind(f, f_1st, f_2nd)
+
+    def _initialize(self, state: State) -> None:
+        x = state["x"]
+        try:
+            y = self.evaluate(x)
+            state.update(x_0=x, y_0=y, y=y, d_y=self.derivative(x))
+        except ArithmeticError:
+            state.update(y=nan, done=True)
+            return
+        self._advance(state)
+
+    def _step(self, state: State) -> None:
+        state["k"] += 1
+        if state["y"] < state["y_0"]:
+            state["mu"] /= 2
+        else:
+            state["mu"] *= 2
+        state["x_0"], state["y_0"] = state["x"], state["y"]
+        self._advance(state)
+
+    def _advance(self, state: State) -> None:
+        x, d_y = state["x"], state["d_y"]
+        try:
+            d2_y = self.second_derivative(x) + state["mu"]
+            # Шаг не определён или уводит в бесконечность: метод расходится
+            x_new = x - d_y / d2_y if d2_y != 0 else nan
+            if not isfinite(x_new):
+                state["done"] = True
+                return
+            state["x"] = x_new
+            state.update(y=self.evaluate(x_new), d_y=self.derivative(x_new))
+        except ArithmeticError:
+            # Переполнение или деление на ноль при вычислении в очередной точке
+            state.update(y=nan, done=True)
+            return
+        if abs(state["d_y"]) <= state["eps"]:
+            state["done"] = state["converged"] = True
+        elif state["k"] >= state["max_iterations"]:
+            state["done"] = True
+
+if __name__ == "__main__":
+    import numpy as np
+
+    f = lambda x: x**2 - x + np.exp(-np.maximum(x, 0))
+    f_1st = lambda x: 2 * x - 1 - np.exp(-np.maximum(x, 0))
+    f_2nd = lambda x: 2 - np.exp(-np.maximum(x, 0))
+    x_0 = 0
+    eps = 1e-3
+    mu = 1e4
+    res = marquardt(f, f_1st, f_2nd, x_0, eps, mu)
+    print(f"x: {res['x']}, y: {res['y']}")
+
+    # Производные вычисляются автоматически, один проход f на точку
+    res = marquardt(f, None, None, x_0, eps, mu)
+    print(f"x: {res.x}, y: {res.y}, вычислений f: {res.n_fn}")
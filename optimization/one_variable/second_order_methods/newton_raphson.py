@@ -0,0 +1,235 @@
+from ...custom_types import Number, NumericalMethod, OptimizationFnReturnValue, OptimizationResult
+from ...cached_function import Budget, BudgetExhausted, budgeted, evaluations
+from ..hyper_dual import derivative_functions
+from ...stepper import State, Stepper
+from time import perf_counter
+from math import isfinite, nan
+
+
+def newton_raphson(
+    f: NumericalMethod,
+    f_1st: NumericalMethod | None,
+    f_2nd: NumericalMethod | None,
+    x_0: Number,
+    eps: Number,
+    max_iterations: int = 1000,
+    max_evals: int | None = None,
+    deadline: float | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимум функции с помощью метода Ньютона-Рафсона.
+
+    Параметры:\n
+        f (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        f_1st (NumericalMethod | None): Первая производная функции, для которой необходимо найти минимум.\n
+        f_2nd (NumericalMethod | None): Вторая производная функции, для которой необходимо найти минимум.
+                                        Если f_1st или f_2nd равна None, обе производные вычисляются
+                                        вместе с f за один проход с помощью гипердуальных чисел
+                                        (f должна использовать функции hyper_dual или NumPy).\n
+        x_0 (Number): Начальное приближение.\n
+        eps (Number): Точность поиска (порог для завершения).\n
+        max_iterations (int): Максимальное количество итераций.\n
+        max_evals (int | None): Максимальное количество вычислений функции и её производных.\n
+        deadline (float | None): Ограничение времени работы в секундах.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                                Поле x — значение аргумента, при котором достигается минимум.
+                                Поле y — значение функции в точке минимума.
+                                Остальные поля описаны в OptimizationResult.
+
+    Если метод не сошелся за max_iterations итераций, шаг метода не определён или
+    уводит в бесконечность (например, при нулевой второй производной), значение
+    функции в найденной точке бесконечно или вычисление в очередной точке вызвало
+    ArithmeticError (переполнение, деление на ноль), возвращается последнее
+    приближение с converged=False.
+
+    Если исчерпан лимит max_evals или deadline, возвращается текущее приближение с
+    converged=False и status=BUDGET_EXHAUSTED.
+
+    Исключения:\n
+        ValueError: Если eps <= 0 (некорректное значение точности).
+
+    Примеры:
+    >>> def f(x):
+    ...     return x**2 - 2 * x + 16 / (x - 1) - 13
+    >>> def f_1st(x):
+    ...     return 2 * x - 2 - 16 / (x - 1)**2
+    >>> def f_2nd(x):
+    ...     return 2 + 32 / (x - 1)**3
+    >>> result = newton_raphson(f, f_1st, f_2nd, 2, 10**-3)
+    >>> print(round(result.x, 2), round(result.y, 4))
+    3.0 -2.0
+    >>> from math import sqrt
+    >>> result = newton_raphson(
+    ...     lambda x: sqrt(1 + x**2), lambda x: x / sqrt(1 + x**2), lambda x: (1 + x**2) ** -1.5,
+    ...     3, 10**-3,
+    ... )
+    >>> print(result.converged, result.status)
+    False not_converged
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+
+    start = perf_counter()
+    budget = Budget.create(max_evals, deadline)
+    if f_1st is None or f_2nd is None:
+        f, f_1st, f_2nd = derivative_functions(f, budget=budget)
+    else:
+        f = budgeted(f, budget, observe=True)
+        f_1st, f_2nd = budgeted(f_1st, budget), budgeted(f_2nd, budget)
+    k = n_d_fn = n_f_2nd = 0
+    x = x_0
+    diverged = False
+    try:
+        d_y = f_1st(x)
+        n_d_fn += 1
+        while True:
+            d2_y = f_2nd(x)
+            n_f_2nd += 1
+            # Шаг не определён или уводит в бесконечность: метод расходится
+            diff_ratio = d_y / d2_y if d2_y != 0 else nan
+            x_tilda = x - diff_ratio
+            if not isfinite(x_tilda):
+                diverged = True
+                break
+            d_tilda = f_1st(x_tilda)
+            n_d_fn += 1
+            alpha = d_y ** 2 / (d_y ** 2 + d_tilda ** 2) if d_y != 0 else 1.0
+            x_new = x - alpha * diff_ratio
+            if not isfinite(x_new):
+                diverged = True
+                break
+            x = x_new
+            d_y = f_1st(x)
+            n_d_fn += 1
+            if abs(d_y) <= eps or k >= max_iterations:
+                break
+            k += 1
+        # Производная может обнулиться из-за переполнения (x / sqrt(inf) = 0),
+        # поэтому бесконечное значение функции тоже означает расхождение.
+        y = f(x)
+        return OptimizationResult(
+            x, y, n=k, n_fn=evaluations(f, 1), n_d_fn=evaluations(f_1st, n_d_fn),
+            n_f_2nd=evaluations(f_2nd, n_f_2nd),
+            converged=not diverged and abs(d_y) <= eps and isfinite(y),
+            time=perf_counter() - start,
+        )
+    except BudgetExhausted:
+        return budget.result(
+            x, n=k, n_fn=f.evaluations, n_d_fn=f_1st.evaluations,
+            n_f_2nd=f_2nd.evaluations, time=perf_counter() - start,
+        )
+    except ArithmeticError:
+        # Переполнение или деление на ноль при вычислении в очередной точке
+        return OptimizationResult(
+            x, nan, n=k, n_fn=evaluations(f, 0), n_d_fn=evaluations(f_1st, n_d_fn),
+            n_f_2nd=evaluations(f_2nd, n_f_2nd), converged=False, time=perf_counter() - start,
+        )
+
+
+class NewtonRaphsonStepper(Stepper):
+    """
+    Пошаговый вариант метода Ньютона-Рафсона (см. newton_raphson и Stepper).
+
+    Состояние: точность eps, лимит итераций max_iterations, текущее приближение x
+    и производная в нём d_y.
+
+    Если f_1st или f_2nd равна None, производные вычисляются вместе с f с помощью
+    гипердуальных чисел.
+
+    Как и newton_raphson, завершается с converged=False, если исчерпан лимит
+    итераций или шаг не определён (например, при нулевой второй производной).
+
+    Примеры:
+    >>> def f(x):
+    ...     return x**2 - 2 * x + 16 / (x - 1) - 13
+    >>> stepper = NewtonRaphsonStepper(f, None, None, 4, 10**-6)
+    >>> result = stepper.run()
+    >>> print(round(result.x, 4), round(result.y, 4))
+    3.0 -2.0
+    >>> stepper = NewtonRaphsonStepper(
+    ...     lambda x: x**4, lambda x: 4 * x**3, lambda x: 12 * x**2, 1.0, 10**-12, max_iterations=5
+    ... )
+    >>> result = stepper.run()
+    >>> print(result.n, result.converged, result.status)
+    5 False not_converged
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        f: NumericalMethod,
+        f_1st: NumericalMethod | None,
+        f_2nd: NumericalMethod | None,
+        x_0: Number,
+        eps: Number,
+        max_iterations: int = 1000,
+    ) -> None:
+        if eps <= 0:
+            raise ValueError("Параметр eps должен быть положительным.")
+        super().__init__(f, f_1st, f_2nd, x=x_0, eps=eps, max_iterations=max_iterations)
+
+    def _bind(
+        self, f: NumericalMethod, f_1st: NumericalMethod | None, f_2nd: NumericalMethod | None
+    ) -> None:
+        if f_1st is None or f_2nd is None:
+            f, f_1st, f_2nd = derivative_functions(f)
+        super()._bind(f, f_1st, f_2nd)
+
+    def _initialize(self, state: State) -> None:
+        state["d_y"] = self.derivative(state["x"])
+        self._advance(state)
+
+    def _step(self, state: State) -> None:
+        state["k"] += 1
+        self._advance(state)
+
+    def _advance(self, state: State) -> None:
+        x, d_y = state["x"], state["d_y"]
+        try:
+            d2_y = self.second_derivative(x)
+            # Шаг не определён или уводит в бесконечность: метод расходится
+            diff_ratio = d_y / d2_y if d2_y != 0 else nan
+            x_tilda = x - diff_ratio
+            if not isfinite(x_tilda):
+                self._finish(state, False)
+                return
+            d_tilda = self.derivative(x_tilda)
+            alpha = d_y ** 2 / (d_y ** 2 + d_tilda ** 2) if d_y != 0 else 1.0
+            x_new = x - alpha * diff_ratio
+            if not isfinite(x_new):
+                self._finish(state, False)
+                return
+            state["x"] = x_new
+            state["d_y"] = d_y = self.derivative(x_new)
+            if abs(d_y) <= state["eps"]:
+                self._finish(state, True)
+            elif state["k"] >= state["max_iterations"]:
+                self._finish(state, False)
+        except ArithmeticError:
+            # Переполнение или деление на ноль при вычислении в очередной точке
+            state["y"] = nan
+            state["done"] = True
+
+    def _finish(self, state: State, converged: bool) -> None:
+        state["y"] = y = self.evaluate(state["x"])
+        state["done"] = True
+        state["converged"] = converged and isfinite(y)
+
+
+if __name__ == "__main__":
+    import numpy as np
+
+    f = lambda x: x**2 - x + np.exp(-np.maximum(x, 0))
+    f_1st = lambda x: 2 * x - 1 - np.exp(-np.maximum(x, 0))
+    f_2nd = lambda x: 2 - np.exp(-np.maximum(x, 0))
+    x_0 = 10
+    eps = 1e-3
+    res = newton_raphson(f, f_1st, f_2nd, x_0, eps)
+    print(f"x: {res['x']}, y: {res['y']}")
+
+    # Производные вычисляются автоматически, один проход f на точку
+    res = newton_raphson(f, None, None, x_0, eps)
+    print(f"x: {res.x}, y: {res.y}, вычислений f: {res.n_fn}")
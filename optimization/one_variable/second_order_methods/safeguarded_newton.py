@@ -0,0 +1,296 @@
+from ...custom_types import Number, NumericalMethod, OptimizationFnReturnValue, OptimizationResult
+from ...cached_function import Budget, BudgetExhausted, budgeted, evaluations
+from ..hyper_dual import derivative_functions
+from ...stepper import State, Stepper
+from time import perf_counter
+from math import ceil, log2
+
+
+def bisection_steps(a: Number, b: Number, eps: Number) -> int:
+    """
+    Возвращает количество делений пополам, за которое интервал [a, b] сократится
+    до длины не больше eps.
+
+    Примеры:
+    >>> bisection_steps(0, 4, 0.01)
+    9
+    """
+    return ceil(log2((b - a) / eps)) if b - a > eps else 0
+
+
+def safeguarded_newton(
+    f: NumericalMethod,
+    f_1st: NumericalMethod | None,
+    f_2nd: NumericalMethod | None,
+    a: Number,
+    b: Number,
+    eps: Number,
+    x_0: Number | None = None,
+    max_evals: int | None = None,
+    deadline: float | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимум функции методом Ньютона с защитой делением пополам.
+
+    Как и в методе средней точки, хранится интервал [a, b], на концах которого
+    производная имеет разные знаки; после каждого вычисления производной один
+    из концов заменяется текущей точкой. Шаг Ньютона x - f'(x) / f''(x) принимается,
+    если f''(x) > 0, новая точка лежит строго внутри интервала и шаг не больше
+    половины шага, сделанного две итерации назад. Иначе выполняется деление
+    интервала пополам. Вблизи минимума шаги Ньютона принимаются, и сходимость
+    остаётся квадратичной.
+
+    Количество итераций не превышает max_steps = 2 * bisection_steps(a, b, eps):
+    шаг Ньютона разрешается, только пока оставшихся итераций хватает, чтобы
+    делениями пополам сократить интервал до eps.
+
+    Параметры:\n
+        f (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        f_1st (NumericalMethod | None): Первая производная функции, для которой необходимо найти минимум.\n
+        f_2nd (NumericalMethod | None): Вторая производная функции, для которой необходимо найти минимум.
+                                        Если f_1st или f_2nd равна None, обе производные вычисляются
+                                        вместе с f за один проход с помощью гипердуальных чисел
+                                        (f должна использовать функции hyper_dual или NumPy).\n
+        a (Number): Левая граница интервала, в котором ищется минимум.\n
+        b (Number): Правая граница интервала, в котором ищется минимум.\n
+        eps (Number): Точность поиска: поиск завершается, когда |f'(x)| <= eps
+                      или длина интервала не больше eps.\n
+        x_0 (Number | None): Начальное приближение внутри интервала. По умолчанию —
+                             середина интервала.\n
+        max_evals (int | None): Максимальное количество вычислений функции и её производных.\n
+        deadline (float | None): Ограничение времени работы в секундах.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                                Поле x — значение аргумента, при котором достигается минимум.
+                                Поле y — значение функции в точке минимума.
+                                Поле info['newton_steps'] — количество принятых шагов Ньютона.
+                                Поле info['bisection_steps'] — количество делений пополам.
+                                Поле info['max_steps'] — гарантированная граница количества итераций.
+                                Остальные поля описаны в OptimizationResult.
+
+    Если исчерпан лимит max_evals или deadline, возвращается текущее приближение и
+    интервал с converged=False и status=BUDGET_EXHAUSTED.
+
+    Исключения:\n
+        ValueError: Если eps <= 0, a >= b или x_0 не лежит внутри интервала.
+
+    Примеры:
+    >>> def f(x):
+    ...     return x**2 - 2 * x + 16 / (x - 1) - 13
+    >>> def f_1st(x):
+    ...     return 2 * x - 2 - 16 / (x - 1)**2
+    >>> def f_2nd(x):
+    ...     return 2 + 32 / (x - 1)**3
+    >>> result = safeguarded_newton(f, f_1st, f_2nd, 2, 5, 10**-6)
+    >>> print(round(result.x, 6), round(result.y, 6), result.info["max_steps"])
+    3.0 -2.0 44
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+    if a >= b:
+        raise ValueError("Левая граница интервала должна быть меньше правой.")
+    if x_0 is not None and not a < x_0 < b:
+        raise ValueError("Начальное приближение x_0 должно лежать внутри интервала.")
+
+    start = perf_counter()
+    budget = Budget.create(max_evals, deadline)
+    if f_1st is None or f_2nd is None:
+        f, f_1st, f_2nd = derivative_functions(f, budget=budget)
+    else:
+        f = budgeted(f, budget, observe=True)
+        f_1st, f_2nd = budgeted(f_1st, budget), budgeted(f_2nd, budget)
+    max_steps = 2 * bisection_steps(a, b, eps)
+    k = newton_steps = n_f_2nd = 0
+    x = (a + b) / 2 if x_0 is None else x_0
+
+    def info() -> dict:
+        return {
+            "newton_steps": newton_steps,
+            "bisection_steps": k - newton_steps,
+            "max_steps": max_steps,
+        }
+
+    try:
+        d_a, d_b = f_1st(a), f_1st(b)
+        if d_a * d_b >= 0:
+            if d_a * d_b > 0:
+                x = a if d_a > 0 else b
+            else:
+                x = a if d_a == 0 else b
+            return OptimizationResult(
+                x, f(x), n_fn=evaluations(f, 1), n_d_fn=evaluations(f_1st, 2),
+                n_f_2nd=evaluations(f_2nd, 0), a=a, b=b, time=perf_counter() - start, info=info(),
+            )
+
+        d_y = f_1st(x)
+        if d_y > 0:
+            b = x
+        else:
+            a = x
+        step = step_old = b - a
+        while abs(d_y) > eps and b - a > eps:
+            k += 1
+            x_new = None
+            if max_steps - k >= bisection_steps(a, b, eps):
+                d2_y = f_2nd(x)
+                n_f_2nd += 1
+                if d2_y > 0 and abs(d_y / d2_y) <= abs(step_old) / 2:
+                    x_new = x - d_y / d2_y
+                    if not a < x_new < b:
+                        x_new = None
+            if x_new is None:
+                x_new = (a + b) / 2
+            else:
+                newton_steps += 1
+            step_old, step = step, x_new - x
+            x = x_new
+            d_y = f_1st(x)
+            if d_y > 0:
+                b = x
+            else:
+                a = x
+        else:
+            return OptimizationResult(
+                x, f(x), n=k, n_fn=evaluations(f, 1), n_d_fn=evaluations(f_1st, k + 3),
+                n_f_2nd=evaluations(f_2nd, n_f_2nd), a=a, b=b, time=perf_counter() - start,
+                info=info(),
+            )
+    except BudgetExhausted:
+        return budget.result(
+            x, n=k, n_fn=f.evaluations, n_d_fn=f_1st.evaluations, n_f_2nd=f_2nd.evaluations,
+            a=a, b=b, time=perf_counter() - start, info=info(),
+        )
+
+
+class SafeguardedNewtonStepper(Stepper):
+    """
+    Пошаговый вариант метода Ньютона с защитой делением пополам
+    (см. safeguarded_newton и Stepper).
+
+    Состояние: текущий интервал a, b, точность eps, текущее приближение x,
+    производная в нём d_y, два последних шага step и step_old, граница max_steps
+    и количество принятых шагов Ньютона newton_steps.
+
+    Если f_1st или f_2nd равна None, производные вычисляются вместе с f с помощью
+    гипердуальных чисел.
+
+    Примеры:
+    >>> def f(x):
+    ...     return x**2 - 2 * x + 16 / (x - 1) - 13
+    >>> stepper = SafeguardedNewtonStepper(f, None, None, 2, 5, 10**-6)
+    >>> result = stepper.run()
+    >>> print(round(result.x, 6), round(result.y, 6))
+    3.0 -2.0
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        f: NumericalMethod,
+        f_1st: NumericalMethod | None,
+        f_2nd: NumericalMethod | None,
+        a: Number,
+        b: Number,
+        eps: Number,
+        x_0: Number | None = None,
+    ) -> None:
+        if eps <= 0:
+            raise ValueError("Параметр eps должен быть положительным.")
+        if a >= b:
+            raise ValueError("Левая граница интервала должна быть меньше правой.")
+        if x_0 is not None and not a < x_0 < b:
+            raise ValueError("Начальное приближение x_0 должно лежать внутри интервала.")
+        super().__init__(
+            f, f_1st, f_2nd, a=a, b=b, eps=eps, x=(a + b) / 2 if x_0 is None else x_0,
+            max_steps=2 * bisection_steps(a, b, eps), newton_steps=0,
+        )
+
+    def _bind(
+        self, f: NumericalMethod, f_1st: NumericalMethod | None, f_2nd: NumericalMethod | None
+    ) -> None:
+        if f_1st is None or f_2nd is None:
+            f, f_1st, f_2nd = derivative_functions(f)
+        super()._bind(f, f_1st, f_2nd)
+
+    def _initialize(self, state: State) -> None:
+        a, b = state["a"], state["b"]
+        d_a, d_b = self.derivative(a), self.derivative(b)
+        if d_a * d_b >= 0:
+            if d_a * d_b > 0:
+                x = a if d_a > 0 else b
+            else:
+                x = a if d_a == 0 else b
+            state["x"], state["y"] = x, self.evaluate(x)
+            state["done"] = state["converged"] = True
+            return
+
+        state["d_y"] = self.derivative(state["x"])
+        self._update(state)
+        state["step"] = state["step_old"] = state["b"] - state["a"]
+        self._check(state)
+
+    def _step(self, state: State) -> None:
+        state["k"] += 1
+        a, b, x, d_y = state["a"], state["b"], state["x"], state["d_y"]
+        x_new = None
+        if state["max_steps"] - state["k"] >= bisection_steps(a, b, state["eps"]):
+            d2_y = self.second_derivative(x)
+            if d2_y > 0 and abs(d_y / d2_y) <= abs(state["step_old"]) / 2:
+                x_new = x - d_y / d2_y
+                if not a < x_new < b:
+                    x_new = None
+        if x_new is None:
+            x_new = (a + b) / 2
+        else:
+            state["newton_steps"] += 1
+        state["step_old"], state["step"] = state["step"], x_new - x
+        state["x"] = x_new
+        state["d_y"] = self.derivative(x_new)
+        self._update(state)
+        self._check(state)
+
+    def result(self) -> OptimizationResult:
+        res = super().result()
+        state = self.state
+        res.info["newton_steps"] = state["newton_steps"]
+        res.info["bisection_steps"] = state["k"] - state["newton_steps"]
+        res.info["max_steps"] = state["max_steps"]
+        return res
+
+    def _update(self, state: State) -> None:
+        if state["d_y"] > 0:
+            state["b"] = state["x"]
+        else:
+            state["a"] = state["x"]
+
+    def _check(self, state: State) -> None:
+        if abs(state["d_y"]) <= state["eps"] or state["b"] - state["a"] <= state["eps"]:
+            state["y"] = self.evaluate(state["x"])
+            state["done"] = state["converged"] = True
+
+
+if __name__ == "__main__":
+    import numpy as np
+
+    from .newton import newton
+
+    # Метод Ньютона из x_0 = 2 расходится: шаг переводит x в -x^3
+    f = lambda x: np.sqrt(1 + x**2)
+    f_1st = lambda x: x / np.sqrt(1 + x**2)
+    f_2nd = lambda x: (1 + x**2) ** -1.5
+    a, b = -3, 4
+    eps = 1e-6
+    with np.errstate(over="ignore"):
+        res = newton(f, f_1st, f_2nd, 2, eps, max_evals=200)
+    print(f"newton: x: {res.x}, статус: {res.status}, N: {res.n}")
+    res = safeguarded_newton(f, f_1st, f_2nd, a, b, eps, x_0=2)
+    print(
+        f"safeguarded_newton: x: {res.x}, y: {res.y}, N: {res.n}, "
+        f"шагов Ньютона: {res.info['newton_steps']}, граница: {res.info['max_steps']}"
+    )
+
+    # Производные вычисляются автоматически, один проход f на точку
+    res = safeguarded_newton(f, None, None, a, b, eps, x_0=2)
+    print(f"x: {res.x}, y: {res.y}, вычислений f: {res.n_fn}")
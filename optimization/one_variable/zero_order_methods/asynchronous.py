@@ -0,0 +1,344 @@
+from ...custom_types import Number, OptimizationFnReturnValue, OptimizationResult
+from .grid_search import grid_chunks
+from typing import Awaitable, Callable, Iterable, List
+from math import sqrt
+from time import perf_counter
+import asyncio
+
+AsyncNumericalMethod = Callable[[Number], Awaitable[Number]]
+
+# Ограничение одновременных вызовов и размер пакета по умолчанию для перебора
+# сетки: пакет целиком превращается в корутины, ожидающие семафора
+ASYNC_LIMIT = 64
+ASYNC_CHUNK_SIZE = 1024
+
+
+class AsyncFunction:
+    """
+    Асинхронная функция с ограничением количества одновременных вызовов
+    и счётчиком вычислений.
+
+    Параметры:\n
+        fn (AsyncNumericalMethod): Асинхронная функция (корутина от одного аргумента).\n
+        limit (int | asyncio.Semaphore | None): Наибольшее количество одновременных
+                    вызовов. Общий семафор позволяет ограничить вызовы сразу для
+                    нескольких поисков, выполняемых в одном цикле событий.
+                    None — без ограничения.\n
+
+    Исключения:\n
+        ValueError: Если limit <= 0.
+
+    Примеры:
+    >>> async def f(x):
+    ...     return x * x
+    >>> fn = AsyncFunction(f, limit=2)
+    >>> print(asyncio.run(fn.gather([1, 2, 3])), fn.evaluations)
+    [1, 4, 9] 3
+    """
+
+    __slots__ = ("fn", "semaphore", "evaluations")
+
+    def __init__(
+        self, fn: AsyncNumericalMethod, limit: int | asyncio.Semaphore | None = None
+    ) -> None:
+        if isinstance(fn, AsyncFunction):
+            fn = fn.fn
+        if limit is not None and not isinstance(limit, asyncio.Semaphore):
+            if limit <= 0:
+                raise ValueError("Параметр limit должен быть положительным.")
+            limit = asyncio.Semaphore(limit)
+        self.fn = fn
+        self.semaphore = limit
+        self.evaluations = 0
+
+    async def __call__(self, x: Number) -> Number:
+        self.evaluations += 1
+        if self.semaphore is None:
+            return await self.fn(x)
+        async with self.semaphore:
+            return await self.fn(x)
+
+    async def gather(self, xs: Iterable[Number]) -> List[Number]:
+        """
+        Вычисляет функцию во всех точках xs одновременно (с учётом limit).
+        """
+        return await asyncio.gather(*(self(x) for x in xs))
+
+
+async def async_dichotomy(
+    fn: AsyncNumericalMethod,
+    a: Number,
+    b: Number,
+    eps: Number,
+    limit: int | asyncio.Semaphore | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Асинхронный вариант метода дихотомии (см. dichotomy): две пробные точки
+    итерации вычисляются одновременно, поэтому итерация занимает время одного
+    вызова функции.
+
+    Параметры:\n
+        fn (AsyncNumericalMethod): Асинхронная функция, для которой необходимо найти минимум.\n
+        a (Number): Левая граница интервала, в котором ищется минимум.\n
+        b (Number): Правая граница интервала, в котором ищется минимум.\n
+        eps (Number): Точность поиска (порог для завершения).\n
+        limit (int | asyncio.Semaphore | None): Ограничение одновременных вызовов
+                    (см. AsyncFunction).\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума (см. dichotomy).
+
+    Исключения:\n
+        ValueError: Если eps <= 0 (некорректное значение точности).
+
+    Примеры:
+    >>> async def f(x):
+    ...     return (x - 2) ** 2
+    >>> result = asyncio.run(async_dichotomy(f, 0, 4, 0.01))
+    >>> print(round(result.x, 2), result.n_fn)
+    2.0 21
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+
+    start = perf_counter()
+    fn = AsyncFunction(fn, limit)
+    k = 0
+    delta = eps / 4
+    while b - a > eps:
+        k += 1
+        alpha_x = (a + b) / 2 - delta
+        beta_x = (a + b) / 2 + delta
+        alpha_y, beta_y = await fn.gather((alpha_x, beta_x))
+        if alpha_y <= beta_y:
+            b = beta_x
+        else:
+            a = alpha_x
+
+    x_min = (a + b) / 2
+    return OptimizationResult(
+        x_min, await fn(x_min), n=k, n_fn=fn.evaluations, a=a, b=b,
+        time=perf_counter() - start,
+    )
+
+
+async def async_split_interval(
+    fn: AsyncNumericalMethod,
+    a: Number,
+    b: Number,
+    eps: Number,
+    limit: int | asyncio.Semaphore | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Асинхронный вариант метода деления интервала (см. split_interval): точки
+    четвертей интервала вычисляются одновременно.
+
+    Параметры:\n
+        fn (AsyncNumericalMethod): Асинхронная функция, для которой необходимо найти минимум.\n
+        a (Number): Левая граница интервала, в котором ищется минимум.\n
+        b (Number): Правая граница интервала, в котором ищется минимум.\n
+        eps (Number): Точность поиска (порог для завершения).\n
+        limit (int | asyncio.Semaphore | None): Ограничение одновременных вызовов
+                    (см. AsyncFunction).\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума (см. split_interval).
+
+    Исключения:\n
+        ValueError: Если eps <= 0 (некорректное значение точности).
+
+    Примеры:
+    >>> async def f(x):
+    ...     return (x - 4) ** 2
+    >>> result = asyncio.run(async_split_interval(f, 0, 10, 0.01))
+    >>> print(round(result.x, 2), result.n, result.n_fn)
+    4.0 10 22
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+
+    start = perf_counter()
+    fn = AsyncFunction(fn, limit)
+    k = 0
+    avg_x = (a + b) / 2
+    avg_y = await fn(avg_x)
+    while b - a > eps:
+        k += 1
+        alpha_x = a + (b - a) / 4
+        beta_x = b - (b - a) / 4
+        alpha_y, beta_y = await fn.gather((alpha_x, beta_x))
+        if alpha_y < avg_y:
+            b = avg_x
+            avg_x, avg_y = alpha_x, alpha_y
+        elif beta_y < avg_y:
+            a = avg_x
+            avg_x, avg_y = beta_x, beta_y
+        else:
+            a = alpha_x
+            b = beta_x
+
+    x_min = (a + b) / 2
+    return OptimizationResult(
+        x_min, await fn(x_min), n=k, n_fn=fn.evaluations, a=a, b=b,
+        time=perf_counter() - start,
+    )
+
+
+async def async_golden_ratio(
+    fn: AsyncNumericalMethod,
+    a: Number,
+    b: Number,
+    eps: Number,
+    limit: int | asyncio.Semaphore | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Асинхронный вариант метода золотого сечения (см. golden_ratio). Две начальные
+    пробные точки вычисляются одновременно; на каждой следующей итерации
+    вычисляется одна новая точка, поэтому выигрыш даёт прежде всего одновременное
+    выполнение нескольких поисков в одном цикле событий.
+
+    Параметры:\n
+        fn (AsyncNumericalMethod): Асинхронная функция, для которой необходимо найти минимум.\n
+        a (Number): Левая граница интервала, в котором ищется минимум.\n
+        b (Number): Правая граница интервала, в котором ищется минимум.\n
+        eps (Number): Точность поиска (порог для завершения).\n
+        limit (int | asyncio.Semaphore | None): Ограничение одновременных вызовов
+                    (см. AsyncFunction).\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума (см. golden_ratio).
+
+    Исключения:\n
+        ValueError: Если eps <= 0 (некорректное значение точности).
+
+    Примеры:
+    >>> async def f(x):
+    ...     return (x - 2) ** 2
+    >>> result = asyncio.run(async_golden_ratio(f, 0, 4, 0.01))
+    >>> print(round(result.x, 2), result.n_fn)
+    2.0 15
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+
+    start = perf_counter()
+    fn = AsyncFunction(fn, limit)
+    k = 0
+    alpha_x = a + (3 - sqrt(5)) / 2 * (b - a)
+    beta_x = a + (sqrt(5) - 1) / 2 * (b - a)
+    alpha_y, beta_y = await fn.gather((alpha_x, beta_x))
+    x, y = alpha_x, alpha_y
+    while b - a > eps:
+        k += 1
+        if alpha_y <= beta_y:
+            b = beta_x
+            x, y = alpha_x, alpha_y
+            beta_x, beta_y = alpha_x, alpha_y
+            alpha_x = a + b - alpha_x
+            alpha_y = await fn(alpha_x)
+        else:
+            a = alpha_x
+            x, y = beta_x, beta_y
+            alpha_x, alpha_y = beta_x, beta_y
+            beta_x = a + b - beta_x
+            beta_y = await fn(beta_x)
+
+    return OptimizationResult(
+        x, y, n=k, n_fn=fn.evaluations, a=a, b=b, time=perf_counter() - start
+    )
+
+
+async def async_uniform_brute_force(
+    fn: AsyncNumericalMethod,
+    interval: tuple[Number, Number],
+    L: Number,
+    eps: Number,
+    limit: int | asyncio.Semaphore | None = ASYNC_LIMIT,
+    chunk_size: int = ASYNC_CHUNK_SIZE,
+) -> OptimizationFnReturnValue:
+    """
+    Асинхронный вариант метода равномерного перебора (см. uniform_brute_force):
+    точки сетки вычисляются одновременно блоками по chunk_size штук, количество
+    одновременных вызовов ограничивается limit. При L = 0 функция вычисляется
+    только в середине и на концах интервала.
+
+    Параметры:\n
+        fn (AsyncNumericalMethod): Асинхронная функция, для которой необходимо найти минимум.\n
+        inerval (tuple[Number, Number]): Интервал, в котором ищется минимум.\n
+        L (Number): Константа Липшица.\n
+        eps (Number): Точность поиска.\n
+        limit (int | asyncio.Semaphore | None): Ограничение одновременных вызовов
+                    (см. AsyncFunction), по умолчанию ASYNC_LIMIT.\n
+        chunk_size (int): Максимальное количество точек, вычисляемых одним пакетом.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума (см. uniform_brute_force).
+
+    Исключения:\n
+        ValueError: Если eps <= 0, L < 0 или chunk_size <= 0.
+
+    Примеры:
+    >>> async def f(x):
+    ...     return (x - 3) ** 2
+    >>> result = asyncio.run(async_uniform_brute_force(f, (0, 6), L=6, eps=0.03, limit=8))
+    >>> print(round(result.x, 1), result.n_fn)
+    3.0 602
+    >>> async def g(x):
+    ...     return 1.0
+    >>> print(asyncio.run(async_uniform_brute_force(g, (0, 6), L=0, eps=0.03)).n_fn)
+    3
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+    if L < 0:
+        raise ValueError("Параметр L должен быть неотрицательным.")
+    if chunk_size <= 0:
+        raise ValueError("Параметр chunk_size должен быть положительным.")
+
+    start = perf_counter()
+    fn = AsyncFunction(fn, limit)
+    a, b = interval
+    h = 2 * eps / L if L > 0 else b - a
+
+    # Точки a + h / 2 + h * i, не выходящие за b, и концы интервала.
+    n = max(int((b - a - h / 2) // h) + 1, 0)
+    x_best, y_best = a, await fn(a)
+    for x in grid_chunks(a + h / 2, h, n, chunk_size):
+        for x_i, y_i in zip(x.tolist(), await fn.gather(x.tolist())):
+            if y_i < y_best:
+                x_best, y_best = x_i, y_i
+    y_b = await fn(b)
+    if y_b < y_best:
+        x_best, y_best = b, y_b
+
+    return OptimizationResult(
+        x_best, y_best, n=1, n_fn=fn.evaluations,
+        a=max(a, x_best - h), b=min(b, x_best + h), time=perf_counter() - start,
+    )
+
+
+if __name__ == "__main__":
+    # Функция имитирует обращение к удалённому сервису: каждый вызов ждёт 10 мс
+    async def remote_fn(x):
+        await asyncio.sleep(0.01)
+        return x**2 - 2 * x + 16 / (x - 1) - 13
+
+    async def main():
+        a, b = 2, 5
+        eps = 10**-3
+        for method in (async_dichotomy, async_split_interval, async_golden_ratio):
+            res = await method(remote_fn, a, b, eps)
+            print(f"{method.__name__}: x: {res.x}, N: {res.n_fn}, время: {res.time:.3f} с")
+
+        # Десять поисков в одном цикле событий с общим ограничением в 8 вызовов
+        limit = asyncio.Semaphore(8)
+        start = perf_counter()
+        results = await asyncio.gather(
+            *(async_dichotomy(remote_fn, a, b + i, eps, limit) for i in range(10))
+        )
+        print(f"10 поисков: {perf_counter() - start:.3f} с, x: {[round(r.x, 4) for r in results]}")
+
+        res = await async_uniform_brute_force(remote_fn, (a, b), L=10, eps=0.01, limit=64)
+        print(f"async_uniform_brute_force: x: {res.x}, N: {res.n_fn}, время: {res.time:.3f} с")
+
+    asyncio.run(main())
@@ -0,0 +1,275 @@
+from ...custom_types import Number, OptimizationFnReturnValue, OptimizationResult
+from typing import Callable
+from math import sqrt
+from time import perf_counter
+import numpy as np
+
+VectorizedMethod = Callable[..., np.ndarray]
+
+
+class _Lanes:
+    """
+    Состояние пакета независимых полос (интервалов).
+
+    Хранит массивы только для ещё не сошедшихся полос и номера этих полос
+    в исходном пакете; сошедшиеся полосы переносятся в итоговые массивы.
+    """
+
+    def __init__(self, fn, a, b, eps, indexed):
+        a = np.array(a, dtype=float)
+        b = np.array(b, dtype=float)
+        if a.ndim != 1 or a.shape != b.shape:
+            raise ValueError("Параметры a и b должны быть одномерными массивами одной длины.")
+        eps = np.broadcast_to(np.asarray(eps, dtype=float), a.shape).copy()
+        if np.any(eps <= 0):
+            raise ValueError("Параметр eps должен быть положительным.")
+
+        self.fn = fn
+        self.indexed = indexed
+        self.size = a.size
+        self.lanes = np.arange(a.size)
+        self.a, self.b, self.eps = a, b, eps
+        self.out_a, self.out_b = np.empty(a.size), np.empty(a.size)
+        self.out_x = np.empty(a.size)
+        self.out_n = np.zeros(a.size, dtype=int)
+        self.n_fn = 0
+
+    def __call__(self, x, lanes=None):
+        lanes = self.lanes if lanes is None else lanes
+        self.n_fn += x.size
+        if self.indexed:
+            return np.asarray(self.fn(x, lanes), dtype=float)
+        return np.asarray(self.fn(x), dtype=float)
+
+    def retire(self, done, x_min, n, **state):
+        """
+        Переносит полосы с done = True в итоговые массивы и исключает их
+        из state (словаря массивов, которые нужно сжать вместе с полосами).
+        """
+        lanes = self.lanes[done]
+        self.out_a[lanes] = self.a[done]
+        self.out_b[lanes] = self.b[done]
+        self.out_x[lanes] = x_min[done]
+        self.out_n[lanes] = n
+        keep = ~done
+        self.lanes = self.lanes[keep]
+        self.a, self.b, self.eps = self.a[keep], self.b[keep], self.eps[keep]
+        return {key: value[keep] for key, value in state.items()}
+
+    def result(self, start, y=None):
+        if y is None:
+            y = self(self.out_x, np.arange(self.size))
+        return OptimizationResult(
+            self.out_x, y, n=int(self.out_n.max(initial=0)), n_fn=self.n_fn,
+            a=self.out_a, b=self.out_b, time=perf_counter() - start,
+            info={"iterations": self.out_n},
+        )
+
+
+def batched_dichotomy(
+    fn: VectorizedMethod,
+    a: np.ndarray,
+    b: np.ndarray,
+    eps: Number | np.ndarray,
+    indexed: bool = False,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимумы функции методом дихотомии сразу на множестве интервалов.
+
+    Все полосы (пары a[i], b[i]) обрабатываются одновременно: за итерацию
+    функция вызывается один раз на массиве пробных точек всех ещё не сошедшихся
+    полос, а сошедшиеся полосы исключаются из дальнейших вычислений.
+
+    Параметры:\n
+        fn (VectorizedMethod): Векторизованная функция. При indexed = False вызывается
+                               как fn(x), при indexed = True — как fn(x, lanes), где
+                               lanes — номера полос, которым соответствуют точки x.\n
+        a (np.ndarray): Левые границы интервалов.\n
+        b (np.ndarray): Правые границы интервалов.\n
+        eps (Number | np.ndarray): Точность поиска, общая или для каждой полосы.\n
+        indexed (bool): Зависит ли функция от номера полосы.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                    Поля x, y, a, b — массивы по всем полосам.
+                    Поле n — наибольшее количество итераций среди полос.
+                    Поле info['iterations'] — количество итераций каждой полосы.
+                    Остальные поля описаны в OptimizationResult.
+
+    Исключения:\n
+        ValueError: Если eps <= 0 или a и b — не одномерные массивы одной длины.
+
+    Примеры:
+    >>> import numpy as np
+    >>> result = batched_dichotomy(lambda x: (x - 2) ** 2, np.zeros(3), np.full(3, 4.0), 0.01)
+    >>> print(np.round(result.x, 2))
+    [2. 2. 2.]
+    """
+    start = perf_counter()
+    fn = _Lanes(fn, a, b, eps, indexed)
+    k = 0
+    while True:
+        done = fn.b - fn.a <= fn.eps
+        if done.any():
+            fn.retire(done, (fn.a + fn.b) / 2, k)
+        if fn.lanes.size == 0:
+            return fn.result(start)
+
+        k += 1
+        delta = fn.eps / 4
+        mid = (fn.a + fn.b) / 2
+        y = fn(np.concatenate((mid - delta, mid + delta)), np.tile(fn.lanes, 2))
+        alpha_y, beta_y = np.split(y, 2)
+        left = alpha_y <= beta_y
+        fn.a, fn.b = np.where(left, fn.a, mid - delta), np.where(left, mid + delta, fn.b)
+
+
+def batched_golden_ratio(
+    fn: VectorizedMethod,
+    a: np.ndarray,
+    b: np.ndarray,
+    eps: Number | np.ndarray,
+    indexed: bool = False,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимумы функции методом золотого сечения сразу на множестве интервалов.
+
+    За итерацию в каждой активной полосе вычисляется одна новая точка, поэтому
+    функция вызывается один раз на массиве длины числа активных полос.
+
+    Параметры:\n
+        fn (VectorizedMethod): Векторизованная функция (см. batched_dichotomy).\n
+        a (np.ndarray): Левые границы интервалов.\n
+        b (np.ndarray): Правые границы интервалов.\n
+        eps (Number | np.ndarray): Точность поиска, общая или для каждой полосы.\n
+        indexed (bool): Зависит ли функция от номера полосы.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума (см. batched_dichotomy).
+
+    Исключения:\n
+        ValueError: Если eps <= 0 или a и b — не одномерные массивы одной длины.
+
+    Примеры:
+    >>> import numpy as np
+    >>> result = batched_golden_ratio(lambda x: (x - 2) ** 2, np.zeros(3), np.full(3, 4.0), 0.01)
+    >>> print(np.round(result.x, 2))
+    [2. 2. 2.]
+    """
+    start = perf_counter()
+    fn = _Lanes(fn, a, b, eps, indexed)
+    out_y = np.empty(fn.size)
+
+    alpha_x = fn.a + (3 - sqrt(5)) / 2 * (fn.b - fn.a)
+    beta_x = fn.a + (sqrt(5) - 1) / 2 * (fn.b - fn.a)
+    alpha_y, beta_y = np.split(fn(np.concatenate((alpha_x, beta_x)), np.tile(fn.lanes, 2)), 2)
+    x, y = alpha_x, alpha_y
+    k = 0
+    while True:
+        done = fn.b - fn.a <= fn.eps
+        if done.any():
+            out_y[fn.lanes[done]] = y[done]
+            alpha_x, alpha_y, beta_x, beta_y, x, y = fn.retire(
+                done, x, k, alpha_x=alpha_x, alpha_y=alpha_y,
+                beta_x=beta_x, beta_y=beta_y, x=x, y=y,
+            ).values()
+        if fn.lanes.size == 0:
+            return fn.result(start, out_y)
+
+        k += 1
+        left = alpha_y <= beta_y
+        fn.a = np.where(left, fn.a, alpha_x)
+        fn.b = np.where(left, beta_x, fn.b)
+        # Лучшая из пробных точек остаётся внутри нового интервала,
+        # вторая пробная точка симметрична ей.
+        x = np.where(left, alpha_x, beta_x)
+        y = np.where(left, alpha_y, beta_y)
+        new_x = fn.a + fn.b - x
+        new_y = fn(new_x)
+        alpha_x, alpha_y = np.where(left, new_x, x), np.where(left, new_y, y)
+        beta_x, beta_y = np.where(left, x, new_x), np.where(left, y, new_y)
+
+
+def batched_fibonacci(
+    fn: VectorizedMethod,
+    a: np.ndarray,
+    b: np.ndarray,
+    eps: Number | np.ndarray,
+    indexed: bool = False,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимумы функции методом Фибоначчи сразу на множестве интервалов.
+
+    Число итераций m для каждой полосы определяется заранее по (b - a) / eps,
+    полосы с меньшим m выбывают раньше остальных.
+
+    Параметры:\n
+        fn (VectorizedMethod): Векторизованная функция (см. batched_dichotomy).\n
+        a (np.ndarray): Левые границы интервалов.\n
+        b (np.ndarray): Правые границы интервалов.\n
+        eps (Number | np.ndarray): Точность поиска, общая или для каждой полосы.\n
+        indexed (bool): Зависит ли функция от номера полосы.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума (см. batched_dichotomy).
+
+    Исключения:\n
+        ValueError: Если eps <= 0 или a и b — не одномерные массивы одной длины.
+
+    Примеры:
+    >>> import numpy as np
+    >>> result = batched_fibonacci(lambda x: (x - 2) ** 2, np.zeros(3), np.full(3, 4.0), 0.01)
+    >>> print(np.round(result.x, 2))
+    [2. 2. 2.]
+    """
+    start = perf_counter()
+    fn = _Lanes(fn, a, b, eps, indexed)
+
+    # Числа Фибоначчи F_0 = F_1 = 1, ... до первого, не меньшего max((b - a) / eps).
+    ratio = (fn.b - fn.a) / fn.eps
+    fib = [1, 1, 2]
+    while fib[-1] < ratio.max(initial=0):
+        fib.append(fib[-1] + fib[-2])
+    fib = np.array(fib, dtype=float)
+    # m — номер, для которого F_m < (b - a) / eps <= F_{m+1}, как в fibonacci.
+    m = np.clip(np.searchsorted(fib, ratio, side="left") - 1, 1, fib.size - 2)
+
+    alpha_x = fn.a + fib[m - 1] / fib[m + 1] * (fn.b - fn.a)
+    beta_x = fn.a + fn.b - alpha_x
+    alpha_y, beta_y = np.split(fn(np.concatenate((alpha_x, beta_x)), np.tile(fn.lanes, 2)), 2)
+    k = 1
+    while True:
+        done = k >= m - 1
+        if done.any():
+            alpha_x, alpha_y, beta_x, beta_y, m = fn.retire(
+                done, (fn.a + fn.b) / 2, k, alpha_x=alpha_x, alpha_y=alpha_y,
+                beta_x=beta_x, beta_y=beta_y, m=m,
+            ).values()
+        if fn.lanes.size == 0:
+            return fn.result(start)
+
+        left = alpha_y <= beta_y
+        fn.a = np.where(left, fn.a, alpha_x)
+        fn.b = np.where(left, beta_x, fn.b)
+        x = np.where(left, alpha_x, beta_x)
+        y = np.where(left, alpha_y, beta_y)
+        new_x = fn.a + fn.b - x
+        new_y = fn(new_x)
+        alpha_x, alpha_y = np.where(left, new_x, x), np.where(left, new_y, y)
+        beta_x, beta_y = np.where(left, x, new_x), np.where(left, y, new_y)
+        k += 1
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    size = 100000
+    shift = rng.uniform(2, 5, size)
+    fn = lambda x, lanes: (x - shift[lanes]) ** 2
+    a, b = np.zeros(size), np.full(size, 8.0)
+    eps = 10**-3
+    for method in (batched_dichotomy, batched_golden_ratio, batched_fibonacci):
+        res = method(fn, a, b, eps, indexed=True)
+        print(
+            f"{method.__name__}: max |x - x*|: {np.abs(res.x - shift).max():.2e}, "
+            f"iterations: {res.n}, N: {res.n_fn}, time: {res.time:.3f}"
+        )
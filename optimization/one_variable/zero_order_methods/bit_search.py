@@ -0,0 +1,114 @@
+from ...custom_types import Number, NumericalMethod, OptimizationFnReturnValue
+from ...cached_function import Budget
+from .compiled import kernel_search
+from ...stepper import State, Stepper
+
+
+def bit_search(
+    fn: NumericalMethod,
+    a: Number,
+    b: Number,
+    eps: Number,
+    max_evals: int | None = None,
+    deadline: float | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимум функции с помощью метода поразрядного поиска.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        a (Number): Левая граница интервала, в котором ищется минимум.\n
+        b (Number): Правая граница интервала, в котором ищется минимум.\n
+        eps (Number): Точность поиска (порог для завершения).\n
+        max_evals (int | None): Максимальное количество вычислений функции.\n
+        deadline (float | None): Ограничение времени работы в секундах.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                                Поле x — значение аргумента, при котором достигается минимум.
+                                Поле y — значение функции в точке минимума.
+                                Остальные поля описаны в OptimizationResult.
+
+    Если исчерпан лимит max_evals или deadline, возвращается лучшая из вычисленных точек
+    и исходный интервал с converged=False и status=BUDGET_EXHAUSTED.
+
+    Если max_evals и deadline не заданы, поиск выполняется ядром метода без обёртки
+    CachedFunction (см. kernel_search); если при этом установлен Numba и fn скомпилирована
+    с помощью numba.njit, ядро компилируется целиком. С лимитами итерации выполняет
+    BitSearchStepper (см. Stepper.run_budgeted).
+
+    Исключения:\n
+        ValueError: Если eps <= 0 (некорректное значение точности).
+
+    Примеры:
+    >>> def f(x):
+    ...     return (x - 3) ** 2
+    >>> result = bit_search(f, 0, 6, 0.01)
+    >>> print(result.x, result.y)
+    3.0 0.0
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+    budget = Budget.create(max_evals, deadline)
+    if budget is None:
+        return kernel_search("bit_search", fn, a, b, eps)
+    return BitSearchStepper.run_budgeted(fn, budget, a, b, eps)
+
+
+class BitSearchStepper(Stepper):
+    """
+    Пошаговый вариант метода поразрядного поиска (см. bit_search и Stepper).
+
+    Состояние: исходный интервал a, b, точность eps, шаг h и текущая точка x
+    со значением y. Одна итерация — один шаг по сетке. После завершения a, b —
+    итоговый интервал x ± |h|.
+
+    Примеры:
+    >>> stepper = BitSearchStepper(lambda x: (x - 2) ** 2, 0, 4, 0.01)
+    >>> result = stepper.run()
+    >>> print(result.x, result.y)
+    2.0 0.0
+    """
+
+    __slots__ = ()
+
+    def __init__(self, fn: NumericalMethod, a: Number, b: Number, eps: Number) -> None:
+        if eps <= 0:
+            raise ValueError("Параметр eps должен быть положительным.")
+        super().__init__(fn, a=a, b=b, eps=eps, h=(b - a) / 4, x=a)
+
+    def _initialize(self, state: State) -> None:
+        state["y"] = self.evaluate(state["x"])
+
+    def _step(self, state: State) -> None:
+        state["k"] += 1
+        a, b, h = state["a"], state["b"], state["h"]
+        x_0, y_0 = state["x"], state["y"]
+        x_1 = x_0 + h
+        y_1 = self.evaluate(x_1)
+        if y_0 > y_1:
+            x_0, y_0 = x_1, y_1
+            if a < x_0 < b:
+                state["x"], state["y"] = x_0, y_0
+                return
+        if x_0 <= a:
+            h /= 4
+            x_0 = a + h
+        elif x_1 >= b:
+            h = -h / 4
+            x_0 = b + h
+        if abs(h) <= state["eps"]:
+            state["x"], state["y"] = x_0, self.evaluate(x_0)
+            state["a"], state["b"] = x_0 - abs(h), x_0 + abs(h)
+            state["done"] = state["converged"] = True
+        else:
+            state["x"], state["y"] = x_1, y_1
+            state["h"] = -h / 4
+
+
+if __name__ == "__main__":
+    input_fn = lambda x: x**2 - 2 * x + 16 / (x - 1) - 13
+    a, b = 2, 5
+    eps = 10**-3
+    res = bit_search(input_fn, a, b, eps)
+    print(f"x: {res['x']}, y: {res['y']}")
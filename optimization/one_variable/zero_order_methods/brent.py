@@ -0,0 +1,261 @@
+from ...custom_types import Number, NumericalMethod, OptimizationFnReturnValue, OptimizationResult
+from ...cached_function import Budget, BudgetExhausted, budgeted, evaluations
+from ...stepper import State, Stepper
+from time import perf_counter
+from math import sqrt
+
+# Доля золотого сечения для резервного шага и относительная точность,
+# ниже которой шаги не имеют смысла из-за округления
+GOLDEN = (3 - sqrt(5)) / 2
+SQRT_EPS = sqrt(2.2e-16)
+
+
+def brent(
+    fn: NumericalMethod,
+    a: Number,
+    b: Number,
+    eps: Number,
+    max_iterations: int = 500,
+    max_evals: int | None = None,
+    deadline: float | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимум функции комбинированным методом Брента.
+
+    На каждой итерации строится парабола по трём лучшим точкам (как в методе
+    параболической аппроксимации). Её вершина принимается, только если она лежит
+    внутри текущего интервала, не слишком близко к его границам и шаг меньше
+    половины позапрошлого; иначе выполняется шаг золотого сечения в большую
+    из частей интервала. Поэтому интервал [a, b] всегда содержит минимум
+    унимодальной функции, метод детерминирован и на гладких функциях сходится
+    сверхлинейно, а в худшем случае — не медленнее золотого сечения.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        a (Number): Левая граница интервала, в котором ищется минимум.\n
+        b (Number): Правая граница интервала, в котором ищется минимум.\n
+        eps (Number): Точность поиска: найденная точка отстоит от границ
+                      итогового интервала не более чем на eps / 2 (плюс
+                      относительная погрешность округления порядка 1e-8 * |x|).\n
+        max_iterations (int): Максимальное количество итераций.\n
+        max_evals (int | None): Максимальное количество вычислений функции.\n
+        deadline (float | None): Ограничение времени работы в секундах.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                    Поле x — значение аргумента, при котором достигается минимум.
+                    Поле y — значение функции в точке минимума.
+                    Поля a, b — итоговый интервал.
+                    Поле info['parabolic'] — количество принятых параболических шагов.
+                    Остальные поля описаны в OptimizationResult.
+
+    Если метод не сошелся за max_iterations итераций, возвращается лучшая из
+    найденных точек с converged=False.
+
+    Если исчерпан лимит max_evals или deadline, возвращается лучшая из вычисленных точек
+    и текущий интервал с converged=False и status=BUDGET_EXHAUSTED.
+
+    Исключения:\n
+        ValueError: Если eps <= 0 (некорректное значение точности) или a >= b.
+
+    Примеры:
+    >>> def f(x):
+    ...     return (x - 2) ** 2
+    >>> result = brent(f, 0, 4, 0.01)
+    >>> print(round(result.x, 6), round(result.y, 6))
+    2.0 0.0
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+    if a >= b:
+        raise ValueError("Левая граница интервала должна быть меньше правой.")
+
+    start = perf_counter()
+    budget = Budget.create(max_evals, deadline)
+    fn = budgeted(fn, budget, observe=True)
+    # x — лучшая точка, w — вторая по значению, v — предыдущее значение w
+    x = w = v = a + GOLDEN * (b - a)
+    step = prev_step = 0.0
+    parabolic = 0
+    k = 0
+    try:
+        y = y_w = y_v = fn(x)
+
+        for k in range(max_iterations):
+            mid = (a + b) / 2
+            tol = SQRT_EPS * abs(x) + eps / 4
+            if abs(x - mid) <= 2 * tol - (b - a) / 2:
+                return OptimizationResult(
+                    x, y, n=k, n_fn=evaluations(fn, k + 1), a=a, b=b,
+                    time=perf_counter() - start, info={"parabolic": parabolic},
+                )
+
+            golden = True
+            if abs(prev_step) > tol:
+                # Вершина параболы через x, w, v: x + p / q
+                r = (x - w) * (y - y_v)
+                q = (x - v) * (y - y_w)
+                p = (x - v) * q - (x - w) * r
+                q = 2 * (q - r)
+                if q > 0:
+                    p = -p
+                q = abs(q)
+                if abs(p) < abs(q * prev_step / 2) and q * (a - x) < p < q * (b - x):
+                    prev_step, step = step, p / q
+                    u = x + step
+                    # Не вычисляем функцию слишком близко к границам интервала
+                    if u - a < 2 * tol or b - u < 2 * tol:
+                        step = tol if x < mid else -tol
+                    golden = False
+                    parabolic += 1
+            if golden:
+                prev_step = (a if x >= mid else b) - x
+                step = GOLDEN * prev_step
+
+            # Шаг не меньше tol, иначе новое значение не отличается от y из-за округления
+            u = x + (step if abs(step) >= tol else (tol if step > 0 else -tol))
+            y_u = fn(u)
+
+            if y_u <= y:
+                if u >= x:
+                    a = x
+                else:
+                    b = x
+                v, y_v = w, y_w
+                w, y_w = x, y
+                x, y = u, y_u
+            else:
+                if u < x:
+                    a = u
+                else:
+                    b = u
+                if y_u <= y_w or w == x:
+                    v, y_v = w, y_w
+                    w, y_w = u, y_u
+                elif y_u <= y_v or v == x or v == w:
+                    v, y_v = u, y_u
+        else:
+            return OptimizationResult(
+                x, y, n=max_iterations, n_fn=evaluations(fn, max_iterations + 1), a=a, b=b,
+                converged=False, time=perf_counter() - start, info={"parabolic": parabolic},
+            )
+    except BudgetExhausted:
+        return budget.result(
+            x, n=k, n_fn=fn.evaluations, a=a, b=b, time=perf_counter() - start,
+            info={"parabolic": parabolic},
+        )
+
+
+class BrentStepper(Stepper):
+    """
+    Пошаговый вариант метода Брента (см. brent и Stepper).
+
+    Состояние: текущий интервал a, b, лучшая точка x, вторая по значению w,
+    предыдущее значение w — v (со значениями y, y_w, y_v), последние шаги step
+    и prev_step, количество параболических шагов parabolic, точность eps
+    и лимит итераций max_iterations.
+
+    Примеры:
+    >>> stepper = BrentStepper(lambda x: (x - 2) ** 2, 0, 4, 0.01)
+    >>> result = stepper.run()
+    >>> print(round(result.x, 6), round(result.y, 6))
+    2.0 0.0
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self, fn: NumericalMethod, a: Number, b: Number, eps: Number, max_iterations: int = 500
+    ) -> None:
+        if eps <= 0:
+            raise ValueError("Параметр eps должен быть положительным.")
+        if a >= b:
+            raise ValueError("Левая граница интервала должна быть меньше правой.")
+        x = a + GOLDEN * (b - a)
+        super().__init__(
+            fn, a=a, b=b, eps=eps, max_iterations=max_iterations,
+            x=x, w=x, v=x, step=0.0, prev_step=0.0, parabolic=0,
+        )
+
+    def _initialize(self, state: State) -> None:
+        state["y"] = state["y_w"] = state["y_v"] = self.evaluate(state["x"])
+        self._check(state)
+
+    def _step(self, state: State) -> None:
+        a, b = state["a"], state["b"]
+        x, w, v = state["x"], state["w"], state["v"]
+        y, y_w, y_v = state["y"], state["y_w"], state["y_v"]
+        step, prev_step = state["step"], state["prev_step"]
+        mid = (a + b) / 2
+        tol = SQRT_EPS * abs(x) + state["eps"] / 4
+
+        golden = True
+        if abs(prev_step) > tol:
+            r = (x - w) * (y - y_v)
+            q = (x - v) * (y - y_w)
+            p = (x - v) * q - (x - w) * r
+            q = 2 * (q - r)
+            if q > 0:
+                p = -p
+            q = abs(q)
+            if abs(p) < abs(q * prev_step / 2) and q * (a - x) < p < q * (b - x):
+                prev_step, step = step, p / q
+                u = x + step
+                if u - a < 2 * tol or b - u < 2 * tol:
+                    step = tol if x < mid else -tol
+                golden = False
+                state["parabolic"] += 1
+        if golden:
+            prev_step = (a if x >= mid else b) - x
+            step = GOLDEN * prev_step
+
+        u = x + (step if abs(step) >= tol else (tol if step > 0 else -tol))
+        y_u = self.evaluate(u)
+
+        if y_u <= y:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, y_v = w, y_w
+            w, y_w = x, y
+            x, y = u, y_u
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if y_u <= y_w or w == x:
+                v, y_v = w, y_w
+                w, y_w = u, y_u
+            elif y_u <= y_v or v == x or v == w:
+                v, y_v = u, y_u
+
+        state.update(a=a, b=b, x=x, w=w, v=v, y=y, y_w=y_w, y_v=y_v)
+        state["step"], state["prev_step"] = step, prev_step
+        state["k"] += 1
+        self._check(state)
+
+    def _check(self, state: State) -> None:
+        a, b, x = state["a"], state["b"], state["x"]
+        tol = SQRT_EPS * abs(x) + state["eps"] / 4
+        if abs(x - (a + b) / 2) <= 2 * tol - (b - a) / 2:
+            state["done"] = state["converged"] = True
+        elif state["k"] >= state["max_iterations"]:
+            state["done"] = True
+
+    def result(self) -> OptimizationResult:
+        res = super().result()
+        res.info["parabolic"] = self.state["parabolic"]
+        return res
+
+
+if __name__ == "__main__":
+    from .golden_ratio import golden_ratio
+
+    input_fn = lambda x: x**2 - 2 * x + 16 / (x - 1) - 13
+    a, b = 2, 5
+    eps = 10**-6
+    for method in (brent, golden_ratio):
+        res = method(input_fn, a, b, eps)
+        print(f"{method.__name__}: x: {res.x}, y: {res.y}, N: {res.n_fn}")
@@ -0,0 +1,563 @@
+# from scipy.misc import derivative
+# from math import cos
+# import numpy as np
+
+# def my_func(x):
+#    return cos(x) / x**2
+
+# def lipschitz_constant(f, interval, num_points=1000):
+#     a, b = interval
+
+#     x_vals = np.linspace(a, b, num_points)
+
+#     derivatives = [abs(derivative(f, x, dx=1e-6)) for x in x_vals]
+
+#     L = max(derivatives)
+
+#     return L
+
+
+# def uniform_search(f, interval, epsilon):
+#     a, b = interval
+#     n = int((b - a) / epsilon) + 1
+
+#     x_vals = np.linspace(a, b, n)
+
+#     f_vals = [f(x) for x in x_vals]
+
+#     min_index = np.argmin(f_vals)
+#     x_min = x_vals[min_index]
+#     f_min = f_vals[min_index]
+
+#     return x_min, f_min
+
+
+# def broken_line_method(f, interval, L, epsilon, max_iter=1000):
+#     a, b = interval
+#     x0 = (f(a) - f(b) + L*(a + b)) / (2 * L)
+#     y0 = (f(a) + f(b) + L*(a - b)) / 2
+#     values = []
+#     fx = 0
+
+#     for _ in range(max_iter):
+#         (x, p) = get_min_p(values) if values else (x0, y0)
+#         fx = f(x)
+
+#         delta = (fx - p) / (2 * L)
+
+#         if delta < epsilon:
+#             return (x, fx)
+#         else:
+#             p = (fx + p) / 2
+#             x1 = x - delta
+#             x2 = x + delta
+
+#             values = [(xi, pi) for (xi, pi) in values if xi != x]
+#             values.append((x1, p))
+#             values.append((x2, p))
+
+#     return None
+
+
+# def get_min_p(values):
+#     min_x, min_p = min(values, key=lambda item: item[1])
+#     return min_x, min_p
+
+# interval = (9, 11)
+# epsilon = 3e-2
+# L = lipschitz_constant(my_func, interval)
+
+
+# res1 = broken_line_method(my_func, interval, L, epsilon)
+
+# print('-------------------')
+# print('Метод ломанных:')
+# if res1:
+#    print(res1)
+# else:
+#     print("Метод не сошелся за заданное число операций")
+
+# print('-------------------')
+
+# print('Метод перебора:')
+# res2 = uniform_search(my_func, interval, epsilon)
+# print(res2)
+# print('-------------------')
+
+
+from ...custom_types import Number, NumericalMethod, OptimizationFnReturnValue, OptimizationResult
+from ...cached_function import Budget, BudgetExhausted, CachedFunction
+from ...stepper import State, Stepper
+from .lipschitz_constant import lipschitz_constant
+from .uniform_brute_force import uniform_brute_force
+from time import perf_counter
+from typing import Sequence, Tuple
+import heapq
+import numpy as np
+
+
+def broken_line(
+    fn: NumericalMethod,
+    interval: tuple[Number, Number],
+    L: Number,
+    eps: Number,
+    max_evals: int | None = None,
+    deadline: float | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимум функции с помощью метода ломаных.
+
+    Вершины ломаной хранятся в куче по нижней оценке p, поэтому выбор очередной
+    вершины стоит O(log n). Вершины, нижняя оценка которых выше лучшего
+    найденного значения функции, отбрасываются.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        inerval (tuple[Number, Number]): Интервал, в котором ищется минимум.\n
+        L (Number): Константа Липшица.\n
+        eps (Number): Точность поиска.\n
+        max_evals (int | None): Максимальное количество вычислений функции.\n
+        deadline (float | None): Ограничение времени работы в секундах.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                                Поле x — значение аргумента, при котором достигается минимум.
+                                Поле y — значение функции в точке минимума.
+                                Поле n_fn — общее количество вызовов целевой функции.
+                                Поле info['vertices'] — количество вершин ломаной в очереди.
+                                Остальные поля описаны в OptimizationResult.
+
+    Если исчерпан лимит max_evals или deadline, возвращается лучшая из вычисленных точек
+    и исходный интервал с converged=False и status=BUDGET_EXHAUSTED.
+
+    Исключения:\n
+        ValueError: Если eps <= 0 (некорректное значение точности).
+
+    Примеры:
+    >>> def f(x):
+    ...     return (x - 3) ** 2
+    >>> result = broken_line(f, interval=(0, 6), L=6, eps=10e-3)
+    >>> print(round(result.x, 2), round(result.y, 4))
+    3.0 0.0
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+
+    start = perf_counter()
+    budget = Budget.create(max_evals, deadline)
+    if budget is not None:
+        fn = CachedFunction(fn, maxsize=0, budget=budget, observe=True)
+    a, b = interval
+    try:
+        y_a, y_b = fn(a), fn(b)
+        N = 2
+        x_best, y_best = (a, y_a) if y_a <= y_b else (b, y_b)
+        x_0 = (y_a - y_b + L * (a + b)) / (2 * L)
+        p_0 = (y_a + y_b + L * (a - b)) / 2
+        vertices = []
+        live = 16
+
+        # 1 step
+        y_0 = fn(x_0)
+        N += 1
+        if y_0 < y_best:
+            x_best, y_best = x_0, y_0
+        delta = (y_0 - p_0) / (2 * L)
+        x_1 = x_0 - delta
+        x_2 = x_0 + delta
+        p = (y_0 + p_0) / 2
+        heapq.heappush(vertices, (p, x_1))
+        x_0, p_0 = x_2, p
+
+        while True:
+            y_0 = fn(x_0)
+            N += 1
+            if y_0 < y_best:
+                x_best, y_best = x_0, y_0
+            delta = (y_0 - p_0) / (2 * L)
+            if 2 * L * delta <= eps:
+                return OptimizationResult(
+                    x_0, y_0, n=N - 2, n_fn=N, time=perf_counter() - start,
+                    info={"vertices": len(vertices)},
+                )
+            x_1 = x_0 - delta
+            x_2 = x_0 + delta
+            p = (y_0 + p_0) / 2
+            if p <= y_best:
+                heapq.heappush(vertices, (p, x_1))
+                heapq.heappush(vertices, (p, x_2))
+
+            # Отбрасываем вершины, оценка которых хуже найденного значения.
+            if len(vertices) > 2 * live:
+                vertices = [vertex for vertex in vertices if vertex[0] <= y_best]
+                heapq.heapify(vertices)
+                live = max(len(vertices), 16)
+
+            while vertices and vertices[0][0] > y_best:
+                heapq.heappop(vertices)
+            if not vertices:
+                return OptimizationResult(
+                    x_best, y_best, n=N - 2, n_fn=N, time=perf_counter() - start,
+                    info={"vertices": 0},
+                )
+            p_0, x_0 = heapq.heappop(vertices)
+    except BudgetExhausted:
+        return budget.result(
+            n=max(fn.evaluations - 2, 0), n_fn=fn.evaluations, a=a, b=b,
+            time=perf_counter() - start,
+        )
+
+
+class TrialPoints:
+    """
+    Упорядоченные точки испытаний метода ломаных с локальными оценками константы
+    Липшица (см. adaptive_broken_line).
+
+    Точки, значения функции, длины отрезков dx и наклоны mu на них хранятся в
+    заранее выделенных массивах NumPy, ёмкость которых удваивается при заполнении.
+    Новая точка вставляется сдвигом хвоста массивов, а у разделённого отрезка
+    пересчитываются только две длины и два наклона; номер лучшей точки
+    поддерживается при вставке.
+
+    Примеры:
+    >>> trials = TrialPoints([0, 6], [9, 9])
+    >>> trials.insert(0, 3.0, 0.0)
+    >>> print(trials.x[:trials.size], trials.mu[:trials.size - 1], trials.best)
+    [0. 3. 6.] [3. 3.] 1
+    """
+
+    __slots__ = ("x", "z", "dx", "mu", "size", "best")
+
+    def __init__(self, x: Sequence[Number], z: Sequence[Number], capacity: int = 64) -> None:
+        n = len(x)
+        capacity = max(capacity, n)
+        self.x, self.z = np.empty(capacity), np.empty(capacity)
+        self.dx, self.mu = np.empty(capacity), np.empty(capacity)
+        self.x[:n], self.z[:n] = x, z
+        self.dx[:n - 1] = np.diff(self.x[:n])
+        self.mu[:n - 1] = np.abs(np.diff(self.z[:n])) / self.dx[:n - 1]
+        self.size = n
+        self.best = int(np.argmin(self.z[:n]))
+
+    def _grow(self) -> None:
+        for name in self.__slots__[:4]:
+            values = getattr(self, name)
+            grown = np.empty(2 * values.size)
+            grown[:values.size] = values
+            setattr(self, name, grown)
+
+    def insert(self, t: int, x: Number, z: Number) -> None:
+        """
+        Вставляет точку x со значением z между точками с номерами t и t + 1.
+        """
+        n = self.size
+        if n == self.x.size:
+            self._grow()
+        self.x[t + 2:n + 1] = self.x[t + 1:n]
+        self.z[t + 2:n + 1] = self.z[t + 1:n]
+        self.dx[t + 2:n] = self.dx[t + 1:n - 1]
+        self.mu[t + 2:n] = self.mu[t + 1:n - 1]
+        self.x[t + 1], self.z[t + 1] = x, z
+        for i in (t, t + 1):
+            self.dx[i] = self.x[i + 1] - self.x[i]
+            self.mu[i] = abs(self.z[i + 1] - self.z[i]) / self.dx[i]
+        self.size = n + 1
+        if self.best > t:
+            self.best += 1
+        if z < self.z[self.best]:
+            self.best = t + 1
+
+    def select(self, r: Number, xi: Number) -> Tuple[int, float, float]:
+        """
+        Выбирает отрезок с наименьшей нижней оценкой функции.
+
+        Возвращает:\n
+            Tuple[int, float, float]: Номер t левого конца отрезка, новую точку испытания
+                                      на нём и длину отрезка dx_t для критерия остановки.
+        """
+        n = self.size
+        x, z, dx, mu = self.x[:n], self.z[:n], self.dx[:n - 1], self.mu[:n - 1]
+
+        # Локальная оценка: наклоны на отрезке и его соседях плюс вклад
+        # глобальной оценки, пропорциональный длине отрезка.
+        lam = mu.copy()
+        np.maximum(lam[1:], mu[:-1], out=lam[1:])
+        np.maximum(lam[:-1], mu[1:], out=lam[:-1])
+        m = mu.max() * dx / dx.max()
+        np.maximum(m, lam, out=m)
+        np.maximum(m, xi, out=m)
+        m *= r
+
+        R = (z[1:] + z[:-1]) / 2 - m * dx / 2
+        t = int(np.argmin(R))
+        x_new = float((x[t + 1] + x[t]) / 2 - (z[t + 1] - z[t]) / (2 * m[t]))
+        return t, x_new, float(dx[t])
+
+    def neighbourhood(self) -> Tuple[float, float, float, float]:
+        """
+        Возвращает лучшую точку, значение в ней и соседние точки испытаний.
+        """
+        i, n = self.best, self.size
+        return (
+            float(self.x[i]), float(self.z[i]),
+            float(self.x[max(i - 1, 0)]), float(self.x[min(i + 1, n - 1)]),
+        )
+
+
+def adaptive_broken_line(
+    fn: NumericalMethod,
+    interval: tuple[Number, Number],
+    eps: Number,
+    r: Number = 1.5,
+    xi: Number = 1e-8,
+    L: Number | None = None,
+    max_iterations: int = 100000,
+    max_evals: int | None = None,
+    deadline: float | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимум функции методом ломаных с локальными оценками константы
+    Липшица (локальная настройка Стронгина-Сергеева).
+
+    Вместо одной глобальной константы L для каждого отрезка между соседними
+    испытаниями оценка m_i строится по наклонам на самом отрезке и его соседях
+    и уточняется по мере добавления точек. Как в методе Стронгина, поиск
+    прекращается, когда длина отрезка с наименьшей нижней оценкой
+    x_i - x_{i-1} <= eps: оценка m_i может быть сколь угодно малой (например,
+    нулевой при f(a) = f(b)), поэтому по ней нельзя судить о точности.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        inerval (tuple[Number, Number]): Интервал, в котором ищется минимум.\n
+        eps (Number): Точность поиска по аргументу.\n
+        r (Number): Коэффициент надёжности (r > 1).\n
+        xi (Number): Нижняя граница локальной оценки константы Липшица.\n
+        L (Number | None): Глобальная константа Липшица. Если задана, для сравнения
+                           запускается broken_line(fn, interval, L, eps) без лимитов
+                           max_evals и deadline.\n
+        max_iterations (int): Максимальное количество итераций.\n
+        max_evals (int | None): Максимальное количество вычислений функции.\n
+        deadline (float | None): Ограничение времени работы в секундах.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                                Поле x — значение аргумента, при котором достигается минимум.
+                                Поле y — значение функции в точке минимума.
+                                Поле n_fn — общее количество вызовов целевой функции.
+                                Поле info['n_fn_fixed'] — количество вызовов в broken_line (если задана L).
+                                Поле info['saved'] — n_fn_fixed - n_fn (если задана L).
+                                Остальные поля описаны в OptimizationResult.
+
+    Если исчерпан лимит max_evals или deadline, возвращается лучшая из вычисленных точек
+    и исходный интервал с converged=False и status=BUDGET_EXHAUSTED.
+
+    Исключения:\n
+        ValueError: Если eps <= 0 или r <= 1.
+
+    Примеры:
+    >>> def f(x):
+    ...     return (x - 3) ** 2
+    >>> result = adaptive_broken_line(f, interval=(0, 6), eps=10e-3)
+    >>> print(round(result['x'], 1))
+    3.0
+    >>> result = adaptive_broken_line(lambda x: np.sin(3 * x), interval=(0, 2 * np.pi), eps=1e-3)
+    >>> print(round(result.y, 4), result.converged)
+    -1.0 True
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+    if r <= 1:
+        raise ValueError("Параметр r должен быть больше 1.")
+
+    start = perf_counter()
+    objective = fn
+    budget = Budget.create(max_evals, deadline)
+    if budget is not None:
+        fn = CachedFunction(fn, maxsize=0, budget=budget, observe=True)
+    a, b = interval
+    try:
+        trials = TrialPoints((a, b), (fn(a), fn(b)))
+        N = 2
+        converged = False
+
+        for _ in range(max_iterations):
+            t, x_new, width = trials.select(r, xi)
+            trials.insert(t, x_new, fn(x_new))
+            N += 1
+            if width <= eps:
+                converged = True
+                break
+
+        x, y, a_best, b_best = trials.neighbourhood()
+        res = OptimizationResult(
+            x, y, n=N - 2, n_fn=N, a=a_best, b=b_best,
+            converged=converged, time=perf_counter() - start,
+        )
+        if L is not None:
+            res.info["n_fn_fixed"] = broken_line(objective, interval, L, eps).n_fn
+            res.info["saved"] = res.info["n_fn_fixed"] - N
+        return res
+    except BudgetExhausted:
+        return budget.result(
+            n=max(fn.evaluations - 2, 0), n_fn=fn.evaluations, a=a, b=b,
+            time=perf_counter() - start,
+        )
+
+
+class BrokenLineStepper(Stepper):
+    """
+    Пошаговый вариант метода ломаных (см. broken_line и Stepper).
+
+    Состояние: константа Липшица L, точность eps, очередная вершина ломаной
+    x_0 с нижней оценкой p_0, куча vertices остальных вершин (пары (p, x)) и её
+    порог прореживания live; x, y — лучшая из вычисленных точек.
+
+    Примеры:
+    >>> stepper = BrokenLineStepper(lambda x: (x - 3) ** 2, interval=(0, 6), L=6, eps=10e-3)
+    >>> result = stepper.run()
+    >>> print(round(result.x, 2), round(result.y, 4))
+    3.0 0.0
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self, fn: NumericalMethod, interval: tuple[Number, Number], L: Number, eps: Number
+    ) -> None:
+        if eps <= 0:
+            raise ValueError("Параметр eps должен быть положительным.")
+        super().__init__(fn, interval=tuple(interval), L=L, eps=eps, vertices=[], live=16)
+
+    def _initialize(self, state: State) -> None:
+        (a, b), L = state["interval"], state["L"]
+        y_a, y_b = self.evaluate(a), self.evaluate(b)
+        state["x"], state["y"] = (a, y_a) if y_a <= y_b else (b, y_b)
+        x_0 = (y_a - y_b + L * (a + b)) / (2 * L)
+        p_0 = (y_a + y_b + L * (a - b)) / 2
+
+        # 1 step
+        y_0 = self.evaluate(x_0)
+        if y_0 < state["y"]:
+            state["x"], state["y"] = x_0, y_0
+        delta = (y_0 - p_0) / (2 * L)
+        p = (y_0 + p_0) / 2
+        heapq.heappush(state["vertices"], (p, x_0 - delta))
+        state["x_0"], state["p_0"] = x_0 + delta, p
+
+    def _step(self, state: State) -> None:
+        L, vertices = state["L"], state["vertices"]
+        x_0, p_0 = state["x_0"], state["p_0"]
+        y_0 = self.evaluate(x_0)
+        state["k"] = state["n_fn"] - 2
+        if y_0 < state["y"]:
+            state["x"], state["y"] = x_0, y_0
+        delta = (y_0 - p_0) / (2 * L)
+        if 2 * L * delta <= state["eps"]:
+            state["x"], state["y"] = x_0, y_0
+            state["done"] = state["converged"] = True
+            return
+        p = (y_0 + p_0) / 2
+        if p <= state["y"]:
+            heapq.heappush(vertices, (p, x_0 - delta))
+            heapq.heappush(vertices, (p, x_0 + delta))
+
+        # Отбрасываем вершины, оценка которых хуже найденного значения.
+        if len(vertices) > 2 * state["live"]:
+            vertices[:] = [vertex for vertex in vertices if vertex[0] <= state["y"]]
+            heapq.heapify(vertices)
+            state["live"] = max(len(vertices), 16)
+
+        while vertices and vertices[0][0] > state["y"]:
+            heapq.heappop(vertices)
+        if not vertices:
+            state["done"] = state["converged"] = True
+            return
+        state["p_0"], state["x_0"] = heapq.heappop(vertices)
+
+    def result(self) -> OptimizationResult:
+        res = super().result()
+        res.info["vertices"] = len(self.state["vertices"])
+        return res
+
+
+class AdaptiveBrokenLineStepper(Stepper):
+    """
+    Пошаговый вариант метода ломаных с локальными оценками константы Липшица
+    (см. adaptive_broken_line и Stepper).
+
+    Состояние: точки испытаний trials (см. TrialPoints), параметры r, xi,
+    точность eps и лимит итераций max_iterations; x, y — лучшая из точек испытаний,
+    a, b — её соседи.
+
+    Примеры:
+    >>> stepper = AdaptiveBrokenLineStepper(lambda x: (x - 3) ** 2, interval=(0, 6), eps=10e-3)
+    >>> result = stepper.run()
+    >>> print(round(result.x, 1))
+    3.0
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        fn: NumericalMethod,
+        interval: tuple[Number, Number],
+        eps: Number,
+        r: Number = 1.5,
+        xi: Number = 1e-8,
+        max_iterations: int = 100000,
+    ) -> None:
+        if eps <= 0:
+            raise ValueError("Параметр eps должен быть положительным.")
+        if r <= 1:
+            raise ValueError("Параметр r должен быть больше 1.")
+        super().__init__(
+            fn, interval=tuple(interval), eps=eps, r=r, xi=xi, max_iterations=max_iterations
+        )
+
+    def _initialize(self, state: State) -> None:
+        a, b = state["interval"]
+        state["trials"] = TrialPoints((a, b), (self.evaluate(a), self.evaluate(b)))
+        self._update(state)
+
+    def _step(self, state: State) -> None:
+        trials = state["trials"]
+        t, x_new, width = trials.select(state["r"], state["xi"])
+        trials.insert(t, x_new, self.evaluate(x_new))
+        state["k"] += 1
+        self._update(state)
+        if width <= state["eps"]:
+            state["done"] = state["converged"] = True
+        elif state["k"] >= state["max_iterations"]:
+            state["done"] = True
+
+    def _update(self, state: State) -> None:
+        state["x"], state["y"], state["a"], state["b"] = state["trials"].neighbourhood()
+
+
+if __name__ == "__main__":
+    fn = lambda x: np.cos(x) / x**2
+    a, b = 9, 11
+    eps = 10**-3
+    L = lipschitz_constant(fn, interval=(a, b), vectorized=True)["L"]
+    res_1 = uniform_brute_force(fn, interval=(a, b), L=L, eps=eps, vectorized=True)
+    res_2 = broken_line(fn, interval=(a, b), L=L, eps=eps)
+    print("Метод равномерного перебора:", end=" ")
+    print(f"x: {res_1['x']}, y: {res_1['y']}")
+    print("Метод ломанных:", end=" ")
+    print(f"x: {res_2['x']}, y: {res_2['y']}")
+    print(f"N: {res_2.n_fn}, vertices: {res_2.info['vertices']}")
+
+    # Многоэкстремальная функция: глобальная константа L определяется самым крутым
+    # участком, а локальные оценки позволяют не дробить пологие участки.
+    fn = lambda x: np.sin(x) + np.sin(10 * x / 3)
+    a, b = 2.7, 7.5
+    L = lipschitz_constant(fn, interval=(a, b), vectorized=True)["L"]
+    res_3 = broken_line(fn, interval=(a, b), L=L, eps=eps)
+    res_4 = adaptive_broken_line(fn, interval=(a, b), eps=eps, L=L)
+    print("Метод ломанных:", end=" ")
+    print(f"x: {res_3['x']}, y: {res_3['y']}, N: {res_3.n_fn}")
+    print("Метод ломанных с локальными оценками:", end=" ")
+    print(f"x: {res_4['x']}, y: {res_4['y']}, N: {res_4.n_fn}")
+    print(f"N для метода ломанных: {res_4.info['n_fn_fixed']}", end=", ")
+    print(f"сэкономлено вызовов: {res_4.info['saved']}")
@@ -0,0 +1,71 @@
+from ...custom_types import Number, NumericalMethod, OptimizationFnReturnValue, OptimizationResult
+from ...cached_function import Budget, BudgetExhausted, budgeted, evaluations
+from time import perf_counter
+from .grid_search import CHUNK_SIZE, refine_grid_search
+import numpy as np
+
+def brute_forse(
+    fn: NumericalMethod,
+    interval: tuple[Number, Number],
+    n: Number,
+    levels: int = 0,
+    chunk_size: int = CHUNK_SIZE,
+    vectorized: bool = False,
+    max_evals: int | None = None,
+    deadline: float | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимум функции с помощью метода перебора.
+
+    Точки перебираются блоками по chunk_size штук, поэтому расход памяти
+    не зависит от n. При levels > 0 после перебора интервал сужается вокруг
+    лучшей точки и перебор повторяется на более мелкой сетке.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        inerval (tuple[Number, Number]): Интервал, в котором ищется минимум.\n
+        n (Number): Количество точек на интервале.\n
+        levels (int): Количество уточнений вокруг лучшей точки.\n
+        chunk_size (int): Максимальное количество точек в одном блоке.\n
+        vectorized (bool): Принимает ли fn массив NumPy целиком.\n
+        max_evals (int | None): Максимальное количество вычислений функции.\n
+        deadline (float | None): Ограничение времени работы в секундах.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                                Поле x — значение аргумента, при котором достигается минимум.
+                                Поле y — значение функции в точке минимума.
+                                Остальные поля описаны в OptimizationResult.
+
+    Если исчерпан лимит max_evals или deadline, возвращается лучшая из вычисленных точек
+    и исходный интервал с converged=False и status=BUDGET_EXHAUSTED.
+
+    Примеры:
+    >>> def f(x):
+    ...     return (x - 3) ** 2
+    >>> result = brute_forse(f, interval=(0, 6), n=1000)
+    >>> print(round(result.x, 2), round(result.y, 4))
+    3.0 0.0
+    """
+
+    start = perf_counter()
+    budget = Budget.create(max_evals, deadline)
+    fn = budgeted(fn, budget, observe=True)
+    try:
+        res = refine_grid_search(fn, interval, n, levels, chunk_size, vectorized)
+        return OptimizationResult(
+            res["x"], res["y"], n=levels + 1, n_fn=evaluations(fn, n * (levels + 1)),
+            a=res["a"], b=res["b"], time=perf_counter() - start,
+        )
+    except BudgetExhausted:
+        return budget.result(
+            n_fn=fn.evaluations, a=interval[0], b=interval[1], time=perf_counter() - start
+        )
+
+
+if __name__ == "__main__":
+    fn = lambda x: np.cos(x) / x**2
+    a, b = 9, 11
+    n = 1000
+    res = brute_forse(fn, interval=(a, b), n=n, vectorized=True)
+    print(f"x: {res['x']}, y: {res['y']}")
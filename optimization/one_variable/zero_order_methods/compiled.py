@@ -0,0 +1,306 @@
+from ...custom_types import Number, NumericalMethod, OptimizationResult
+from math import sqrt
+from time import perf_counter
+from typing import Callable, Dict, Set, Tuple
+import sys
+import weakref
+
+# x, y, количество итераций, количество вычислений fn, границы итогового интервала
+KernelResult = Tuple[float, float, int, int, float, float]
+
+
+def dichotomy_kernel(fn: NumericalMethod, a: float, b: float, eps: float) -> KernelResult:
+    # Цикл dichotomy без обёрток; при наличии Numba компилируется целиком
+    k = 0
+    n_fn = 0
+    delta = eps / 4
+    l = b - a
+    while l > eps:
+        k += 1
+        alpha_x = (a + b) / 2 - delta
+        beta_x = (a + b) / 2 + delta
+        alpha_y = fn(alpha_x)
+        beta_y = fn(beta_x)
+        n_fn += 2
+        if alpha_y <= beta_y:
+            b = beta_x
+        else:
+            a = alpha_x
+        l = b - a
+    x_min = (a + b) / 2
+    return x_min, fn(x_min), k, n_fn + 1, a, b
+
+
+def golden_ratio_kernel(fn: NumericalMethod, a: float, b: float, eps: float) -> KernelResult:
+    # Цикл golden_ratio без обёрток
+    k = 0
+    alpha_x = a + (3 - sqrt(5)) / 2 * (b - a)
+    beta_x = a + (sqrt(5) - 1) / 2 * (b - a)
+    alpha_y = fn(alpha_x)
+    beta_y = fn(beta_x)
+    n_fn = 2
+    l = b - a
+    x, y = alpha_x, alpha_y
+    while l > eps:
+        k += 1
+        if alpha_y <= beta_y:
+            b = beta_x
+            x, y = alpha_x, alpha_y
+            beta_x = alpha_x
+            beta_y = alpha_y
+            alpha_x = a + b - alpha_x
+            alpha_y = fn(alpha_x)
+        else:
+            a = alpha_x
+            x, y = beta_x, beta_y
+            alpha_x = beta_x
+            alpha_y = beta_y
+            beta_x = a + b - beta_x
+            beta_y = fn(beta_x)
+        n_fn += 1
+        l = b - a
+    return x, y, k, n_fn, a, b
+
+
+def fibonacci_kernel(fn: NumericalMethod, a: float, b: float, eps: float) -> KernelResult:
+    # Цикл fibonacci без обёрток
+    f_1 = f_2 = j = 1
+    m = 0
+    while True:
+        f_3 = f_2 + f_1
+        if f_2 < (b - a) / eps <= f_3:
+            m = j
+            break
+        else:
+            f_1, f_2 = f_2, f_3
+            j += 1
+
+    alpha_x = a + f_1 / f_3 * (b - a)
+    beta_x = a + b - alpha_x
+    k = 1
+    alpha_y = fn(alpha_x)
+    beta_y = fn(beta_x)
+    n_fn = 2
+    while k < m - 1:
+        if alpha_y <= beta_y:
+            b = beta_x
+            beta_x = alpha_x
+            beta_y = alpha_y
+            alpha_x = a + b - alpha_x
+            alpha_y = fn(alpha_x)
+        else:
+            a = alpha_x
+            alpha_x = beta_x
+            alpha_y = beta_y
+            beta_x = a + b - beta_x
+            beta_y = fn(beta_x)
+        n_fn += 1
+        k += 1
+    x_min = (a + b) / 2
+    return x_min, fn(x_min), k, n_fn + 1, a, b
+
+
+def split_interval_kernel(fn: NumericalMethod, a: float, b: float, eps: float) -> KernelResult:
+    # Цикл split_interval без обёрток
+    k = 0
+    N = 1
+    avg_x = (a + b) / 2
+    avg_y = fn(avg_x)
+    while b - a > eps:
+        alpha_x = a + (b - a) / 4
+        beta_x = b - (b - a) / 4
+        alpha_y = fn(alpha_x)
+        beta_y = fn(beta_x)
+        if alpha_y < avg_y:
+            b = avg_x
+            avg_x = alpha_x
+            avg_y = alpha_y
+        elif beta_y < avg_y:
+            a = avg_x
+            avg_x = beta_x
+            avg_y = beta_y
+        else:
+            a = alpha_x
+            b = beta_x
+        N += 2
+        k += 1
+    x_min = (a + b) / 2
+    return x_min, fn(x_min), k, N, a, b
+
+
+def bit_search_kernel(fn: NumericalMethod, a: float, b: float, eps: float) -> KernelResult:
+    # Цикл bit_search без обёрток; known — известно ли значение y_0 в точке x_0
+    k = 0
+    h = (b - a) / 4
+    x_0 = a
+    y_0 = fn(x_0)
+    n_fn = 1
+    while True:
+        k += 1
+        x_1 = x_0 + h
+        y_1 = fn(x_1)
+        n_fn += 1
+        if y_0 > y_1:
+            x_0 = x_1
+            y_0 = y_1
+            if a < x_0 < b:
+                continue
+        known = True
+        if x_0 <= a:
+            h /= 4
+            x_0 = a + h
+            known = False
+        elif x_1 >= b:
+            h = -h / 4
+            x_0 = b + h
+            known = False
+        if abs(h) <= eps:
+            if not known:
+                y_0 = fn(x_0)
+                n_fn += 1
+            return x_0, y_0, k, n_fn, x_0 - abs(h), x_0 + abs(h)
+        else:
+            x_0 = x_1
+            y_0 = y_1
+            h = -h / 4
+
+
+KERNELS: Dict[str, Callable[..., KernelResult]] = {
+    "dichotomy": dichotomy_kernel,
+    "golden_ratio": golden_ratio_kernel,
+    "fibonacci": fibonacci_kernel,
+    "split_interval": split_interval_kernel,
+    "bit_search": bit_search_kernel,
+}
+
+# Скомпилированные ядра по имени метода и имена методов, ядра которых не
+# компилируются с данной функцией. Функции хранятся по слабым ссылкам, чтобы
+# долго работающий процесс не удерживал все отвергнутые целевые функции
+_compiled: Dict[str, Callable[..., KernelResult]] = {}
+_unsupported: "weakref.WeakKeyDictionary[NumericalMethod, Set[str]]" = weakref.WeakKeyDictionary()
+
+
+def is_compiled(fn: NumericalMethod) -> bool:
+    """
+    Проверяет, скомпилирована ли fn с помощью numba.njit.
+
+    Numba при этом не импортируется: если он ещё не загружен, fn не может быть
+    скомпилирована, поэтому импорт методов не тратит время на загрузку Numba.
+
+    Примеры:
+    >>> is_compiled(abs)
+    False
+    """
+    if "numba" not in sys.modules:
+        return False
+    from numba.extending import is_jitted
+
+    return is_jitted(fn)
+
+
+def compiled_search(
+    method: str, fn: NumericalMethod, a: Number, b: Number, eps: Number
+) -> OptimizationResult | None:
+    """
+    Выполняет поиск минимума скомпилированным ядром метода, если это возможно.
+
+    Ядро — тот же цикл поиска, что и в функции метода, но без CachedFunction
+    и бюджета, поэтому Numba компилирует его вместе с fn в машинный код и
+    интерпретатор не участвует в итерациях. Ядро компилируется при первом вызове
+    метода с данной функцией fn (Numba хранит скомпилированный вариант для каждой
+    функции), поэтому затраты на компиляцию возникают один раз за процесс.
+
+    Параметры:\n
+        method (str): Имя метода: 'dichotomy', 'golden_ratio', 'fibonacci',
+                      'split_interval' или 'bit_search'.\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        a (Number): Левая граница интервала, в котором ищется минимум.\n
+        b (Number): Правая граница интервала, в котором ищется минимум.\n
+        eps (Number): Точность поиска (порог для завершения).\n
+
+    Возвращает:\n
+        OptimizationResult | None: Результат поиска (info['backend'] = 'numba') или
+                                   None, если Numba не установлен, fn не скомпилирована
+                                   с помощью numba.njit или ядро с ней не компилируется.
+                                   В этом случае метод выполняет обычный цикл на Python.
+                                   Поле n_fn — количество вызовов fn (кэша нет).
+
+    Примеры:
+    >>> print(compiled_search("dichotomy", lambda x: (x - 2) ** 2, 0, 4, 0.01))
+    None
+    """
+    if not is_compiled(fn) or method in _unsupported.get(fn, ()):
+        return None
+    start = perf_counter()
+    from numba import njit
+    from numba.core.errors import NumbaError
+
+    kernel = _compiled.get(method)
+    if kernel is None:
+        kernel = _compiled[method] = njit(KERNELS[method])
+    try:
+        x, y, k, n_fn, a, b = kernel(fn, float(a), float(b), float(eps))
+    except NumbaError:
+        _unsupported.setdefault(fn, set()).add(method)
+        return None
+    return OptimizationResult(
+        x, y, n=k, n_fn=n_fn, a=a, b=b, time=perf_counter() - start, info={"backend": "numba"}
+    )
+
+
+def kernel_search(
+    method: str, fn: NumericalMethod, a: Number, b: Number, eps: Number
+) -> OptimizationResult:
+    """
+    Выполняет поиск минимума ядром метода: скомпилированным (см. compiled_search),
+    если это возможно, иначе тем же циклом на Python. Ядро вызывает fn напрямую
+    и считает вызовы само, поэтому методы используют его, когда лимиты
+    вычислений и времени не заданы и обёртка CachedFunction не нужна.
+
+    Параметры:\n
+        method (str): Имя метода (см. compiled_search).\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        a (Number): Левая граница интервала, в котором ищется минимум.\n
+        b (Number): Правая граница интервала, в котором ищется минимум.\n
+        eps (Number): Точность поиска (порог для завершения).\n
+
+    Возвращает:\n
+        OptimizationResult: Результат поиска; info['backend'] = 'numba' у скомпилированного ядра.
+
+    Примеры:
+    >>> result = kernel_search("golden_ratio", lambda x: (x - 2) ** 2, 0, 4, 0.01)
+    >>> print(round(result.x, 2), result.n, result.n_fn)
+    2.0 13 15
+    """
+    result = compiled_search(method, fn, a, b, eps)
+    if result is not None:
+        return result
+    start = perf_counter()
+    x, y, k, n_fn, a, b = KERNELS[method](fn, a, b, eps)
+    return OptimizationResult(x, y, n=k, n_fn=n_fn, a=a, b=b, time=perf_counter() - start)
+
+
+if __name__ == "__main__":
+    from .golden_ratio import golden_ratio
+    from .dichotomy import dichotomy
+
+    try:
+        import numba
+    except ImportError:
+        print("Numba не установлен: методы выполняют цикл поиска на Python.")
+    else:
+        @numba.njit
+        def fn(x):
+            return x**2 - 2 * x + 16 / (x - 1) - 13
+
+        a, b = 2, 5
+        eps = 10**-6
+        for method in (dichotomy, golden_ratio):
+            # Первый вызов компилирует ядро, следующие выполняются сразу
+            method(fn, a, b, eps)
+            compiled = min(method(fn, a, b, eps).time for _ in range(100))
+            python = min(method(fn.py_func, a, b, eps).time for _ in range(100))
+            print(
+                f"{method.__name__}: Numba: {compiled * 1e6:.1f} мкс, "
+                f"Python: {python * 1e6:.1f} мкс, ускорение: {python / compiled:.0f}"
+            )
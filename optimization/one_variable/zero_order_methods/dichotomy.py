@@ -0,0 +1,111 @@
+from ...custom_types import Number, NumericalMethod, OptimizationFnReturnValue
+from ...cached_function import Budget
+from .compiled import kernel_search
+from ...stepper import State, Stepper
+
+
+def dichotomy(
+    fn: NumericalMethod,
+    a: Number,
+    b: Number,
+    eps: Number,
+    max_evals: int | None = None,
+    deadline: float | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимум функции с помощью метода дихотомии.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        a (Number): Левая граница интервала, в котором ищется минимум.\n
+        b (Number): Правая граница интервала, в котором ищется минимум.\n
+        eps (Number): Точность поиска (порог для завершения).\n
+        max_evals (int | None): Максимальное количество вычислений функции.\n
+        deadline (float | None): Ограничение времени работы в секундах.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                    Поле x — значение аргумента, при котором достигается минимум.
+                    Поле y — значение функции в точке минимума.
+                    Остальные поля описаны в OptimizationResult.
+
+    Если исчерпан лимит max_evals или deadline, возвращается лучшая из вычисленных точек
+    и текущий интервал с converged=False и status=BUDGET_EXHAUSTED.
+
+    Если max_evals и deadline не заданы, поиск выполняется ядром метода без обёртки
+    CachedFunction (см. kernel_search); если при этом установлен Numba и fn скомпилирована
+    с помощью numba.njit, ядро компилируется целиком. С лимитами итерации выполняет
+    DichotomyStepper (см. Stepper.run_budgeted).
+
+    Исключения:\n
+     ValueError: Если eps <= 0 (некорректное значение точности).
+
+    Примеры:
+    >>> def f(x):
+    ...     return (x - 2) ** 2
+    >>> result = dichotomy(f, 0, 4, 0.01)
+    >>> print(round(result.x, 2), round(result.y, 4))
+    2.0 0.0
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+    budget = Budget.create(max_evals, deadline)
+    if budget is None:
+        return kernel_search("dichotomy", fn, a, b, eps)
+    return DichotomyStepper.run_budgeted(fn, budget, a, b, eps)
+
+
+class DichotomyStepper(Stepper):
+    """
+    Пошаговый вариант метода дихотомии (см. dichotomy и Stepper).
+
+    Состояние: текущий интервал a, b и точность eps; x, y — лучшая из пробных
+    точек последней итерации, после завершения — середина интервала.
+
+    Примеры:
+    >>> stepper = DichotomyStepper(lambda x: (x - 2) ** 2, 0, 4, 0.01)
+    >>> for state in stepper:
+    ...     pass
+    >>> result = stepper.result()
+    >>> print(round(result.x, 2), round(result.y, 4))
+    2.0 0.0
+    """
+
+    __slots__ = ()
+
+    def __init__(self, fn: NumericalMethod, a: Number, b: Number, eps: Number) -> None:
+        if eps <= 0:
+            raise ValueError("Параметр eps должен быть положительным.")
+        super().__init__(fn, a=a, b=b, eps=eps)
+
+    def _initialize(self, state: State) -> None:
+        self._check(state)
+
+    def _step(self, state: State) -> None:
+        state["k"] += 1
+        a, b, delta = state["a"], state["b"], state["eps"] / 4
+        alpha_x = (a + b) / 2 - delta
+        beta_x = (a + b) / 2 + delta
+        alpha_y = self.evaluate(alpha_x)
+        beta_y = self.evaluate(beta_x)
+        if alpha_y <= beta_y:
+            state["b"] = beta_x
+            state["x"], state["y"] = alpha_x, alpha_y
+        else:
+            state["a"] = alpha_x
+            state["x"], state["y"] = beta_x, beta_y
+        self._check(state)
+
+    def _check(self, state: State) -> None:
+        if state["b"] - state["a"] <= state["eps"]:
+            x_min = (state["a"] + state["b"]) / 2
+            state["x"], state["y"] = x_min, self.evaluate(x_min)
+            state["done"] = state["converged"] = True
+
+
+if __name__ == "__main__":
+    input_fn = lambda x: x**2 - 2 * x + 16 / (x - 1) - 13
+    a, b = 2, 5
+    eps = 10**-3
+    res = dichotomy(input_fn, a, b, eps)
+    print(f"x: {res['x']}, y: {res['y']}")
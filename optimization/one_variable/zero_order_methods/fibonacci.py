@@ -0,0 +1,126 @@
+from ...custom_types import Number, NumericalMethod, OptimizationFnReturnValue
+from ...cached_function import Budget
+from .compiled import kernel_search
+from ...stepper import State, Stepper
+
+
+def fibonacci(
+    fn: NumericalMethod,
+    a: Number,
+    b: Number,
+    eps: Number,
+    max_evals: int | None = None,
+    deadline: float | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимум функции с помощью метода Фибоначчи.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        a (Number): Левая граница интервала, в котором ищется минимум.\n
+        b (Number): Правая граница интервала, в котором ищется минимум.\n
+        eps (Number): Точность поиска (порог для завершения).\n
+        max_evals (int | None): Максимальное количество вычислений функции.\n
+        deadline (float | None): Ограничение времени работы в секундах.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                    Поле x — значение аргумента, при котором достигается минимум.
+                    Поле y — значение функции в точке минимума.
+                    Остальные поля описаны в OptimizationResult.
+
+    Если исчерпан лимит max_evals или deadline, возвращается лучшая из вычисленных точек
+    и текущий интервал с converged=False и status=BUDGET_EXHAUSTED.
+
+    Если max_evals и deadline не заданы, поиск выполняется ядром метода без обёртки
+    CachedFunction (см. kernel_search); если при этом установлен Numba и fn скомпилирована
+    с помощью numba.njit, ядро компилируется целиком. С лимитами итерации выполняет
+    FibonacciStepper (см. Stepper.run_budgeted).
+
+    Исключения:\n
+     ValueError: Если eps <= 0 (некорректное значение точности).
+
+    Примеры:
+    >>> def f(x):
+    ...     return (x - 2) ** 2
+    >>> result = fibonacci(f, 0, 4, 0.01)
+    >>> print(round(result.x, 2), round(result.y, 4))
+    2.0 0.0
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+    budget = Budget.create(max_evals, deadline)
+    if budget is None:
+        return kernel_search("fibonacci", fn, a, b, eps)
+    return FibonacciStepper.run_budgeted(fn, budget, a, b, eps)
+
+
+class FibonacciStepper(Stepper):
+    """
+    Пошаговый вариант метода Фибоначчи (см. fibonacci и Stepper).
+
+    Состояние: текущий интервал a, b, номер m числа Фибоначчи, определяющий
+    количество итераций, и пробные точки alpha_x, beta_x со значениями alpha_y,
+    beta_y; x, y — лучшая из пробных точек, после завершения — середина интервала.
+
+    Примеры:
+    >>> stepper = FibonacciStepper(lambda x: (x - 2) ** 2, 0, 4, 0.01)
+    >>> result = stepper.run()
+    >>> print(round(result.x, 2), round(result.y, 4))
+    2.0 0.0
+    """
+
+    __slots__ = ()
+
+    def __init__(self, fn: NumericalMethod, a: Number, b: Number, eps: Number) -> None:
+        if eps <= 0:
+            raise ValueError("Параметр eps должен быть положительным.")
+        f_1 = f_2 = m = 1
+        while True:
+            f_3 = f_2 + f_1
+            if f_2 < (b - a) / eps <= f_3:
+                break
+            f_1, f_2 = f_2, f_3
+            m += 1
+        alpha_x = a + f_1 / f_3 * (b - a)
+        super().__init__(fn, a=a, b=b, eps=eps, m=m, alpha_x=alpha_x, beta_x=a + b - alpha_x)
+
+    def _initialize(self, state: State) -> None:
+        state["k"] = 1
+        state["alpha_y"] = self.evaluate(state["alpha_x"])
+        state["beta_y"] = self.evaluate(state["beta_x"])
+        state["x"], state["y"] = state["alpha_x"], state["alpha_y"]
+        self._check(state)
+
+    def _step(self, state: State) -> None:
+        a, b = state["a"], state["b"]
+        alpha_x, alpha_y = state["alpha_x"], state["alpha_y"]
+        beta_x, beta_y = state["beta_x"], state["beta_y"]
+        if alpha_y <= beta_y:
+            b = beta_x
+            beta_x, beta_y = alpha_x, alpha_y
+            alpha_x = a + b - alpha_x
+            alpha_y = self.evaluate(alpha_x)
+        else:
+            a = alpha_x
+            alpha_x, alpha_y = beta_x, beta_y
+            beta_x = a + b - beta_x
+            beta_y = self.evaluate(beta_x)
+        state.update(a=a, b=b, alpha_x=alpha_x, alpha_y=alpha_y, beta_x=beta_x, beta_y=beta_y)
+        state["x"], state["y"] = (alpha_x, alpha_y) if alpha_y <= beta_y else (beta_x, beta_y)
+        state["k"] += 1
+        self._check(state)
+
+    def _check(self, state: State) -> None:
+        if state["k"] >= state["m"] - 1:
+            x_min = (state["a"] + state["b"]) / 2
+            state["x"], state["y"] = x_min, self.evaluate(x_min)
+            state["done"] = state["converged"] = True
+
+
+if __name__ == "__main__":
+    input_fn = lambda x: x**2 - 2 * x + 16 / (x - 1) - 13
+    a, b = 2, 5
+    eps = 10**-3
+    res = fibonacci(input_fn, a, b, eps)
+    print(f"x: {res['x']}, y: {res['y']}")
@@ -0,0 +1,126 @@
+from ...custom_types import Number, NumericalMethod, OptimizationFnReturnValue
+from ...cached_function import Budget
+from .compiled import kernel_search
+from ...stepper import State, Stepper
+from math import sqrt
+
+
+def golden_ratio(
+    fn: NumericalMethod,
+    a: Number,
+    b: Number,
+    eps: Number,
+    max_evals: int | None = None,
+    deadline: float | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимум функции с помощью метода золотого сечения.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        a (Number): Левая граница интервала, в котором ищется минимум.\n
+        b (Number): Правая граница интервала, в котором ищется минимум.\n
+        eps (Number): Точность поиска (порог для завершения).\n
+        max_evals (int | None): Максимальное количество вычислений функции.\n
+        deadline (float | None): Ограничение времени работы в секундах.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                    Поле x — значение аргумента, при котором достигается минимум.
+                    Поле y — значение функции в точке минимума.
+                    Остальные поля описаны в OptimizationResult.
+
+    Если исчерпан лимит max_evals или deadline, возвращается лучшая из вычисленных точек
+    и текущий интервал с converged=False и status=BUDGET_EXHAUSTED.
+
+    Если max_evals и deadline не заданы, поиск выполняется ядром метода без обёртки
+    CachedFunction (см. kernel_search); если при этом установлен Numba и fn скомпилирована
+    с помощью numba.njit, ядро компилируется целиком. С лимитами итерации выполняет
+    GoldenRatioStepper (см. Stepper.run_budgeted).
+
+    Исключения:\n
+     ValueError: Если eps <= 0 (некорректное значение точности).
+
+    Примеры:
+    >>> def f(x):
+    ...     return (x - 2) ** 2
+    >>> result = golden_ratio(f, 0, 4, 0.01)
+    >>> print(round(result.x, 2), round(result.y, 4))
+    2.0 0.0
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+    budget = Budget.create(max_evals, deadline)
+    if budget is None:
+        return kernel_search("golden_ratio", fn, a, b, eps)
+    return GoldenRatioStepper.run_budgeted(fn, budget, a, b, eps)
+
+
+class GoldenRatioStepper(Stepper):
+    """
+    Пошаговый вариант метода золотого сечения (см. golden_ratio и Stepper).
+
+    Состояние: текущий интервал a, b, точность eps и пробные точки alpha_x, beta_x
+    со значениями alpha_y, beta_y; x, y — лучшая из пробных точек.
+
+    Примеры:
+    >>> stepper = GoldenRatioStepper(lambda x: (x - 2) ** 2, 0, 4, 0.01)
+    >>> result = stepper.run()
+    >>> print(round(result.x, 2), round(result.y, 4))
+    2.0 0.0
+    """
+
+    __slots__ = ()
+
+    def __init__(self, fn: NumericalMethod, a: Number, b: Number, eps: Number) -> None:
+        if eps <= 0:
+            raise ValueError("Параметр eps должен быть положительным.")
+        super().__init__(
+            fn, a=a, b=b, eps=eps,
+            alpha_x=a + (3 - sqrt(5)) / 2 * (b - a),
+            beta_x=a + (sqrt(5) - 1) / 2 * (b - a),
+        )
+
+    def _initialize(self, state: State) -> None:
+        state["alpha_y"] = self.evaluate(state["alpha_x"])
+        state["beta_y"] = self.evaluate(state["beta_x"])
+        state["x"], state["y"] = state["alpha_x"], state["alpha_y"]
+        state["done"] = state["converged"] = state["b"] - state["a"] <= state["eps"]
+
+    def _step(self, state: State) -> None:
+        state["k"] += 1
+        a, b = state["a"], state["b"]
+        alpha_x, alpha_y = state["alpha_x"], state["alpha_y"]
+        beta_x, beta_y = state["beta_x"], state["beta_y"]
+        if alpha_y <= beta_y:
+            b = beta_x
+            state["x"], state["y"] = alpha_x, alpha_y
+            beta_x, beta_y = alpha_x, alpha_y
+            alpha_x = a + b - alpha_x
+            alpha_y = self.evaluate(alpha_x)
+        else:
+            a = alpha_x
+            state["x"], state["y"] = beta_x, beta_y
+            alpha_x, alpha_y = beta_x, beta_y
+            beta_x = a + b - beta_x
+            beta_y = self.evaluate(beta_x)
+        state.update(a=a, b=b, alpha_x=alpha_x, alpha_y=alpha_y, beta_x=beta_x, beta_y=beta_y)
+        state["done"] = state["converged"] = b - a <= state["eps"]
+
+
+if __name__ == "__main__":
+    input_fn = lambda x: x**2 - 2 * x + 16 / (x - 1) - 13
+    a, b = 2, 5
+    eps = 10**-3
+    res = golden_ratio(input_fn, a, b, eps)
+    print(f"x: {res['x']}, y: {res['y']}")
+
+    # Несколько поисков, выполняемых поочерёдно по одной итерации
+    from ...stepper import interleave
+
+    steppers = [GoldenRatioStepper(input_fn, a, b, eps) for a, b in ((2, 5), (1.5, 8), (2.5, 4))]
+    for i, state in interleave(steppers):
+        pass
+    for stepper in steppers:
+        res = stepper.result()
+        print(f"x: {res.x}, y: {res.y}, n: {res.n}")
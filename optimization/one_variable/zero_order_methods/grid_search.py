@@ -0,0 +1,217 @@
+from ...custom_types import Number, NumericalMethod, OptimizationResult
+from ...stepper import State, Stepper
+from typing import Dict, Iterator
+import numpy as np
+
+CHUNK_SIZE = 1 << 16
+
+
+def evaluate(fn: NumericalMethod, x: np.ndarray, vectorized: bool) -> np.ndarray:
+    """
+    Вычисляет значения функции во всех точках массива x.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, значения которой необходимо вычислить.\n
+        x (np.ndarray): Одномерный массив точек.\n
+        vectorized (bool): Принимает ли fn массив NumPy целиком.\n
+
+    Возвращает:\n
+        np.ndarray: Массив значений функции той же длины, что и x.
+    """
+    if vectorized:
+        return np.broadcast_to(np.asarray(fn(x), dtype=float), x.shape)
+    return np.fromiter((fn(x_i) for x_i in x.tolist()), dtype=float, count=x.size)
+
+
+def grid_chunks(
+    x_0: Number, h: Number, n: int, chunk_size: int = CHUNK_SIZE, start: int = 0
+) -> Iterator[np.ndarray]:
+    """
+    Генерирует равномерную сетку x_0 + h * i, i = start, ..., start + n - 1,
+    блоками фиксированного размера, не храня всю сетку в памяти.
+
+    Параметры:\n
+        x_0 (Number): Начало отсчёта сетки.\n
+        h (Number): Шаг сетки.\n
+        n (int): Количество точек сетки.\n
+        chunk_size (int): Максимальное количество точек в одном блоке.\n
+        start (int): Номер первой точки сетки.\n
+
+    Возвращает:\n
+        Iterator[np.ndarray]: Блоки точек сетки.
+    """
+    for i in range(start, start + n, chunk_size):
+        stop = min(i + chunk_size, start + n)
+        yield x_0 + h * np.arange(i, stop, dtype=float)
+
+
+def grid_search(
+    fn: NumericalMethod,
+    x_0: Number,
+    h: Number,
+    n: int,
+    chunk_size: int = CHUNK_SIZE,
+    vectorized: bool = False,
+    start: int = 0,
+) -> Dict[str, Number]:
+    """
+    Находит минимум функции на равномерной сетке x_0 + h * i,
+    i = start, ..., start + n - 1.
+
+    Сетка обрабатывается блоками по chunk_size точек, хранится только текущий
+    минимум, поэтому расход памяти не зависит от n.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        x_0 (Number): Начало отсчёта сетки.\n
+        h (Number): Шаг сетки.\n
+        n (int): Количество точек сетки.\n
+        chunk_size (int): Максимальное количество точек в одном блоке.\n
+        vectorized (bool): Принимает ли fn массив NumPy целиком.\n
+        start (int): Номер первой точки сетки.\n
+
+    Возвращает:\n
+        Dict[str, Number]: Словарь с координатами минимума.
+                                Ключ 'x' — значение аргумента, при котором достигается минимум.
+                                Ключ 'y' — значение функции в точке минимума.
+                                Ключ 'i' — номер точки минимума на сетке.
+
+    Исключения:\n
+        ValueError: Если n <= 0 или chunk_size <= 0.
+
+    Примеры:
+    >>> def f(x):
+    ...     return (x - 3) ** 2
+    >>> result = grid_search(f, 0, 0.5, 13, vectorized=True)
+    >>> print(result)
+    {'x': 3.0, 'y': 0.0, 'i': 6}
+    """
+    if n <= 0:
+        raise ValueError("Параметр n должен быть положительным.")
+    if chunk_size <= 0:
+        raise ValueError("Параметр chunk_size должен быть положительным.")
+
+    best_i, best_x, best_y = -1, None, np.inf
+    offset = start
+    for x in grid_chunks(x_0, h, n, chunk_size, start):
+        y = evaluate(fn, x, vectorized)
+        i = int(np.argmin(y))
+        if y[i] < best_y or best_i < 0:
+            best_i, best_x, best_y = offset + i, float(x[i]), float(y[i])
+        offset += x.size
+
+    return {"x": best_x, "y": best_y, "i": best_i}
+
+
+def refine_grid_search(
+    fn: NumericalMethod,
+    interval: tuple[Number, Number],
+    n: int,
+    levels: int = 0,
+    chunk_size: int = CHUNK_SIZE,
+    vectorized: bool = False,
+) -> Dict[str, Number]:
+    """
+    Находит минимум функции перебором по сетке от грубой к мелкой.
+
+    На каждом уровне на текущем интервале строится сетка из n внутренних точек,
+    после чего интервал сужается до двух ячеек вокруг лучшей из найденных точек.
+    При нечётном n лучшая точка — середина нового интервала и остаётся на сетке
+    следующего уровня; в любом случае она учитывается при сравнении, поэтому
+    результат уточнения не хуже результата предыдущего уровня.
+    При levels = 0 совпадает с обычным перебором по n точкам.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        interval (tuple[Number, Number]): Интервал, в котором ищется минимум.\n
+        n (int): Количество внутренних точек сетки на каждом уровне (лучше нечётное).\n
+        levels (int): Количество уточнений вокруг лучшей ячейки.\n
+        chunk_size (int): Максимальное количество точек в одном блоке.\n
+        vectorized (bool): Принимает ли fn массив NumPy целиком.\n
+
+    Возвращает:\n
+        Dict[str, Number]: Словарь с координатами минимума.
+                                Ключ 'x' — значение аргумента, при котором достигается минимум.
+                                Ключ 'y' — значение функции в точке минимума.
+                                Ключи 'a', 'b' — границы последнего уточнённого интервала.
+
+    Исключения:\n
+        ValueError: Если levels < 0.
+
+    Примеры:
+    >>> def f(x):
+    ...     return (x - 3) ** 2
+    >>> result = refine_grid_search(f, interval=(0, 6), n=11, levels=3, vectorized=True)
+    >>> print(round(result['x'], 6))
+    3.0
+    """
+    if levels < 0:
+        raise ValueError("Параметр levels должен быть неотрицательным.")
+
+    a, b = interval
+    best = None
+    for _ in range(levels + 1):
+        h = (b - a) / (n + 1)
+        res = grid_search(fn, a, h, n, chunk_size, vectorized, start=1)
+        if best is None or res["y"] < best["y"]:
+            best = {"x": res["x"], "y": res["y"]}
+        a, b = max(a, best["x"] - h), min(b, best["x"] + h)
+        best["a"], best["b"] = a, b
+
+    return best
+
+
+class GridSearchStepper(Stepper):
+    """
+    Пошаговый вариант перебора по сетке (см. grid_search и Stepper):
+    одна итерация обрабатывает один блок из chunk_size точек.
+
+    Состояние: параметры сетки x_0, h, n, chunk_size, vectorized, номер next
+    следующей необработанной точки и номер i лучшей точки x со значением y.
+
+    Примеры:
+    >>> stepper = GridSearchStepper(lambda x: (x - 3) ** 2, 0, 0.5, 13, chunk_size=4)
+    >>> print([state["x"] for state in stepper])
+    [1.5, 3.0, 3.0, 3.0]
+    >>> print(stepper.result().info["i"])
+    6
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        fn: NumericalMethod,
+        x_0: Number,
+        h: Number,
+        n: int,
+        chunk_size: int = CHUNK_SIZE,
+        vectorized: bool = False,
+        start: int = 0,
+    ) -> None:
+        if n <= 0:
+            raise ValueError("Параметр n должен быть положительным.")
+        if chunk_size <= 0:
+            raise ValueError("Параметр chunk_size должен быть положительным.")
+        super().__init__(
+            fn, x_0=x_0, h=h, n=n, chunk_size=chunk_size, vectorized=vectorized,
+            next=start, stop=start + n, i=-1,
+        )
+
+    def _step(self, state: State) -> None:
+        state["k"] += 1
+        offset = state["next"]
+        count = min(state["chunk_size"], state["stop"] - offset)
+        x = next(grid_chunks(state["x_0"], state["h"], count, count, offset))
+        y = evaluate(self.fn, x, state["vectorized"])
+        state["n_fn"] += x.size
+        i = int(np.argmin(y))
+        if state["i"] < 0 or y[i] < state["y"]:
+            state["i"], state["x"], state["y"] = offset + i, float(x[i]), float(y[i])
+        state["next"] = offset + x.size
+        state["done"] = state["converged"] = state["next"] >= state["stop"]
+
+    def result(self) -> OptimizationResult:
+        res = super().result()
+        res.info["i"] = self.state["i"]
+        return res
@@ -0,0 +1,85 @@
+import numpy as np
+from ...custom_types import Number, NumericalMethod
+from .grid_search import evaluate
+from typing import Dict
+
+
+def lipschitz_constant(
+    f: NumericalMethod,
+    interval: tuple[Number, Number],
+    num_points=1000,
+    vectorized: bool = False,
+    tol: Number = 1e-3,
+    max_rounds: int = 10,
+    top_k: int = 8,
+    refine_points: int = 4,
+) -> Dict[str, Number]:
+    """
+    Находит константу Липшица для функции f на интервале interval.
+
+    Сначала по равномерной сетке из num_points точек за один проход вычисляются
+    все разностные отношения |f(x_{i+1}) - f(x_i)| / (x_{i+1} - x_i). Затем
+    отрезки с наибольшими отношениями дробятся, пока оценка не перестанет
+    расти более чем на tol (относительно).
+
+    Параметры:\n
+        f (function): Функция, для которой необходимо вычислить константу Липшица.\n
+        interval (tuple): Интервал, в котором ищется константа Липшица.\n
+        num_points (int): Количество точек на интервале.\n
+        vectorized (bool): Принимает ли f массив NumPy целиком.\n
+        tol (Number): Относительный порог прироста оценки для остановки уточнения.\n
+        max_rounds (int): Максимальное количество раундов уточнения.\n
+        top_k (int): Количество самых крутых отрезков, дробящихся за раунд.\n
+        refine_points (int): Количество новых точек внутри каждого такого отрезка.\n
+
+    Возвращает:\n
+        Dict[str, Number]: Словарь с оценкой.
+                    Ключ 'L' — константа Липшица.
+                    Ключ 'N' — общее количество вызовов функции.
+
+    Исключения:\n
+        ValueError: Если num_points < 2.
+
+    Примеры:
+    >>> def f(x):
+    ...     return (x - 3) ** 2
+    >>> result = lipschitz_constant(f, interval=(0, 6), num_points=1000)
+    >>> print(round(result['L'], 2))
+    6.0
+    """
+    if num_points < 2:
+        raise ValueError("Параметр num_points должен быть не меньше 2.")
+
+    a, b = interval
+
+    x_vals = np.linspace(a, b, num_points)
+    y_vals = evaluate(f, x_vals, vectorized)
+    N = num_points
+
+    slopes = np.abs(np.diff(y_vals)) / np.diff(x_vals)
+    L = float(slopes.max())
+
+    t = np.linspace(0, 1, refine_points + 2)[1:-1]
+    for _ in range(max_rounds):
+        k = min(top_k, slopes.size)
+        steepest = np.argpartition(slopes, -k)[-k:]
+
+        left = x_vals[steepest]
+        width = x_vals[steepest + 1] - left
+        new_x = (left[:, None] + width[:, None] * t).ravel()
+        new_y = evaluate(f, new_x, vectorized)
+        N += new_x.size
+
+        x_vals = np.concatenate((x_vals, new_x))
+        y_vals = np.concatenate((y_vals, new_y))
+        order = np.argsort(x_vals, kind="stable")
+        x_vals, y_vals = x_vals[order], y_vals[order]
+
+        slopes = np.abs(np.diff(y_vals)) / np.diff(x_vals)
+        L_new = float(slopes.max())
+        if L_new <= L * (1 + tol):
+            L = max(L, L_new)
+            break
+        L = L_new
+
+    return {"L": L, "N": N}
@@ -0,0 +1,215 @@
+from ...custom_types import Number, NumericalMethod, OptimizationFnReturnValue, OptimizationResult
+from ...cached_function import Budget, BudgetExhausted, budgeted, evaluations
+from ...stepper import State, Stepper
+from random import Random, uniform
+from time import perf_counter
+
+def parabolic_approximation(
+    fn: NumericalMethod,
+    a: Number,
+    b: Number,
+    eps: Number,
+    max_iterations = 100000,
+    max_evals: int | None = None,
+    deadline: float | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимум функции с помощью метода параболлической апроксимации.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        a (Number): Левая граница интервала, в котором ищется минимум.\n
+        b (Number): Правая граница интервала, в котором ищется минимум.\n
+        eps (Number): Точность поиска (порог для завершения).\n
+        max_iterations (int): Максимальное количество итераций.\n
+        max_evals (int | None): Максимальное количество вычислений функции.\n
+        deadline (float | None): Ограничение времени работы в секундах.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                                Поле x — значение аргумента, при котором достигается минимум.
+                                Поле y — значение функции в точке минимума.
+                                Остальные поля описаны в OptimizationResult.
+
+    Если метод не сошелся за max_iterations итераций, возвращается лучшая из
+    найденных точек с converged=False.
+
+    Если исчерпан лимит max_evals или deadline, возвращается лучшая из вычисленных точек
+    и текущий интервал с converged=False и status=BUDGET_EXHAUSTED.
+
+    Исключения:\n
+        ValueError: Если eps <= 0 (некорректное значение точности) или
+                    начальные точки не образуют тройку a < (a + b) / 2 < b
+                    с f(a) >= f((a + b) / 2) <= f(b).
+
+    Примеры:
+    >>> def f(x):
+    ...     return (x - 3) ** 2
+    >>> result = parabolic_approximation(f, 0, 6, 0.01)
+    >>> print(round(result.x, 2), round(result.y, 4))
+    3.0 0.0
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+
+    start = perf_counter()
+    budget = Budget.create(max_evals, deadline)
+    fn = budgeted(fn, budget, observe=True)
+    k = 0
+    x_1 = a
+    x_2 = (a + b) / 2
+    x_3 = b
+
+    try:
+        y_1 = fn(x_1)
+        y_2 = fn(x_2)
+        y_3 = fn(x_3)
+
+        if not (x_1 < x_2 < x_3 and y_1 >= y_2 <= y_3):
+            raise ValueError("Неверные входные данные, измените начальные точки")
+
+        for k in range(1, max_iterations + 1):
+            numerator = (y_1 * (x_2**2 - x_3**2) + 
+                           y_2 * (x_3**2 - x_1**2) + 
+                           y_3 * (x_1**2 - x_2**2))
+        
+            denominator = (2 * y_1 * (x_2 - x_3) + 
+                       y_2 * (x_3 - x_1) + 
+                       y_3 * (x_1 - x_2))
+
+            if denominator == 0:
+                x_tilda = uniform(x_1, x_3)
+            else:
+                x_tilda = numerator / denominator
+
+
+            if x_tilda < x_1 or x_tilda > x_3:
+                x_tilda = uniform(x_1, x_3)
+        
+            
+            y_tilda = fn(x_tilda)
+
+            if abs(x_1 - x_3) < eps:
+                return OptimizationResult(
+                    x_tilda, y_tilda, n=k, n_fn=evaluations(fn, k + 3), a=x_1, b=x_3,
+                    time=perf_counter() - start,
+                )
+        
+            if x_2 <= x_tilda <= x_3:
+                if y_tilda <= y_2:
+                    x_1, y_1 = x_2, y_2
+                    x_2, y_2 = x_tilda, y_tilda
+                else:
+                    x_3, y_3 = x_tilda, y_tilda
+            elif x_1 <= x_tilda <= x_2:
+                if y_tilda <= y_2:
+                    x_3, y_3 = x_2, y_2
+                    x_2, y_2 = x_tilda, y_tilda
+                else:
+                    x_1, y_1 = x_tilda, y_tilda
+        else:
+            return OptimizationResult(
+                x_2, y_2, n=max_iterations, n_fn=evaluations(fn, max_iterations + 3),
+                a=x_1, b=x_3, converged=False, time=perf_counter() - start,
+            )
+    except BudgetExhausted:
+        return budget.result(
+            x_2, n=k, n_fn=fn.evaluations, a=x_1, b=x_3, time=perf_counter() - start
+        )
+
+class ParabolicApproximationStepper(Stepper):
+    """
+    Пошаговый вариант метода параболической аппроксимации
+    (см. parabolic_approximation и Stepper).
+
+    Состояние: тройка точек x_1 < x_2 < x_3 со значениями y_1, y_2, y_3, точность eps,
+    лимит итераций max_iterations и состояние генератора случайных чисел rng
+    (для случайной точки, когда вершина параболы не подходит), поэтому
+    возобновлённый поиск повторяет исходный в точности. x, y — средняя точка
+    тройки, a, b — крайние.
+
+    Примеры:
+    >>> stepper = ParabolicApproximationStepper(lambda x: (x - 2) ** 2, 0, 5, 0.01, seed=0)
+    >>> result = stepper.run()
+    >>> print(round(result.x, 2), round(result.y, 4))
+    2.0 0.0
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        fn: NumericalMethod,
+        a: Number,
+        b: Number,
+        eps: Number,
+        max_iterations: int = 100000,
+        seed: int | None = None,
+    ) -> None:
+        if eps <= 0:
+            raise ValueError("Параметр eps должен быть положительным.")
+        super().__init__(
+            fn, eps=eps, max_iterations=max_iterations, rng=Random(seed).getstate(),
+            x_1=a, x_2=(a + b) / 2, x_3=b,
+        )
+
+    def _initialize(self, state: State) -> None:
+        for i in (1, 2, 3):
+            state[f"y_{i}"] = self.evaluate(state[f"x_{i}"])
+        x_1, x_2, x_3 = state["x_1"], state["x_2"], state["x_3"]
+        if not (x_1 < x_2 < x_3 and state["y_1"] >= state["y_2"] <= state["y_3"]):
+            raise ValueError("Неверные входные данные, измените начальные точки")
+        self._update(state)
+
+    def _uniform(self, state: State, a: Number, b: Number) -> Number:
+        rng = Random()
+        rng.setstate(state["rng"])
+        x = rng.uniform(a, b)
+        state["rng"] = rng.getstate()
+        return x
+
+    def _step(self, state: State) -> None:
+        state["k"] += 1
+        x_1, x_2, x_3 = state["x_1"], state["x_2"], state["x_3"]
+        y_1, y_2, y_3 = state["y_1"], state["y_2"], state["y_3"]
+        numerator = y_1 * (x_2**2 - x_3**2) + y_2 * (x_3**2 - x_1**2) + y_3 * (x_1**2 - x_2**2)
+        denominator = 2 * y_1 * (x_2 - x_3) + y_2 * (x_3 - x_1) + y_3 * (x_1 - x_2)
+        if denominator == 0:
+            x_tilda = self._uniform(state, x_1, x_3)
+        else:
+            x_tilda = numerator / denominator
+        if x_tilda < x_1 or x_tilda > x_3:
+            x_tilda = self._uniform(state, x_1, x_3)
+        y_tilda = self.evaluate(x_tilda)
+
+        if abs(x_1 - x_3) < state["eps"]:
+            state["x"], state["y"] = x_tilda, y_tilda
+            state["done"] = state["converged"] = True
+            return
+
+        if x_2 <= x_tilda <= x_3:
+            if y_tilda <= y_2:
+                state.update(x_1=x_2, y_1=y_2, x_2=x_tilda, y_2=y_tilda)
+            else:
+                state.update(x_3=x_tilda, y_3=y_tilda)
+        elif x_1 <= x_tilda <= x_2:
+            if y_tilda <= y_2:
+                state.update(x_3=x_2, y_3=y_2, x_2=x_tilda, y_2=y_tilda)
+            else:
+                state.update(x_1=x_tilda, y_1=y_tilda)
+        self._update(state)
+        state["done"] = state["k"] >= state["max_iterations"]
+
+    def _update(self, state: State) -> None:
+        state["x"], state["y"] = state["x_2"], state["y_2"]
+        state["a"], state["b"] = state["x_1"], state["x_3"]
+
+if __name__ == "__main__":
+    input_fn = lambda x: x**2 - 2 * x + 16 / (x - 1) - 13
+    a, b = 2, 5
+    eps = 1e-5
+    res = parabolic_approximation(input_fn, a, b, eps)
+    if res.converged:
+        print(f"x: {res['x']}, y: {res['y']}")
+    else:
+        print("Метод не сошелся за заданное число операций")
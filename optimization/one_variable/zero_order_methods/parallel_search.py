@@ -0,0 +1,140 @@
+from ...custom_types import Number, NumericalMethod, OptimizationFnReturnValue, OptimizationResult
+from concurrent.futures import Executor, ThreadPoolExecutor
+from time import perf_counter
+import os
+
+
+def dichotomy_rounds(a: Number, b: Number, eps: Number) -> int:
+    """
+    Возвращает количество итераций метода дихотомии с той же точностью (см. dichotomy)
+    без вычисления функции: каждая итерация заменяет длину интервала l на l / 2 + eps / 4.
+
+    Примеры:
+    >>> dichotomy_rounds(0, 4, 0.01)
+    10
+    """
+    l, k = b - a, 0
+    while l > eps:
+        l = l / 2 + eps / 4
+        k += 1
+    return k
+
+
+def parallel_interval_search(
+    fn: NumericalMethod,
+    a: Number,
+    b: Number,
+    eps: Number,
+    p: int | None = None,
+    executor: Executor | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимум унимодальной функции, вычисляя p пробных точек за раунд
+    параллельно.
+
+    В первом раунде интервал делится p равноотстоящими точками. Минимум лежит между
+    соседями лучшей из них, поэтому новый интервал — две ячейки сетки с лучшей точкой
+    в центре. В следующих раундах эта точка переиспользуется: вместе с ней сетка
+    содержит нечётное число m внутренних точек (m = p + 1 для чётного p и m = p для
+    нечётного), и вычисляются только m - 1 новых. За раунд интервал сокращается
+    в (m + 1) / 2 раза. При p = 2 метод совпадает с делением интервала
+    (split_interval), а количество раундов сравнивается с дихотомией, у которой
+    две пробные точки итерации тоже вычисляются одновременно.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум; для пула
+                              процессов должна быть сериализуемой.\n
+        a (Number): Левая граница интервала, в котором ищется минимум.\n
+        b (Number): Правая граница интервала, в котором ищется минимум.\n
+        eps (Number): Точность поиска (порог для завершения).\n
+        p (int | None): Количество вычислений за раунд. По умолчанию — количество
+                        ядер процессора, но не меньше 2; при переданном executor
+                        его лучше задать равным числу исполнителей пула.\n
+        executor (Executor | None): Пул потоков или процессов. По умолчанию создаётся
+                                    ThreadPoolExecutor на p потоков.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                    Поле x — лучшая из вычисленных точек, y — значение в ней.
+                    Поле n — количество раундов, n_fn — общее количество вызовов.
+                    Поля a, b — итоговый интервал.
+                    Поле info['p'] — количество вычислений за раунд.
+                    Поле info['dichotomy_rounds'] — количество итераций дихотомии.
+                    Поле info['speedup'] — dichotomy_rounds / n.
+                    Остальные поля описаны в OptimizationResult.
+
+    Исключения:\n
+        ValueError: Если eps <= 0, a >= b или p < 2.
+
+    Примеры:
+    >>> def f(x):
+    ...     return (x - 2) ** 2
+    >>> result = parallel_interval_search(f, 0, 4, 0.01, p=4)
+    >>> print(round(result.x, 2), result.n, result.n_fn, result.info["dichotomy_rounds"])
+    2.0 6 24 10
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+    if a >= b:
+        raise ValueError("Левая граница интервала должна быть меньше правой.")
+    if p is None:
+        p = max(os.cpu_count() or 2, 2)
+    if p < 2:
+        raise ValueError("Параметр p должен быть не меньше 2.")
+
+    start = perf_counter()
+    rounds = dichotomy_rounds(a, b, eps)
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=p)
+    try:
+        h = (b - a) / (p + 1)
+        xs = [a + h * i for i in range(1, p + 1)]
+        x_best, y_best = None, None
+        for x_i, y_i in zip(xs, executor.map(fn, xs)):
+            if x_best is None or y_i < y_best:
+                x_best, y_best = x_i, y_i
+        n_fn = p
+        k = 1
+        a, b = x_best - h, x_best + h
+
+        m = p + 1 if p % 2 == 0 else p
+        half = m // 2
+        while b - a > eps:
+            k += 1
+            h = (b - a) / (m + 1)
+            xs = [x_best + h * i for i in range(-half, half + 1) if i != 0]
+            for x_i, y_i in zip(xs, executor.map(fn, xs)):
+                if y_i < y_best:
+                    x_best, y_best = x_i, y_i
+            n_fn += m - 1
+            a, b = x_best - h, x_best + h
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    return OptimizationResult(
+        x_best, y_best, n=k, n_fn=n_fn, a=a, b=b, time=perf_counter() - start,
+        info={"p": p, "dichotomy_rounds": rounds, "speedup": rounds / k},
+    )
+
+
+if __name__ == "__main__":
+    from .dichotomy import dichotomy
+    from time import sleep
+
+    # Функция имитирует дорогое вычисление: каждый вызов ждёт 10 мс
+    def slow_fn(x):
+        sleep(0.01)
+        return x**2 - 2 * x + 16 / (x - 1) - 13
+
+    a, b = 2, 5
+    eps = 10**-3
+    res = dichotomy(slow_fn, a, b, eps)
+    print(f"dichotomy: x: {res.x}, N: {res.n}, время: {res.time:.3f} с")
+    for p in (2, 4, 8, 16):
+        res = parallel_interval_search(slow_fn, a, b, eps, p=p)
+        print(
+            f"p = {p}: x: {res.x}, раундов: {res.n}, N: {res.n_fn}, "
+            f"ускорение: {res.info['speedup']:.2f}, время: {res.time:.3f} с"
+        )
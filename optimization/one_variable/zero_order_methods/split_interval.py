@@ -0,0 +1,125 @@
+from math import ceil, log2, log
+from ...custom_types import Number, NumericalMethod, OptimizationFnReturnValue
+from ...cached_function import Budget
+from .compiled import kernel_search
+from ...stepper import State, Stepper
+
+
+def split_interval(
+    fn: NumericalMethod,
+    a: Number,
+    b: Number,
+    eps: Number,
+    max_evals: int | None = None,
+    deadline: float | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимум функции с помощью метода деления интервала.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        a (Number): Левая граница интервала, в котором ищется минимум.\n
+        b (Number): Правая граница интервала, в котором ищется минимум.\n
+        eps (Number): Точность поиска (порог для завершения).\n
+        max_evals (int | None): Максимальное количество вычислений функции.\n
+        deadline (float | None): Ограничение времени работы в секундах.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                    Поле x — значение аргумента, при котором достигается минимум.
+                    Поле y — значение функции в точке минимума.
+                    Поле n — количество итераций, необходимых для достижения минимума.
+                    Поле n_fn — общее количество вызовов целевой функции.
+                    Поля a, b — обновленные границы интервала.
+                    Остальные поля описаны в OptimizationResult.
+
+    Если исчерпан лимит max_evals или deadline, возвращается лучшая из вычисленных точек
+    и текущий интервал с converged=False и status=BUDGET_EXHAUSTED.
+
+    Если max_evals и deadline не заданы, поиск выполняется ядром метода без обёртки
+    CachedFunction (см. kernel_search); если при этом установлен Numba и fn скомпилирована
+    с помощью numba.njit, ядро компилируется целиком. С лимитами итерации выполняет
+    SplitIntervalStepper (см. Stepper.run_budgeted).
+
+    Исключения:\n
+        ValueError: Если eps <= 0 (некорректное значение точности).
+
+    Примеры:
+    >>> def f(x):
+    ...     return (x - 4) ** 2
+    >>> result = split_interval(f, 0, 10, 0.01)
+    >>> print(round(result.x, 2), result.n, result.n_fn)
+    4.0 10 21
+    """
+
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+    budget = Budget.create(max_evals, deadline)
+    if budget is None:
+        return kernel_search("split_interval", fn, a, b, eps)
+    return SplitIntervalStepper.run_budgeted(fn, budget, a, b, eps)
+
+
+class SplitIntervalStepper(Stepper):
+    """
+    Пошаговый вариант метода деления интервала пополам (см. split_interval и Stepper).
+
+    Состояние: текущий интервал a, b, точность eps и средняя точка avg_x со
+    значением avg_y; x, y — средняя точка, после завершения — середина интервала.
+
+    Примеры:
+    >>> stepper = SplitIntervalStepper(lambda x: (x - 2) ** 2, 0, 4, 0.01)
+    >>> result = stepper.run()
+    >>> print(result.x, result.y)
+    2.0 0.0
+    """
+
+    __slots__ = ()
+
+    def __init__(self, fn: NumericalMethod, a: Number, b: Number, eps: Number) -> None:
+        if eps <= 0:
+            raise ValueError("Параметр eps должен быть положительным.")
+        super().__init__(fn, a=a, b=b, eps=eps, avg_x=(a + b) / 2)
+
+    def _initialize(self, state: State) -> None:
+        state["avg_y"] = self.evaluate(state["avg_x"])
+        self._check(state)
+
+    def _step(self, state: State) -> None:
+        state["k"] += 1
+        a, b = state["a"], state["b"]
+        avg_x, avg_y = state["avg_x"], state["avg_y"]
+        alpha_x = a + (b - a) / 4
+        beta_x = b - (b - a) / 4
+        alpha_y = self.evaluate(alpha_x)
+        beta_y = self.evaluate(beta_x)
+        if alpha_y < avg_y:
+            b = avg_x
+            avg_x, avg_y = alpha_x, alpha_y
+        elif beta_y < avg_y:
+            a = avg_x
+            avg_x, avg_y = beta_x, beta_y
+        else:
+            a = alpha_x
+            b = beta_x
+        state.update(a=a, b=b, avg_x=avg_x, avg_y=avg_y)
+        self._check(state)
+
+    def _check(self, state: State) -> None:
+        state["x"], state["y"] = state["avg_x"], state["avg_y"]
+        if state["b"] - state["a"] <= state["eps"]:
+            x_min = (state["a"] + state["b"]) / 2
+            state["x"], state["y"] = x_min, self.evaluate(x_min)
+            state["done"] = state["converged"] = True
+
+
+if __name__ == "__main__":
+    input_fn = lambda x: x**2 - 2 * x + 16 / (x - 1) - 13
+    a, b = 2, 5
+    eps = 10**-3
+    res = split_interval(input_fn, a, b, eps)
+    print(f"x: {res['x']}\ty: {res['y']}")
+    R = 1 / 2 ** ((res.n_fn - 1) / 2)
+    print(f"N: {res.n_fn}\tN(theory): {ceil(2 * log(R) / log(0.5))}")
+    print(f"n: {res.n}\tn(theory): {ceil(log2((b - a) / eps))}")
+    print(f"R(N): {abs(res.b - res.a)/abs(b - a)}\tR(N)(theory): {R}")
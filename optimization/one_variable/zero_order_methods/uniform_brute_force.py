@@ -0,0 +1,98 @@
+from ...custom_types import Number, NumericalMethod, OptimizationFnReturnValue, OptimizationResult
+from ...cached_function import Budget, BudgetExhausted, budgeted, evaluations
+from time import perf_counter
+from .grid_search import CHUNK_SIZE, grid_search
+from .lipschitz_constant import lipschitz_constant
+import numpy as np
+
+
+def uniform_brute_force(
+    fn: NumericalMethod,
+    interval: tuple[Number, Number],
+    L: Number,
+    eps: Number,
+    chunk_size: int = CHUNK_SIZE,
+    vectorized: bool = False,
+    max_evals: int | None = None,
+    deadline: float | None = None,
+) -> OptimizationFnReturnValue:
+    """
+    Находит минимум функции с помощью метода равномерного перебора.
+
+    Точки с шагом h = 2 * eps / L перебираются блоками по chunk_size штук,
+    поэтому расход памяти не зависит от числа точек. При L = 0 (например, если
+    lipschitz_constant оценила константу для постоянной функции) функция
+    вычисляется только в середине и на концах интервала.
+
+    Параметры:\n
+        fn (NumericalMethod): Функция, для которой необходимо найти минимум.\n
+        inerval (tuple[Number, Number]): Интервал, в котором ищется минимум.\n
+        L (Number): Константа Липшица.\n
+        eps (Number): Точность поиска.\n
+        chunk_size (int): Максимальное количество точек в одном блоке.\n
+        vectorized (bool): Принимает ли fn массив NumPy целиком.\n
+        max_evals (int | None): Максимальное количество вычислений функции.\n
+        deadline (float | None): Ограничение времени работы в секундах.\n
+
+    Возвращает:\n
+        OptimizationFnReturnValue: Результат поиска минимума.
+                                Поле x — значение аргумента, при котором достигается минимум.
+                                Поле y — значение функции в точке минимума.
+                                Остальные поля описаны в OptimizationResult.
+
+    Если исчерпан лимит max_evals или deadline, возвращается лучшая из вычисленных точек
+    и исходный интервал с converged=False и status=BUDGET_EXHAUSTED.
+
+    Исключения:\n
+        ValueError: Если eps <= 0 (некорректное значение точности) или L < 0.
+
+    Примеры:
+    >>> def f(x):
+    ...     return (x - 3) ** 2
+    >>> result = uniform_brute_force(f, interval=(0, 6), L=6, eps=10e-3)
+    >>> print(round(result.x, 2), round(result.y, 4))
+    3.0 0.0
+    >>> print(uniform_brute_force(lambda x: 1.0, interval=(0, 6), L=0, eps=10e-3).n_fn)
+    3
+    """
+    if eps <= 0:
+        raise ValueError("Параметр eps должен быть положительным.")
+    if L < 0:
+        raise ValueError("Параметр L должен быть неотрицательным.")
+
+    start = perf_counter()
+    budget = Budget.create(max_evals, deadline)
+    fn = budgeted(fn, budget, observe=True)
+    a, b = interval
+    h = 2 * eps / L if L > 0 else b - a
+
+    # Точки a + h / 2 + h * i, не выходящие за b, и концы интервала.
+    n = max(int((b - a - h / 2) // h) + 1, 0)
+    try:
+        best = {"x": a, "y": fn(a)}
+        if n > 0:
+            res = grid_search(fn, a + h / 2, h, n, chunk_size, vectorized)
+            if res["y"] < best["y"]:
+                best = {"x": res["x"], "y": res["y"]}
+        y_b = fn(b)
+        if y_b < best["y"]:
+            best = {"x": b, "y": y_b}
+
+        return OptimizationResult(
+            best["x"], best["y"], n=1, n_fn=evaluations(fn, n + 2),
+            a=max(a, best["x"] - h), b=min(b, best["x"] + h),
+            time=perf_counter() - start,
+        )
+    except BudgetExhausted:
+        return budget.result(
+            n=1, n_fn=fn.evaluations, a=a, b=b, time=perf_counter() - start
+        )
+
+
+if __name__ == "__main__":
+    fn = lambda x: np.cos(x) / x**2
+    a, b = 9, 11
+    eps = 10**-3
+    L = lipschitz_constant(fn, interval=(a, b), vectorized=True)["L"]
+    res = uniform_brute_force(fn, interval=(a, b), L=L, eps=eps, vectorized=True)
+    print(f"x: {res['x']}, y: {res['y']}")
@@ -0,0 +1,37 @@
+# Методы минимизации функций нескольких переменных.
+# Имена загружаются лениво: модуль с методом (и NumPy/SciPy вместе с ним)
+# импортируется при первом обращении.
+from importlib import import_module
+
+_EXPORTS = {
+    "CountedFunction": ".counted_function",
+    # Методы нулевого порядка
+    "hooke_jeeves": ".zero_order_methods.hooke_jeeves",
+    "HookeJeevesStepper": ".zero_order_methods.hooke_jeeves",
+    "multi_start_hooke_jeeves": ".zero_order_methods.multi_start",
+    # Методы первого порядка
+    "conjugate_gradient_method": ".first_order_methods.conjugate_gradient",
+    "ConjugateGradientStepper": ".first_order_methods.conjugate_gradient",
+    "linear_conjugate_gradient": ".first_order_methods.conjugate_gradient",
+    "LinearConjugateGradientStepper": ".first_order_methods.conjugate_gradient",
+    "lbfgs": ".first_order_methods.lbfgs",
+    "LBFGSStepper": ".first_order_methods.lbfgs",
+    # Методы второго порядка
+    "newton_method": ".second_order_methods.newton",
+    "NewtonMethodStepper": ".second_order_methods.newton",
+    "HessianFactorization": ".second_order_methods.newton",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
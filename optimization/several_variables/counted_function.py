@@ -0,0 +1,28 @@
+from typing import Any, Callable
+
+
+class CountedFunction:
+    """
+    Обёртка над функцией нескольких переменных, считающая её вызовы.
+
+    Атрибуты:\n
+        fn (Callable): Исходная функция.\n
+        calls (int): Количество вызовов.\n
+
+    Примеры:
+    >>> f = CountedFunction(lambda x: x[0] ** 2 + x[1] ** 2)
+    >>> f([1, 2]), f([0, 0])
+    (5, 0)
+    >>> print(f.calls)
+    2
+    """
+
+    __slots__ = ("fn", "calls")
+
+    def __init__(self, fn: Callable[..., Any]) -> None:
+        self.fn = fn
+        self.calls = 0
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls += 1
+        return self.fn(*args, **kwargs)
@@ -0,0 +1,249 @@
+import numpy as np
+from ..counted_function import CountedFunction
+from ...custom_types import OptimizationResult
+from ...stepper import Stepper
+from time import perf_counter
+
+def conjugate_gradient_method(f, grad_f, x0, epsilon=0.01, max_iter=10):
+    from scipy.optimize import minimize_scalar
+
+    start = perf_counter()
+    f, grad_f = CountedFunction(f), CountedFunction(grad_f)
+    x = x0
+    grad = grad_f(x)
+    p = -grad
+    k = 0
+    converged = np.linalg.norm(grad) <= epsilon
+
+    while not converged and k < max_iter:
+
+        def f_alpha(alpha):
+            return f(x + alpha * p)
+
+        res = minimize_scalar(f_alpha)
+        alpha = res.x 
+
+        x = x + alpha * p
+
+        grad_new = grad_f(x)
+
+        if np.linalg.norm(grad_new) <= epsilon:
+            converged = True
+            break
+
+        beta = np.dot(grad_new, grad_new) / np.dot(grad, grad)
+
+        p = -grad_new + beta * p
+
+        grad = grad_new
+        k += 1
+
+    return OptimizationResult(
+        x, f(x), n=k, n_fn=f.calls, n_d_fn=grad_f.calls, converged=converged,
+        time=perf_counter() - start,
+    )
+
+# Матрица, разреженная матрица SciPy или LinearOperator приводятся к функции
+# умножения на вектор; функция возвращается без изменений.
+def as_matvec(A):
+    if hasattr(A, "dot"):
+        return A.dot
+    if callable(A):
+        return A
+    raise TypeError("A должна быть матрицей, оператором или функцией умножения на вектор.")
+
+# Линейный метод сопряженных градиентов для квадратичной функции
+# f(x) = 1/2 x^T A x - b^T x с симметричной положительно определённой A,
+# то есть для решения системы A x = b. Матрица явно не нужна: A может быть
+# массивом NumPy, разреженной матрицей SciPy, LinearOperator или функцией A(p),
+# возвращающей A @ p. Шаг вдоль направления вычисляется точно,
+# alpha = (r, z) / (p, A p), поэтому на итерацию приходится одно умножение
+# на матрицу и O(n) операций с заранее выделенными векторами.
+# M — необязательный предобуславливатель в том же виде, применяющий M^{-1} к
+# невязке. Остановка — когда норма невязки (градиента) не больше epsilon.
+# В n_d_fn возвращается количество умножений на матрицу.
+def linear_conjugate_gradient(A, b, x0=None, epsilon=1e-8, max_iter=None, M=None):
+    start = perf_counter()
+    matvec = as_matvec(A)
+    precond = None if M is None else as_matvec(M)
+    b = np.asarray(b, dtype=float)
+    n = b.size
+    max_iter = n if max_iter is None else max_iter
+
+    if x0 is None:
+        x = np.zeros(n)
+        r = b.copy()
+        matvecs = 0
+    else:
+        x = np.array(x0, dtype=float)
+        r = b - matvec(x)
+        matvecs = 1
+    z = r if precond is None else precond(r)
+    p = z.copy()
+    step = np.empty(n)
+    rz = np.dot(r, z)
+    residual = np.linalg.norm(r)
+    k = 0
+
+    while residual > epsilon and k < max_iter:
+        q = matvec(p)
+        matvecs += 1
+        pq = np.dot(p, q)
+        if pq <= 0:
+            raise ValueError("Матрица A должна быть положительно определённой.")
+        alpha = rz / pq
+
+        np.multiply(p, alpha, out=step)
+        x += step
+        np.multiply(q, alpha, out=step)
+        r -= step
+        residual = np.linalg.norm(r)
+        k += 1
+        if residual <= epsilon:
+            break
+
+        z = r if precond is None else precond(r)
+        rz_new = np.dot(r, z)
+        p *= rz_new / rz
+        p += z
+        rz = rz_new
+
+    # f(x) = 1/2 x^T (b - r) - b^T x без дополнительного умножения на матрицу
+    y = -0.5 * (np.dot(x, b) + np.dot(x, r))
+    return OptimizationResult(
+        x, y, n=k, n_d_fn=matvecs, converged=bool(residual <= epsilon),
+        time=perf_counter() - start, info={"residual": residual},
+    )
+
+# Пошаговый вариант метода сопряженных градиентов (см. conjugate_gradient_method
+# и Stepper). Состояние: точка x, градиент grad, направление p и параметры метода.
+class ConjugateGradientStepper(Stepper):
+    __slots__ = ()
+
+    def __init__(self, f, grad_f, x0, epsilon=0.01, max_iter=10):
+        super().__init__(f, grad_f, x=x0, epsilon=epsilon, max_iter=max_iter)
+
+    def _initialize(self, state):
+        state["grad"] = self.derivative(state["x"])
+        state["p"] = -state["grad"]
+        if np.linalg.norm(state["grad"]) <= state["epsilon"]:
+            self._finish(state, True)
+        elif state["max_iter"] <= 0:
+            self._finish(state, False)
+
+    def _step(self, state):
+        from scipy.optimize import minimize_scalar
+
+        x, p, grad = state["x"], state["p"], state["grad"]
+        alpha = minimize_scalar(lambda alpha: self.evaluate(x + alpha * p)).x
+        state["x"] = x = x + alpha * p
+        grad_new = self.derivative(x)
+        if np.linalg.norm(grad_new) <= state["epsilon"]:
+            self._finish(state, True)
+            return
+
+        beta = np.dot(grad_new, grad_new) / np.dot(grad, grad)
+        state["p"] = -grad_new + beta * p
+        state["grad"] = grad_new
+        state["k"] += 1
+        if state["k"] >= state["max_iter"]:
+            self._finish(state, False)
+
+    def _finish(self, state, converged):
+        state["y"] = self.evaluate(state["x"])
+        state["done"] = True
+        state["converged"] = converged
+
+# Пошаговый вариант линейного метода сопряженных градиентов
+# (см. linear_conjugate_gradient и Stepper). A и M передаются в конструктор и в
+# resume вместо функции и производной. Состояние: решение x, невязка r, направление
+# p, скалярное произведение rz = (r, M^{-1} r), норма невязки residual и правая
+# часть b. В n_d_fn считается количество умножений на матрицу.
+class LinearConjugateGradientStepper(Stepper):
+    __slots__ = ()
+
+    def __init__(self, A, b, x0=None, epsilon=1e-8, max_iter=None, M=None):
+        b = np.asarray(b, dtype=float)
+        max_iter = b.size if max_iter is None else max_iter
+        x = np.zeros(b.size) if x0 is None else np.array(x0, dtype=float)
+        super().__init__(A, M, x=x, b=b, epsilon=epsilon, max_iter=max_iter)
+
+    def _bind(self, A, M, f_2nd):
+        super()._bind(as_matvec(A), None if M is None else as_matvec(M), f_2nd)
+
+    def _precondition(self, r):
+        return r if self.d_fn is None else self.d_fn(r)
+
+    def _initialize(self, state):
+        if np.any(state["x"]):
+            r = state["b"] - self.fn(state["x"])
+            state["n_d_fn"] += 1
+        else:
+            r = state["b"].copy()
+        z = self._precondition(r)
+        state.update(r=r, p=z.copy(), rz=np.dot(r, z), residual=np.linalg.norm(r))
+        self._check(state)
+
+    def _step(self, state):
+        x, r, p = state["x"], state["r"], state["p"]
+        q = self.fn(p)
+        state["n_d_fn"] += 1
+        pq = np.dot(p, q)
+        if pq <= 0:
+            raise ValueError("Матрица A должна быть положительно определённой.")
+        alpha = state["rz"] / pq
+        x += alpha * p
+        r -= alpha * q
+        state["residual"] = np.linalg.norm(r)
+        state["k"] += 1
+        if state["residual"] > state["epsilon"]:
+            z = self._precondition(r)
+            rz_new = np.dot(r, z)
+            p *= rz_new / state["rz"]
+            p += z
+            state["rz"] = rz_new
+        self._check(state)
+
+    def _check(self, state):
+        if state["residual"] <= state["epsilon"]:
+            state["done"] = state["converged"] = True
+        elif state["k"] >= state["max_iter"]:
+            state["done"] = True
+
+    def result(self):
+        state = self.state
+        res = super().result()
+        res.y = -0.5 * (np.dot(state["x"], state["b"]) + np.dot(state["x"], state["r"]))
+        res.info["residual"] = state["residual"]
+        return res
+
+if __name__ == "__main__":
+    def f(x):
+        x1, x2 = x
+        return x1**4 + 2 * x2**4 + x1**2 * x2**2 + 2 * x1 + x2
+
+    def grad_f(x):
+        x1, x2 = x
+        df_dx1 = 4 * x1**3 + 2 * x1 * x2**2 + 2
+        df_dx2 = 8 * x2**3 + 2 * x1**2 * x2 + 1
+        return np.array([df_dx1, df_dx2])
+
+    x0 = np.array([2.0, 3.0])
+    epsilon = 0.001
+
+    res = conjugate_gradient_method(f, grad_f, x0, epsilon)
+
+    print("Решение:", res.x)
+    print("Минимальное значение функции:", res.y)
+    print("Количество итераций:", res.n)
+
+    # Линейный режим: трёхдиагональная матрица второй разности, заданная функцией
+    def laplacian(p):
+        q = 2 * p
+        q[1:] -= p[:-1]
+        q[:-1] -= p[1:]
+        return q
+
+    n = 1000
+    res = linear_conjugate_gradient(laplacian, np.ones(n), epsilon=1e-8)
+    print("Линейный метод: итераций", res.n, "невязка", res.info["residual"])
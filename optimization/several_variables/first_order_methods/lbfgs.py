@@ -0,0 +1,202 @@
+import numpy as np
+from ..counted_function import CountedFunction
+from ...custom_types import OptimizationResult
+from ...stepper import Stepper
+from time import perf_counter
+
+# Поиск шага с возвратом по условию Армихо: f(x + t p) <= f(x) + c1 t (grad, p).
+# x_new — заранее выделенный вектор для пробной точки.
+def backtracking(f, x, fx, grad_dot_p, p, x_new, c1=1e-4, shrink=0.5, max_steps=50):
+    t = 1.0
+    for _ in range(max_steps):
+        np.multiply(p, t, out=x_new)
+        x_new += x
+        f_new = f(x_new)
+        if f_new <= fx + c1 * t * grad_dot_p:
+            return t, f_new
+        t *= shrink
+    return t, f_new
+
+# Метод L-BFGS (BFGS с ограниченной памятью).
+# Хранятся только m последних пар s_k = x_{k+1} - x_k, y_k = grad_{k+1} - grad_k
+# в кольцевых буферах S и Y размера (m, n), поэтому память — O(mn), а направление
+# -H_k grad вычисляется двухцикловой рекурсией за O(mn) операций без матриц n x n.
+# Пары с (s, y) <= 0 не сохраняются, чтобы приближение оставалось положительно
+# определённым. Остановка — когда норма градиента не больше epsilon.
+# В info['time_per_iteration'] и info['evaluations_per_iteration'] возвращаются
+# средние время и количество вызовов f на итерацию — по ним удобно подбирать m.
+def lbfgs(f, grad_f, x0, epsilon=1e-5, m=10, max_iter=1000):
+    start = perf_counter()
+    if m <= 0:
+        raise ValueError("Параметр m должен быть положительным.")
+    f, grad_f = CountedFunction(f), CountedFunction(grad_f)
+    x = np.array(x0, dtype=float)
+    n = x.size
+
+    S = np.empty((m, n))
+    Y = np.empty((m, n))
+    rho = np.empty(m)
+    alpha = np.empty(m)
+    q = np.empty(n)
+    x_new = np.empty(n)
+    stored = 0
+    newest = -1
+
+    fx = f(x)
+    grad = grad_f(x)
+    k = 0
+    converged = np.linalg.norm(grad) <= epsilon
+
+    while not converged and k < max_iter:
+        # Двухцикловая рекурсия: q = -H_k grad
+        np.copyto(q, grad)
+        for j in range(stored):
+            i = (newest - j) % m
+            alpha[i] = rho[i] * np.dot(S[i], q)
+            q -= alpha[i] * Y[i]
+        if stored:
+            q *= np.dot(S[newest], Y[newest]) / np.dot(Y[newest], Y[newest])
+        else:
+            q /= max(np.linalg.norm(grad), 1.0)
+        for j in range(stored - 1, -1, -1):
+            i = (newest - j) % m
+            beta = rho[i] * np.dot(Y[i], q)
+            q += (alpha[i] - beta) * S[i]
+        q *= -1
+
+        grad_dot_p = np.dot(grad, q)
+        if grad_dot_p >= 0:
+            # Направление не является направлением спуска: сбрасываем память
+            stored = 0
+            np.negative(grad, out=q)
+            grad_dot_p = -np.dot(grad, grad)
+
+        _, f_new = backtracking(f, x, fx, grad_dot_p, q, x_new)
+        grad_new = grad_f(x_new)
+
+        i = (newest + 1) % m
+        np.subtract(x_new, x, out=S[i])
+        np.subtract(grad_new, grad, out=Y[i])
+        sy = np.dot(S[i], Y[i])
+        if sy > 1e-12 * np.dot(Y[i], Y[i]):
+            rho[i] = 1 / sy
+            newest = i
+            stored = min(stored + 1, m)
+        else:
+            # Слот i мог занимать самую старую пару — она потеряна
+            stored = min(stored, m - 1)
+
+        x, x_new = x_new, x
+        fx, grad = f_new, grad_new
+        k += 1
+        converged = np.linalg.norm(grad) <= epsilon
+
+    elapsed = perf_counter() - start
+    return OptimizationResult(
+        x, fx, n=k, n_fn=f.calls, n_d_fn=grad_f.calls, converged=bool(converged),
+        time=elapsed,
+        info={
+            "m": m,
+            "time_per_iteration": elapsed / max(k, 1),
+            "evaluations_per_iteration": f.calls / max(k, 1),
+        },
+    )
+
+# Пошаговый вариант метода L-BFGS (см. lbfgs и Stepper). Состояние: точка x со
+# значением y и градиентом grad, кольцевые буферы S, Y, rho последних пар
+# (приближение гессиана), количество сохранённых пар stored, индекс последней
+# пары newest и параметры метода.
+class LBFGSStepper(Stepper):
+    __slots__ = ()
+
+    def __init__(self, f, grad_f, x0, epsilon=1e-5, m=10, max_iter=1000):
+        if m <= 0:
+            raise ValueError("Параметр m должен быть положительным.")
+        x = np.array(x0, dtype=float)
+        super().__init__(
+            f, grad_f, x=x, epsilon=epsilon, m=m, max_iter=max_iter,
+            S=np.empty((m, x.size)), Y=np.empty((m, x.size)), rho=np.empty(m),
+            stored=0, newest=-1,
+        )
+
+    def _initialize(self, state):
+        state["y"] = self.evaluate(state["x"])
+        state["grad"] = self.derivative(state["x"])
+        self._check(state)
+
+    def _step(self, state):
+        x, fx, grad = state["x"], state["y"], state["grad"]
+        S, Y, rho, m = state["S"], state["Y"], state["rho"], state["m"]
+        stored, newest = state["stored"], state["newest"]
+        alpha = np.empty(m)
+
+        # Двухцикловая рекурсия: q = -H_k grad
+        q = grad.copy()
+        for j in range(stored):
+            i = (newest - j) % m
+            alpha[i] = rho[i] * np.dot(S[i], q)
+            q -= alpha[i] * Y[i]
+        if stored:
+            q *= np.dot(S[newest], Y[newest]) / np.dot(Y[newest], Y[newest])
+        else:
+            q /= max(np.linalg.norm(grad), 1.0)
+        for j in range(stored - 1, -1, -1):
+            i = (newest - j) % m
+            beta = rho[i] * np.dot(Y[i], q)
+            q += (alpha[i] - beta) * S[i]
+        q *= -1
+
+        grad_dot_p = np.dot(grad, q)
+        if grad_dot_p >= 0:
+            stored = 0
+            np.negative(grad, out=q)
+            grad_dot_p = -np.dot(grad, grad)
+
+        x_new = np.empty_like(x)
+        _, f_new = backtracking(self.evaluate, x, fx, grad_dot_p, q, x_new)
+        grad_new = self.derivative(x_new)
+
+        i = (newest + 1) % m
+        np.subtract(x_new, x, out=S[i])
+        np.subtract(grad_new, grad, out=Y[i])
+        sy = np.dot(S[i], Y[i])
+        if sy > 1e-12 * np.dot(Y[i], Y[i]):
+            rho[i] = 1 / sy
+            newest = i
+            stored = min(stored + 1, m)
+        else:
+            stored = min(stored, m - 1)
+
+        state.update(x=x_new, y=f_new, grad=grad_new, stored=stored, newest=newest)
+        state["k"] += 1
+        self._check(state)
+
+    def _check(self, state):
+        if np.linalg.norm(state["grad"]) <= state["epsilon"]:
+            state["done"] = state["converged"] = True
+        elif state["k"] >= state["max_iter"]:
+            state["done"] = True
+
+if __name__ == "__main__":
+    # Расширенная функция Розенброка от n переменных (n чётное)
+    def f(x):
+        x1, x2 = x[::2], x[1::2]
+        return np.sum(100 * (x2 - x1**2) ** 2 + (1 - x1) ** 2)
+
+    def grad_f(x):
+        x1, x2 = x[::2], x[1::2]
+        grad = np.empty_like(x)
+        grad[::2] = -400 * x1 * (x2 - x1**2) - 2 * (1 - x1)
+        grad[1::2] = 200 * (x2 - x1**2)
+        return grad
+
+    n = 100000
+    x0 = np.full(n, -1.2)
+    x0[1::2] = 1.0
+
+    for m in (3, 10, 30):
+        res = lbfgs(f, grad_f, x0, epsilon=1e-5, m=m)
+        print(
+            f"m = {m}: итераций {res.n}, f = {res.y:.3e}, время {res.time:.3f} с, "
+            f"на итерацию {res.info['time_per_iteration'] * 1e3:.3f} мс"
+        )
@@ -0,0 +1,223 @@
+import numpy as np
+from ...one_variable.zero_order_methods.brent import brent
+from ..counted_function import CountedFunction
+from ...custom_types import OptimizationResult
+from ...stepper import Stepper
+from time import perf_counter
+
+# Кэшированное разложение матрицы Гессе. Разложение одновременно служит проверкой
+# положительной определённости и используется для решения H d = -grad, а
+# пересчитывается только при изменении матрицы. Плотная матрица раскладывается
+# по Холецкому; для разреженной (scipy.sparse) строится разреженное LU-разложение
+# с симметричными перестановками и диагональным выбором главного элемента,
+# которое для симметричной матрицы совпадает с LDL^T, поэтому H положительно
+# определена тогда и только тогда, когда все элементы диагонали U положительны.
+class HessianFactorization:
+    __slots__ = ("hessian", "factor", "positive_definite", "factorizations")
+
+    def __init__(self):
+        self.hessian = None
+        self.factor = None
+        self.positive_definite = False
+        self.factorizations = 0
+
+    def changed(self, hessian):
+        from scipy import sparse
+
+        if self.hessian is None:
+            return True
+        if hessian is self.hessian:
+            return False
+        if sparse.issparse(hessian) != sparse.issparse(self.hessian):
+            return True
+        if hessian.shape != self.hessian.shape:
+            return True
+        if sparse.issparse(hessian):
+            return (hessian != self.hessian).nnz > 0
+        return not np.array_equal(hessian, self.hessian)
+
+    def update(self, hessian, copy=False):
+        from scipy import sparse
+        from scipy.linalg import cho_factor
+        from scipy.sparse.linalg import splu
+
+        if not self.changed(hessian):
+            return
+        self.hessian = hessian.copy() if copy else hessian
+        self.factorizations += 1
+        self.factor = None
+        self.positive_definite = False
+        try:
+            if sparse.issparse(hessian):
+                lu = splu(
+                    sparse.csc_matrix(hessian, dtype=float),
+                    permc_spec="MMD_AT_PLUS_A",
+                    diag_pivot_thresh=0,
+                    options={"SymmetricMode": True},
+                )
+                if np.array_equal(lu.perm_r, lu.perm_c) and np.all(lu.U.diagonal() > 0):
+                    self.factor, self.positive_definite = lu, True
+            else:
+                self.factor = cho_factor(np.asarray(hessian, dtype=float))
+                self.positive_definite = True
+        except (np.linalg.LinAlgError, RuntimeError):
+            pass
+
+    def solve(self, rhs):
+        from scipy import sparse
+        from scipy.linalg import cho_solve
+
+        if sparse.issparse(self.hessian):
+            return self.factor.solve(rhs)
+        return cho_solve(self.factor, rhs)
+
+# hessian — постоянная матрица Гессе (массив NumPy или разреженная матрица SciPy)
+# или функция hessian(x), возвращающая её в точке x. Для функции матрица
+# вычисляется на каждой итерации, а разложение пересчитывается только если
+# она изменилась. В n_f_2nd возвращается количество вычислений матрицы Гессе,
+# в info['factorizations'] — количество разложений.
+def newton_method(f, grad_f, hessian, x0, epsilon1, epsilon2, M):
+    start = perf_counter()
+    f, grad_f = CountedFunction(f), CountedFunction(grad_f)
+    x = x0
+    k = 0
+
+    factorization = HessianFactorization()
+    n_f_2nd = 0
+    if not callable(hessian):
+        factorization.update(hessian)
+        n_f_2nd = 1
+
+    def result(x, converged):
+        return OptimizationResult(
+            x, f(x), n=k, n_fn=f.calls, n_d_fn=grad_f.calls, n_f_2nd=n_f_2nd,
+            converged=converged, time=perf_counter() - start,
+            info={"factorizations": factorization.factorizations},
+        )
+
+    while True:
+        grad = grad_f(x)
+
+        if np.linalg.norm(grad) < epsilon1:
+            return result(x, True)
+
+        if k >= M:
+            return result(x, False)
+
+        if callable(hessian):
+            factorization.update(hessian(x), copy=True)
+            n_f_2nd += 1
+
+        if factorization.positive_definite:
+            dk = -factorization.solve(grad)
+            tk = 1
+        else:
+            dk = -grad
+            tk = brent(lambda t: f(x - t * grad), 0, 1, 10**-3).x
+
+        x_new = x + tk * dk
+
+        if np.linalg.norm(x_new - x) < epsilon2 and abs(f(x_new) - f(x)) < epsilon2:
+            return result(x_new, True)
+
+        x = x_new
+        k += 1
+
+# Пошаговый вариант метода Ньютона (см. newton_method и Stepper). hessian
+# передаётся в конструктор и в resume вместо второй производной. Состояние: точка
+# x и параметры метода; разложение матрицы Гессе в состояние не входит и после
+# возобновления строится заново.
+class NewtonMethodStepper(Stepper):
+    __slots__ = ("factorization",)
+
+    def __init__(self, f, grad_f, hessian, x0, epsilon1, epsilon2, M):
+        super().__init__(f, grad_f, hessian, x=x0, epsilon1=epsilon1, epsilon2=epsilon2, M=M)
+        if not callable(hessian):
+            self.state["n_f_2nd"] = 1
+
+    def _bind(self, f, grad_f, hessian):
+        super()._bind(f, grad_f, hessian)
+        self.factorization = HessianFactorization()
+        if not callable(hessian):
+            self.factorization.update(hessian)
+
+    def _initialize(self, state):
+        self._check(state)
+
+    def _step(self, state):
+        x, grad = state["x"], state["grad"]
+        if callable(self.f_2nd):
+            self.factorization.update(self.second_derivative(x), copy=True)
+
+        if self.factorization.positive_definite:
+            dk = -self.factorization.solve(grad)
+            tk = 1
+        else:
+            dk = -grad
+            tk = brent(lambda t: self.evaluate(x - t * grad), 0, 1, 10**-3).x
+
+        x_new = x + tk * dk
+        y, y_new = self.evaluate(x), self.evaluate(x_new)
+        if np.linalg.norm(x_new - x) < state["epsilon2"] and abs(y_new - y) < state["epsilon2"]:
+            state["x"], state["y"] = x_new, y_new
+            state["done"] = state["converged"] = True
+            return
+
+        state["x"] = x_new
+        state["k"] += 1
+        self._check(state)
+
+    def _check(self, state):
+        state["grad"] = grad = self.derivative(state["x"])
+        if np.linalg.norm(grad) < state["epsilon1"]:
+            state["done"] = state["converged"] = True
+        elif state["k"] >= state["M"]:
+            state["done"] = True
+        if state["done"]:
+            state["y"] = self.evaluate(state["x"])
+
+    def result(self):
+        res = super().result()
+        res.info["factorizations"] = self.factorization.factorizations
+        return res
+
+if __name__ == "__main__":
+    from scipy import sparse
+
+    def f(x):
+        return (x[0] - 2 * x[1]) ** 2 + (x[1] - 9) ** 2
+
+    def grad_f(x):
+        grad = np.zeros_like(x)
+        grad[0] = 2 * (x[0] - 2 * x[1])
+        grad[1] = -4 * (x[0] - 2 * x[1]) + 2 * (x[1] - 9)
+        return grad
+
+    H = np.array([
+        [2, -4],
+        [-4, 10]
+    ])
+
+    x0 = np.array([-1000.0, -1000.0])
+    epsilon1 = 0.15
+    epsilon2 = 0.15
+    M = 1000
+
+    res = newton_method(f, grad_f, H, x0, epsilon1, epsilon2, M)
+
+    print("Точка минимума:", res.x)
+    print("Значение функции в точке минимума:", res.y)
+    print("Количество итераций:", res.n)
+
+    # Разреженная квадратичная задача: f(x) = 1/2 x^T A x - b^T x
+    # с трёхдиагональной матрицей A размера n x n
+    n = 5000
+    A = sparse.diags(
+        [-np.ones(n - 1), 4 * np.ones(n), -np.ones(n - 1)], [-1, 0, 1], format="csc"
+    )
+    b = np.ones(n)
+    res = newton_method(
+        lambda x: 0.5 * x @ (A @ x) - b @ x, lambda x: A @ x - b, A,
+        np.zeros(n), 1e-8, 1e-8, 10,
+    )
+    print("Разреженная задача: итераций", res.n, "время", res.time)
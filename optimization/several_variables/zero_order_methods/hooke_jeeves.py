@@ -0,0 +1,135 @@
+import numpy as np
+from ...custom_types import OptimizationResult
+from ...stepper import Stepper
+from time import perf_counter
+
+def objective_function(x):
+    return (x[0] - 2 * x[1]) ** 2 + (x[1] - 9) ** 2
+
+# Пробные точки x - h * e_i и x + h * e_i для всех координат одним массивом (2n, n)
+def probe_points(x, h):
+    n = len(x)
+    probes = np.repeat(np.asarray(x, dtype=float)[None, :], 2 * n, axis=0)
+    idx = np.arange(n)
+    probes[2 * idx, idx] -= h
+    probes[2 * idx + 1, idx] += h
+    return probes
+
+# Этап 1: Исследующий поиск с одинаковыми шагами для всех координат.
+# Все 2n пробных точек вычисляются одним пакетом. При vectorized = True
+# функция вызывается один раз для всего массива и получает его транспонированным
+# (n, 2n), так что fn, записанная через координаты x[0], x[1], ..., работает без
+# изменений и возвращает 2n значений. При заданном executor (например,
+# ThreadPoolExecutor) пробные точки вычисляются параллельно через executor.map.
+# fx — уже известное значение fn(x); если оно не задано, x вычисляется вместе
+# с пробными точками. Возвращает лучшую точку и значение функции в ней.
+def exploratory_search(x, h, fn=objective_function, fx=None, vectorized=False, executor=None):
+    probes = probe_points(x, h)
+    if fx is None:
+        probes = np.vstack((x, probes))
+
+    if vectorized:
+        values = np.asarray(fn(probes.T), dtype=float)
+    elif executor is not None:
+        values = np.fromiter(executor.map(fn, probes), dtype=float, count=len(probes))
+    else:
+        values = np.fromiter(map(fn, probes), dtype=float, count=len(probes))
+
+    if fx is None:
+        fx, values, probes = values[0], values[1:], probes[1:]
+    i = int(np.argmin(values))
+    if values[i] < fx:
+        return probes[i], values[i]
+    return np.copy(x), fx
+
+# Этап 2: Поиск по образцу
+def pattern_search(x1, x2, lambda_val=2):
+    return x1 + lambda_val * (x2 - x1)
+
+# Основная функция алгоритма Хука-Дживса.
+# callback(x, h) вызывается после каждого исследующего поиска; если он вернул True,
+# поиск прекращается досрочно (converged=False, info['stopped']=True).
+# vectorized и executor передаются в exploratory_search.
+def hooke_jeeves(
+    x0, h0, epsilon=0.001, lambda_val=2, h_decrease_factor=1.1,
+    fn=objective_function, callback=None, vectorized=False, executor=None,
+):
+    start = perf_counter()
+    explore = lambda x, h, fx=None: exploratory_search(x, h, fn, fx, vectorized, executor)
+    x1 = np.array(x0, dtype=float)
+    n = len(x1)
+    h = h0
+    k = 0
+    # Значение в базовой точке x1 известно из предыдущей итерации,
+    # поэтому исследующий поиск из неё не вычисляет его повторно.
+    y1 = fn(x1)
+    n_fn = 1
+    while True:
+        k += 1
+        x2, y2 = explore(x1, h, y1)
+        n_fn += 2 * n
+        if np.linalg.norm(x2 - x1) < epsilon:
+            return OptimizationResult(
+                x2, y2, n=k, n_fn=n_fn, time=perf_counter() - start
+            )
+        if callback is not None and callback(x2, h):
+            return OptimizationResult(
+                x2, y2, n=k, n_fn=n_fn, converged=False,
+                time=perf_counter() - start, info={"stopped": True},
+            )
+
+        x3 = pattern_search(x1, x2, lambda_val)
+        x4, _ = explore(x3, h)
+        n_fn += 2 * n + 1
+
+        if np.linalg.norm(x4 - x3) > epsilon:
+            x1, y1 = x2, y2
+        else:
+            h = h / h_decrease_factor
+
+# Пошаговый вариант метода Хука-Дживса (см. Stepper): одна итерация — исследующий
+# поиск из базовой точки и поиск по образцу. Состояние: базовая точка x со
+# значением y, шаг h и параметры метода.
+class HookeJeevesStepper(Stepper):
+    __slots__ = ()
+
+    def __init__(
+        self, x0, h0, epsilon=0.001, lambda_val=2, h_decrease_factor=1.1,
+        fn=objective_function, vectorized=False,
+    ):
+        super().__init__(
+            fn, x=np.array(x0, dtype=float), h=h0, epsilon=epsilon, lambda_val=lambda_val,
+            h_decrease_factor=h_decrease_factor, vectorized=vectorized,
+        )
+
+    def _initialize(self, state):
+        state["y"] = self.evaluate(state["x"])
+
+    def _step(self, state):
+        state["k"] += 1
+        x1, y1, h = state["x"], state["y"], state["h"]
+        n = len(x1)
+        x2, y2 = exploratory_search(x1, h, self.fn, y1, state["vectorized"])
+        state["n_fn"] += 2 * n
+        if np.linalg.norm(x2 - x1) < state["epsilon"]:
+            state["x"], state["y"] = x2, y2
+            state["done"] = state["converged"] = True
+            return
+
+        x3 = pattern_search(x1, x2, state["lambda_val"])
+        x4, _ = exploratory_search(x3, h, self.fn, None, state["vectorized"])
+        state["n_fn"] += 2 * n + 1
+
+        if np.linalg.norm(x4 - x3) > state["epsilon"]:
+            state["x"], state["y"] = x2, y2
+        else:
+            state["h"] = h / state["h_decrease_factor"]
+
+if __name__ == "__main__":
+    x0 = np.array([-3, -12.3])
+    h0 = 3
+
+    res = hooke_jeeves(x0, h0)
+
+    print(f"Минимум найден в точке: x = {res.x[0]}, y = {res.x[1]}")
+    print(f"Значение функции в этой точке: {res.y}")
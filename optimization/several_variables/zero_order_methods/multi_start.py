@@ -0,0 +1,182 @@
+import numpy as np
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import os
+from ...custom_types import OptimizationResult
+from .hooke_jeeves import hooke_jeeves
+from time import perf_counter
+
+
+def random_starts(bounds, n_starts, rng):
+    """
+    Равномерно случайные начальные точки в прямоугольнике bounds = [(low, high), ...].
+    """
+    low, high = np.asarray(bounds, dtype=float).T
+    return rng.uniform(low, high, size=(n_starts, low.size))
+
+
+def latin_hypercube_starts(bounds, n_starts, rng):
+    """
+    Начальные точки по схеме латинского гиперкуба: по каждой координате
+    в каждый из n_starts равных слоёв попадает ровно одна точка.
+    """
+    low, high = np.asarray(bounds, dtype=float).T
+    u = (rng.random((n_starts, low.size)) + np.arange(n_starts)[:, None]) / n_starts
+    for j in range(low.size):
+        u[:, j] = rng.permutation(u[:, j])
+    return low + u * (high - low)
+
+
+class _NearKnownMinimum:
+    # Останавливает поиск, как только он попадает в окрестность уже найденного
+    # минимума. Объект передаётся в процесс-исполнитель, поэтому он сериализуемый.
+    def __init__(self, minima, radius):
+        self.minima = np.asarray(minima, dtype=float)
+        self.radius = radius
+
+    def __call__(self, x, h):
+        return bool(np.any(np.linalg.norm(self.minima - x, axis=1) < self.radius))
+
+
+def _run_start(fn, x0, h0, epsilon, known, radius, kwargs):
+    callback = _NearKnownMinimum(known, radius) if len(known) else None
+    return hooke_jeeves(x0, h0, epsilon, fn=fn, callback=callback, **kwargs)
+
+
+def multi_start_hooke_jeeves(
+    fn,
+    bounds=None,
+    starts=None,
+    n_starts=16,
+    method="lhs",
+    h0=1.0,
+    epsilon=0.001,
+    radius=None,
+    max_workers=None,
+    executor=None,
+    seed=None,
+    **kwargs,
+):
+    """
+    Ищет несколько локальных минимумов методом Хука-Дживса из множества
+    начальных точек, распределяя запуски по пулу процессов.
+
+    Запуски отправляются в пул по мере освобождения исполнителей, и каждый новый
+    запуск получает список уже найденных минимумов: если траектория попадает
+    в окрестность radius одного из них, запуск прекращается досрочно. Начальные
+    точки, которые сами лежат в такой окрестности, не запускаются вовсе.
+
+    Параметры:\n
+        fn (Callable): Целевая функция; для пула процессов должна быть сериализуемой
+                       (например, определена на уровне модуля).\n
+        bounds (Sequence[tuple]): Границы [(low, high), ...] для генерации начальных точек.\n
+        starts (np.ndarray | None): Начальные точки (m, n), если они задаются вручную.\n
+        n_starts (int): Количество генерируемых начальных точек.\n
+        method (str): Способ генерации: "lhs" (латинский гиперкуб) или "random".\n
+        h0 (Number): Начальный шаг метода Хука-Дживса.\n
+        epsilon (Number): Точность метода Хука-Дживса.\n
+        radius (Number | None): Радиус, в пределах которого минимумы считаются
+                                совпадающими (по умолчанию h0).\n
+        max_workers (int | None): Количество процессов и одновременных запусков
+                                  (по умолчанию — число ядер), в том числе для executor.\n
+        executor (Executor | None): Готовый пул исполнителей вместо ProcessPoolExecutor.\n
+        seed (int | None): Зерно генератора начальных точек.\n
+        **kwargs: Дополнительные параметры hooke_jeeves (lambda_val, h_decrease_factor).\n
+
+    Возвращает:\n
+        OptimizationResult: Лучший найденный минимум.
+                    Поле info['minima'] — различные минимумы (OptimizationResult),
+                    упорядоченные по возрастанию значения функции.
+                    Поле info['cancelled'] — количество запусков, прерванных
+                    или пропущенных из-за попадания в известный минимум.
+                    Поле n — количество выполненных запусков, n_fn — суммарное
+                    количество вызовов функции.
+
+    Исключения:\n
+        ValueError: Если не заданы ни bounds, ни starts, method неизвестен, нет ни одной
+                    начальной точки или max_workers <= 0.
+    """
+    start = perf_counter()
+    if max_workers is not None and max_workers <= 0:
+        raise ValueError("Параметр max_workers должен быть положительным.")
+    if starts is None:
+        if bounds is None:
+            raise ValueError("Необходимо задать bounds или starts.")
+        generators = {"lhs": latin_hypercube_starts, "random": random_starts}
+        if method not in generators:
+            raise ValueError(f"Неизвестный способ генерации начальных точек: {method}.")
+        starts = generators[method](bounds, n_starts, np.random.default_rng(seed))
+    starts = np.atleast_2d(np.asarray(starts, dtype=float))
+    if starts.size == 0:
+        raise ValueError("Не задано ни одной начальной точки.")
+    radius = h0 if radius is None else radius
+
+    minima = []
+    cancelled = 0
+    runs = 0
+    n_fn = 0
+    width = max_workers or os.cpu_count() or 1
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=width)
+
+    def known():
+        return [m.x for m in minima]
+
+    try:
+        pending = set()
+        queue = iter(starts)
+        while True:
+            # Держим в работе не больше width запусков, чтобы новые запуски
+            # видели минимумы, найденные предыдущими.
+            for x0 in queue:
+                near = known()
+                if near and _NearKnownMinimum(near, radius)(x0, h0):
+                    cancelled += 1
+                    continue
+                pending.add(
+                    executor.submit(_run_start, fn, x0, h0, epsilon, near, radius, kwargs)
+                )
+                if len(pending) >= width:
+                    break
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                res = future.result()
+                runs += 1
+                n_fn += res.n_fn
+                if res.info.get("stopped"):
+                    cancelled += 1
+                    continue
+                for i, m in enumerate(minima):
+                    if np.linalg.norm(m.x - res.x) < radius:
+                        if res.y < m.y:
+                            minima[i] = res
+                        break
+                else:
+                    minima.append(res)
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+    minima.sort(key=lambda m: m.y)
+    best = minima[0]
+    return OptimizationResult(
+        best.x, best.y, n=runs, n_fn=n_fn, time=perf_counter() - start,
+        info={"minima": minima, "cancelled": cancelled},
+    )
+
+
+def himmelblau(x):
+    return (x[0] ** 2 + x[1] - 11) ** 2 + (x[0] + x[1] ** 2 - 7) ** 2
+
+
+if __name__ == "__main__":
+    res = multi_start_hooke_jeeves(
+        himmelblau, bounds=[(-5, 5), (-5, 5)], n_starts=32, h0=0.05, epsilon=1e-4,
+        radius=0.5, seed=0,
+    )
+    print(f"Запусков: {res.n}, прервано: {res.info['cancelled']}, вызовов: {res.n_fn}")
+    for m in res.info["minima"]:
+        print(f"x = {m.x}, f(x) = {m.y}")
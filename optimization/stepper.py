@@ -0,0 +1,248 @@
+from .custom_types import NumericalMethod, OptimizationResult
+from .cached_function import Budget, BudgetExhausted, CachedFunction
+from collections import deque
+from copy import deepcopy
+from time import perf_counter
+from typing import Any, Dict, Iterator, Sequence, Tuple
+
+State = Dict[str, Any]
+
+
+class Stepper:
+    """
+    Пошаговый вариант метода оптимизации.
+
+    Всё, что нужно для продолжения поиска, хранится в словаре state из чисел,
+    списков, кортежей и массивов NumPy: интервал, значения в пробных точках,
+    шаг, приближение гессиана и т. п. Поэтому состояние можно сохранить
+    (например, с помощью pickle) и позже продолжить поиск ровно с того же места:
+    Stepper.resume(state, fn). Целевая функция и производные в состояние не
+    входят и передаются заново.
+
+    Конструктор подкласса принимает те же параметры, что и функция метода,
+    и выполняет начальные вычисления. step() выполняет одну итерацию и возвращает
+    состояние; итерация по объекту выдаёт состояние после каждой итерации до
+    завершения метода. step() и итерация возвращают сам словарь state, а не копию:
+    чтобы сохранить состояние, используется snapshot().
+
+    Общие поля состояния:\n
+        method (str): Имя класса, которому принадлежит состояние.\n
+        k (int): Количество выполненных итераций.\n
+        n_fn, n_d_fn, n_f_2nd (int): Количество вычислений функции и производных.\n
+        x, y: Текущее приближение и значение функции в нём (y может быть None).\n
+        a, b: Текущий интервал неопределённости (None, если его нет).\n
+        time (float): Суммарное время работы в секундах.\n
+        done (bool): Завершён ли поиск.\n
+        converged (bool): Достигнута ли заданная точность.\n
+
+    Примеры:
+    >>> class Halving(Stepper):
+    ...     def __init__(self, fn, x):
+    ...         super().__init__(fn, x=x)
+    ...     def _step(self, state):
+    ...         state["k"] += 1
+    ...         state["x"] /= 2
+    ...         state["y"] = self.evaluate(state["x"])
+    ...         state["done"] = state["converged"] = state["x"] < 1
+    >>> stepper = Halving(abs, 5.0)
+    >>> saved = stepper.snapshot()
+    >>> print([state["x"] for state in stepper])
+    [2.5, 1.25, 0.625]
+    >>> print(Halving.resume(saved, abs).run().x)
+    0.625
+    """
+
+    __slots__ = ("fn", "d_fn", "f_2nd", "state")
+
+    def __init__(
+        self,
+        fn: NumericalMethod,
+        d_fn: NumericalMethod | None = None,
+        f_2nd: NumericalMethod | None = None,
+        **fields: Any,
+    ) -> None:
+        start = perf_counter()
+        self._bind(fn, d_fn, f_2nd)
+        self.state = {
+            "method": type(self).__name__,
+            "k": 0,
+            "n_fn": 0,
+            "n_d_fn": 0,
+            "n_f_2nd": 0,
+            "x": None,
+            "y": None,
+            "a": None,
+            "b": None,
+            "time": 0.0,
+            "done": False,
+            "converged": False,
+            **fields,
+        }
+        self._initialize(self.state)
+        self.state["time"] += perf_counter() - start
+
+    @classmethod
+    def resume(
+        cls,
+        state: State,
+        fn: NumericalMethod,
+        d_fn: NumericalMethod | None = None,
+        f_2nd: NumericalMethod | None = None,
+    ) -> "Stepper":
+        """
+        Восстанавливает метод из сохранённого состояния.
+
+        Параметры:\n
+            state (State): Состояние, полученное из snapshot() или step().\n
+            fn (NumericalMethod): Целевая функция.\n
+            d_fn, f_2nd (NumericalMethod | None): Производные, если метод их использует.\n
+
+        Возвращает:\n
+            Stepper: Метод, продолжающий поиск с сохранённого места.
+
+        Исключения:\n
+            ValueError: Если состояние принадлежит другому методу.
+        """
+        if state.get("method") != cls.__name__:
+            raise ValueError(
+                f"Состояние принадлежит методу {state.get('method')}, а не {cls.__name__}."
+            )
+        stepper = cls.__new__(cls)
+        stepper._bind(fn, d_fn, f_2nd)
+        stepper.state = deepcopy(state)
+        return stepper
+
+    def _bind(
+        self,
+        fn: NumericalMethod,
+        d_fn: NumericalMethod | None,
+        f_2nd: NumericalMethod | None,
+    ) -> None:
+        self.fn = fn
+        self.d_fn = d_fn
+        self.f_2nd = f_2nd
+
+    def _initialize(self, state: State) -> None:
+        # Начальные вычисления до первой итерации
+        pass
+
+    def _step(self, state: State) -> None:
+        raise NotImplementedError
+
+    def evaluate(self, x: Any) -> Any:
+        self.state["n_fn"] += 1
+        return self.fn(x)
+
+    def derivative(self, x: Any) -> Any:
+        self.state["n_d_fn"] += 1
+        return self.d_fn(x)
+
+    def second_derivative(self, x: Any) -> Any:
+        self.state["n_f_2nd"] += 1
+        return self.f_2nd(x)
+
+    @property
+    def done(self) -> bool:
+        return self.state["done"]
+
+    def step(self) -> State:
+        """
+        Выполняет одну итерацию (если поиск не завершён) и возвращает состояние.
+        """
+        state = self.state
+        if not state["done"]:
+            start = perf_counter()
+            self._step(state)
+            state["time"] += perf_counter() - start
+        return state
+
+    def __iter__(self) -> Iterator[State]:
+        while not self.state["done"]:
+            yield self.step()
+
+    def snapshot(self) -> State:
+        """
+        Возвращает независимую копию состояния для сохранения.
+        """
+        return deepcopy(self.state)
+
+    def run(self, max_steps: int | None = None) -> OptimizationResult:
+        """
+        Выполняет не более max_steps итераций (по умолчанию — до завершения)
+        и возвращает результат.
+        """
+        for i, _ in enumerate(self, 1):
+            if max_steps is not None and i >= max_steps:
+                break
+        return self.result()
+
+    def result(self) -> OptimizationResult:
+        """
+        Возвращает результат по текущему состоянию; до завершения поиска —
+        с converged=False.
+        """
+        state = self.state
+        return OptimizationResult(
+            state["x"], state["y"], n=state["k"], n_fn=state["n_fn"],
+            n_d_fn=state["n_d_fn"], n_f_2nd=state["n_f_2nd"], a=state["a"], b=state["b"],
+            converged=state["converged"], time=state["time"],
+        )
+
+    @classmethod
+    def run_budgeted(
+        cls, fn: NumericalMethod, budget: Budget, *args: Any, **kwargs: Any
+    ) -> OptimizationResult:
+        """
+        Выполняет метод до завершения с лимитами budget. Функции интервальных
+        методов используют его, когда заданы max_evals или deadline, поэтому их
+        итерации и итерации Stepper выполняет один и тот же код.
+
+        Параметры:\n
+            fn (NumericalMethod): Целевая функция.\n
+            budget (Budget): Лимит вычислений и времени.\n
+            args, kwargs: Остальные параметры конструктора.\n
+
+        Возвращает:\n
+            OptimizationResult: Результат метода. Поле n_fn — количество фактических
+                                вычислений fn. Если лимит исчерпан, возвращается лучшая
+                                из вычисленных точек и текущий интервал с converged=False
+                                и status=BUDGET_EXHAUSTED.
+        """
+        start = perf_counter()
+        fn = CachedFunction(fn, budget=budget, observe=True)
+        # Объект создаётся отдельно от инициализации, чтобы состояние было
+        # доступно, даже если лимит исчерпан в начальных вычислениях
+        stepper = cls.__new__(cls)
+        try:
+            stepper.__init__(fn, *args, **kwargs)
+            res = stepper.run()
+        except BudgetExhausted:
+            state = stepper.state
+            x = state["x"] if state["x"] is not None else (state["a"] + state["b"]) / 2
+            return budget.result(
+                x, n=state["k"], n_fn=fn.evaluations, a=state["a"], b=state["b"],
+                time=perf_counter() - start,
+            )
+        res.n_fn = fn.evaluations
+        res.time = perf_counter() - start
+        return res
+
+
+def interleave(steppers: Sequence[Stepper]) -> Iterator[Tuple[int, State]]:
+    """
+    Выполняет несколько методов поочерёдно по одной итерации, пока все
+    не завершатся, и выдаёт номер метода и его состояние после каждой итерации.
+
+    Параметры:\n
+        steppers (Sequence[Stepper]): Методы.\n
+
+    Возвращает:\n
+        Iterator[Tuple[int, State]]: Пары (номер метода, состояние).
+    """
+    queue = deque(i for i, stepper in enumerate(steppers) if not stepper.done)
+    while queue:
+        i = queue.popleft()
+        state = steppers[i].step()
+        yield i, state
+        if not state["done"]:
+            queue.append(i)